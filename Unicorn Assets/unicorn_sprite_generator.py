@@ -1,10 +1,21 @@
 """
 Unicorn Pixel Art Sprite Generator
 Generates a 32x32 pixel unicorn character with full platformer animations
+
+Usage:
+    python "Unicorn Assets/unicorn_sprite_generator.py"
+    python "Unicorn Assets/unicorn_sprite_generator.py" --timings   # see profiling.py
 """
 
 from PIL import Image, ImageDraw
+import argparse
 import os
+import sys
+
+# The shared tool modules live in the repository root, one level up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import profiling
+from profiling import timings, write_png
 
 # Color palette - Rainbow unicorn theme
 COLORS = {
@@ -577,16 +588,23 @@ def create_sprite_sheet(frames_dict, output_path):
     row = 0
     animation_info = []
 
-    for anim_name, frames in frames_dict.items():
-        for col, frame in enumerate(frames):
-            sheet.paste(frame, (col * 32, row * 32))
-        animation_info.append(f"{anim_name}: row {row}, {len(frames)} frames")
-        row += 1
+    with timings.stage('compose'):
+        for anim_name, frames in frames_dict.items():
+            for col, frame in enumerate(frames):
+                sheet.paste(frame, (col * 32, row * 32))
+            animation_info.append(f"{anim_name}: row {row}, {len(frames)} frames")
+            row += 1
 
-    sheet.save(output_path)
+    write_png(sheet, output_path)
     return animation_info
 
-def main():
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Draw the unicorn sprite sheet, projectile sheet and strips")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    profiling.run(args, generate_all)
+
+def generate_all():
     """Generate all sprites and create sprite sheet"""
     print("Generating Unicorn Sprite Sheet...")
     print("=" * 40)
@@ -595,16 +613,20 @@ def main():
     output_dir = os.path.dirname(os.path.abspath(__file__))
 
     # Generate all animations
-    animations = {
-        'idle': create_idle_frames(),
-        'run': create_run_frames(),
-        'jump': create_jump_frames(),
-        'fall': create_fall_frames(),
-        'attack': create_attack_frames(),
-        'shoot': create_shoot_frames(),
-        'hit': create_hit_frames(),
-        'death': create_death_frames(),
+    creators = {
+        'idle': create_idle_frames,
+        'run': create_run_frames,
+        'jump': create_jump_frames,
+        'fall': create_fall_frames,
+        'attack': create_attack_frames,
+        'shoot': create_shoot_frames,
+        'hit': create_hit_frames,
+        'death': create_death_frames,
     }
+    animations = {}
+    for anim_name, create_frames in creators.items():
+        with timings.entity(anim_name), timings.stage('rasterize'):
+            animations[anim_name] = create_frames()
 
     # Create main sprite sheet
     sheet_path = os.path.join(output_dir, 'unicorn_spritesheet.png')
@@ -616,13 +638,16 @@ def main():
         print(f"  {line}")
 
     # Create projectile sprite sheet separately
-    projectile_frames = create_projectile_frames()
-    projectile_sheet = Image.new('RGBA', (64, 16), COLORS['transparent'])
-    for i, frame in enumerate(projectile_frames):
-        projectile_sheet.paste(frame, (i * 16, 0))
-
-    projectile_path = os.path.join(output_dir, 'unicorn_projectile.png')
-    projectile_sheet.save(projectile_path)
+    with timings.entity('projectile'):
+        with timings.stage('rasterize'):
+            projectile_frames = create_projectile_frames()
+        with timings.stage('compose'):
+            projectile_sheet = Image.new('RGBA', (64, 16), COLORS['transparent'])
+            for i, frame in enumerate(projectile_frames):
+                projectile_sheet.paste(frame, (i * 16, 0))
+
+        projectile_path = os.path.join(output_dir, 'unicorn_projectile.png')
+        write_png(projectile_sheet, projectile_path)
     print(f"\nProjectile sprite sheet saved: {projectile_path}")
     print("  16x16 pixels, 4 frames")
 
@@ -631,11 +656,13 @@ def main():
     os.makedirs(strips_dir, exist_ok=True)
 
     for anim_name, frames in animations.items():
-        strip = Image.new('RGBA', (len(frames) * 32, 32), COLORS['transparent'])
-        for i, frame in enumerate(frames):
-            strip.paste(frame, (i * 32, 0))
-        strip_path = os.path.join(strips_dir, f'unicorn_{anim_name}.png')
-        strip.save(strip_path)
+        with timings.entity(anim_name):
+            with timings.stage('compose'):
+                strip = Image.new('RGBA', (len(frames) * 32, 32), COLORS['transparent'])
+                for i, frame in enumerate(frames):
+                    strip.paste(frame, (i * 32, 0))
+            strip_path = os.path.join(strips_dir, f'unicorn_{anim_name}.png')
+            write_png(strip, strip_path)
 
     print(f"\nIndividual animation strips saved to: {strips_dir}")
 
@@ -0,0 +1,139 @@
+"""
+Frame-Time Telemetry Analyzer
+Summarizes the frame samples run_game.py collects from the game into
+p50/p95/p99 frame times per level and per game state, then looks at the
+spike frames (slower than the threshold) to see which counts - enemies,
+projectiles, particles - rise with them.
+
+Usage:
+    python analyze_telemetry.py                       # build/telemetry/frames.jsonl
+    python analyze_telemetry.py --spike-ms 25         # custom spike threshold
+    python analyze_telemetry.py --level stress        # one level only
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+TELEMETRY_PATH = os.path.join('build', 'telemetry', 'frames.jsonl')
+SPIKE_MS = 1000 / 30    # anything slower than 30 fps
+PERCENTILES = [50, 95, 99]
+COUNT_FIELDS = ['enemies', 'projectiles', 'particles']
+
+# ============== LOADING ==============
+
+def load_samples(path):
+    """Return (columns dict of numpy arrays, skipped line count)."""
+    rows = []
+    skipped = 0
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                sample = json.loads(line)
+                rows.append((
+                    float(sample['frame']), float(sample.get('work', 0)),
+                    str(sample.get('state')), str(sample.get('level')),
+                    *(int(sample.get(field, 0)) for field in COUNT_FIELDS),
+                ))
+            except (ValueError, KeyError, TypeError):
+                skipped += 1
+    if not rows:
+        return None, skipped
+
+    columns = list(zip(*rows))
+    data = {
+        'frame': np.array(columns[0]),
+        'work': np.array(columns[1]),
+        'state': np.array(columns[2]),
+        'level': np.array(columns[3]),
+    }
+    for i, field in enumerate(COUNT_FIELDS):
+        data[field] = np.array(columns[4 + i])
+    return data, skipped
+
+# ============== REPORTS ==============
+
+def percentile_table(data, key):
+    """[(group, samples, p50, p95, p99, max)] for the frame times grouped by a column."""
+    rows = []
+    groups, inverse = np.unique(data[key], return_inverse=True)
+    for i, group in enumerate(groups):
+        frames = data['frame'][inverse == i]
+        rows.append((group, len(frames), *np.percentile(frames, PERCENTILES), frames.max()))
+    return sorted(rows, key=lambda row: -row[4])
+
+
+def print_table(title, rows):
+    print(f"\n{title}")
+    print(f"  {'':<16}{'frames':>8}{'p50':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for group, count, *times in rows:
+        print(f"  {group:<16}{count:>8}" + ''.join(f"{t:>9.2f}" for t in times))
+
+
+def spike_report(data, spike_ms):
+    """Per count field: mean in normal frames, mean in spikes, correlation with frame time."""
+    spikes = data['frame'] > spike_ms
+    rows = []
+    for field in COUNT_FIELDS:
+        counts = data[field].astype(np.float64)
+        if counts.std() == 0 or data['frame'].std() == 0:
+            corr = 0.0
+        else:
+            corr = float(np.corrcoef(counts, data['frame'])[0, 1])
+        normal = counts[~spikes].mean() if (~spikes).any() else 0.0
+        spiked = counts[spikes].mean() if spikes.any() else 0.0
+        rows.append((field, normal, spiked, corr))
+    return int(spikes.sum()), rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Frame-time percentiles and spike correlation from game telemetry")
+    parser.add_argument('path', nargs='?', default=TELEMETRY_PATH, help="JSON-lines telemetry file")
+    parser.add_argument('--spike-ms', type=float, default=SPIKE_MS, help="frame time counted as a spike")
+    parser.add_argument('--level', help="only analyze samples from this level")
+    parser.add_argument('--include-idle', action='store_true',
+                        help="keep start/charselect/loading frames (dropped by default)")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists(args.path):
+        print(f"No telemetry at {args.path} - play a few levels through run_game.py first.")
+        return 1
+
+    data, skipped = load_samples(args.path)
+    if data is None:
+        print(f"No usable samples in {args.path}")
+        return 1
+
+    keep = np.ones(len(data['frame']), dtype=bool)
+    if not args.include_idle:
+        keep &= ~np.isin(data['state'], ['start', 'charselect', 'loading'])
+    if args.level:
+        keep &= data['level'] == args.level
+    data = {key: values[keep] for key, values in data.items()}
+    if len(data['frame']) == 0:
+        print("No samples match the filters.")
+        return 1
+
+    print(f"Analyzing {len(data['frame'])} frames from {args.path}"
+          + (f" ({skipped} malformed lines skipped)" if skipped else ""))
+    print(f"  frame time (ms): p50 {np.percentile(data['frame'], 50):.2f}, "
+          f"p95 {np.percentile(data['frame'], 95):.2f}, p99 {np.percentile(data['frame'], 99):.2f}; "
+          f"update+draw p99 {np.percentile(data['work'], 99):.2f}")
+
+    print_table("Frame time by level (ms)", percentile_table(data, 'level'))
+    print_table("Frame time by state (ms)", percentile_table(data, 'state'))
+
+    spike_count, rows = spike_report(data, args.spike_ms)
+    share = 100 * spike_count / len(data['frame'])
+    print(f"\nSpikes over {args.spike_ms:.1f} ms: {spike_count} ({share:.1f}%)")
+    print(f"  {'':<16}{'normal':>9}{'spikes':>9}{'corr':>8}")
+    for field, normal, spiked, corr in rows:
+        print(f"  {field:<16}{normal:>9.1f}{spiked:>9.1f}{corr:>8.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+"""
+Asset Manifest
+Shared helpers for build/manifest.json, the index of every baked artifact
+(sound effects, sprite sheets, atlases...) that the runtime loaders read.
+Each offline tool owns one top-level section and replaces it on every run.
+Paths inside the manifest are relative to the build directory. Also holds
+save_png, which every generator and baking tool writes its PNGs with.
+"""
+
+import contextlib
+import json
+import os
+import time
+
+BUILD_DIR = 'build'
+MANIFEST_PATH = os.path.join(BUILD_DIR, 'manifest.json')
+LOCK_TIMEOUT = 10.0     # seconds before a leftover lock file is broken
+PNG_COMPRESS_LEVEL = 6  # zlib level, pinned rather than left to Pillow's default
+
+
+def load_manifest(path=MANIFEST_PATH):
+    """Return the manifest dict, or an empty one if nothing has been built yet."""
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_png(image, fp):
+    """Save a PIL image as PNG with fixed encoder settings and no metadata.
+
+    No text, time, ICC or resolution chunks are written, including ones
+    carried over from a source image, so the file bytes depend only on the
+    pixels and the encoder settings. That keeps the build cache keys of
+    downstream stages stable across machines (see build_cache.py).
+    """
+    image.save(fp, 'PNG', compress_level=PNG_COMPRESS_LEVEL, optimize=False, icc_profile=None)
+
+
+@contextlib.contextmanager
+def manifest_lock(path=MANIFEST_PATH):
+    """Hold an exclusive lock file next to the manifest.
+
+    build.py runs the tools in parallel; without the lock two of them
+    finishing together could each write back a manifest missing the other's
+    section.
+    """
+    lock_path = path + '.lock'
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    deadline = time.monotonic() + LOCK_TIMEOUT
+    while True:
+        try:
+            fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() > deadline:
+                # Left behind by a tool that was killed mid-write
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(lock_path)
+                deadline = time.monotonic() + LOCK_TIMEOUT
+            time.sleep(0.01)
+    try:
+        yield
+    finally:
+        os.close(fd)
+        os.remove(lock_path)
+
+
+def register_assets(section, entries, path=MANIFEST_PATH):
+    """Replace one section of the manifest and write it back."""
+    with manifest_lock(path):
+        manifest = load_manifest(path)
+        manifest[section] = entries
+        # Write-and-rename so readers never see a half-written file
+        temp_path = path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, sort_keys=True)
+            f.write('\n')
+        os.replace(temp_path, path)
+    return manifest
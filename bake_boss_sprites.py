@@ -0,0 +1,314 @@
+"""
+Boss Sprite Baker
+Renders the ProceduralSprites boss frames from js/procedural-sprites.js
+(minotaur, headless horseman, pyromancer) offline into horizontal PNG strips,
+one per animation, and registers them in the asset manifest so the game can
+load finished bitmaps instead of drawing every frame on a canvas at startup.
+
+Usage:
+    python bake_boss_sprites.py                 # bake every boss
+    python bake_boss_sprites.py minotaur        # bake selected bosses
+"""
+
+import argparse
+import math
+import os
+
+from PIL import Image
+
+from asset_manifest import BUILD_DIR, load_manifest, register_assets, save_png
+from canvas2d import Canvas
+
+OUTPUT_DIR = os.path.join(BUILD_DIR, 'sprites', 'bosses')
+FRAME_SIZE = 64
+FRAME_COUNTS = {'idle': 4, 'walk': 4, 'attack': 4, 'hurt': 2, 'death': 4}
+
+# ============== MINOTAUR ==============
+
+def draw_minotaur_base(ctx, y_off, arm_angle=0):
+    # Body
+    ctx.fill_style = '#6B4226'
+    ctx.fill_rect(16, 16 + y_off, 32, 30)
+    ctx.fill_style = '#8B6E4C'
+    ctx.fill_rect(20, 20 + y_off, 24, 16)
+
+    # Head
+    ctx.fill_style = '#6B4226'
+    ctx.fill_circle(32, 12 + y_off, 11)
+    # Snout
+    ctx.fill_style = '#5A3520'
+    ctx.fill_rect(26, 14 + y_off, 12, 7)
+    # Nostrils
+    ctx.fill_style = '#3A1A08'
+    ctx.fill_rect(28, 17 + y_off, 2, 2)
+    ctx.fill_rect(34, 17 + y_off, 2, 2)
+    # Eyes
+    ctx.fill_style = '#FF2200'
+    ctx.fill_rect(25, 8 + y_off, 4, 4)
+    ctx.fill_rect(35, 8 + y_off, 4, 4)
+    # Horns
+    ctx.fill_style = '#CCCCAA'
+    ctx.fill_polygon([(21, 8 + y_off), (10, -2 + y_off), (24, 6 + y_off)])
+    ctx.fill_polygon([(43, 8 + y_off), (54, -2 + y_off), (40, 6 + y_off)])
+
+    # Arms
+    ctx.fill_style = '#5A3520'
+    ctx.save()
+    ctx.translate(14, 22 + y_off)
+    ctx.rotate(arm_angle)
+    ctx.fill_rect(-4, 0, 6, 18)
+    ctx.restore()
+    ctx.fill_rect(44, 22 + y_off, 6, 18)
+
+    # Legs
+    ctx.fill_style = '#5A3520'
+    ctx.fill_rect(20, 46 + y_off, 10, 14)
+    ctx.fill_rect(34, 46 + y_off, 10, 14)
+    # Hooves
+    ctx.fill_style = '#3A2210'
+    ctx.fill_rect(18, 56 + y_off, 14, 6)
+    ctx.fill_rect(32, 56 + y_off, 14, 6)
+
+
+MINOTAUR_ATTACK_ANGLES = [0, -0.8, -1.6, -0.4]
+
+
+def draw_minotaur(ctx, anim, i):
+    if anim == 'idle':
+        draw_minotaur_base(ctx, -1 if i in (1, 2) else 0)
+    elif anim == 'walk':
+        draw_minotaur_base(ctx, 0)
+        ctx.fill_style = '#5A3520'
+        leg_off = 4 if i % 2 == 0 else -4
+        ctx.fill_rect(20 + leg_off, 46, 10, 16)
+        ctx.fill_rect(34 - leg_off, 46, 10, 14)
+    elif anim == 'attack':
+        angle = MINOTAUR_ATTACK_ANGLES[i]
+        draw_minotaur_base(ctx, 0, angle)
+        # Axe in left hand
+        ctx.fill_style = '#888888'
+        ctx.save()
+        ctx.translate(10, 22)
+        ctx.rotate(angle)
+        ctx.fill_rect(-3, -22, 5, 22)
+        ctx.fill_style = '#AAAAAA'
+        ctx.fill_rect(-8, -28, 14, 10)
+        ctx.restore()
+    elif anim == 'hurt':
+        draw_minotaur_base(ctx, 0)
+        ctx.fill_style = 'rgba(255, 0, 0, 0.4)'
+        ctx.fill_rect(0, 0, FRAME_SIZE, FRAME_SIZE)
+    elif anim == 'death':
+        ctx.save()
+        ctx.global_alpha = 1 - i * 0.22
+        ctx.translate(32, 32)
+        ctx.rotate(i * 0.4)
+        ctx.translate(-32, -32 + i * 8)
+        draw_minotaur_base(ctx, 0)
+        ctx.restore()
+
+# ============== HEADLESS HORSEMAN ==============
+
+def draw_horseman_base(ctx, y_off, head_x=8, head_y=0):
+    # Cape
+    ctx.fill_style = '#1A0820'
+    ctx.fill_polygon([(18, 14 + y_off), (8, 52 + y_off), (56, 52 + y_off), (46, 14 + y_off)])
+
+    # Body/armor
+    ctx.fill_style = '#2A1040'
+    ctx.fill_rect(18, 12 + y_off, 28, 28)
+    ctx.fill_style = '#3A2060'
+    ctx.fill_rect(22, 16 + y_off, 20, 10)
+    # Shoulder pads
+    ctx.fill_style = '#4A3070'
+    ctx.fill_rect(14, 12 + y_off, 10, 10)
+    ctx.fill_rect(40, 12 + y_off, 10, 10)
+
+    # Neck stump
+    ctx.fill_style = '#661133'
+    ctx.fill_rect(28, 6 + y_off, 8, 8)
+
+    # Glowing green head in hand
+    ctx.fill_style = 'rgba(68, 255, 68, 0.25)'
+    ctx.fill_circle(head_x, 32 + y_off + head_y, 12)
+    ctx.fill_style = '#22AA22'
+    ctx.fill_circle(head_x, 32 + y_off + head_y, 7)
+    ctx.fill_style = '#FFFFFF'
+    ctx.fill_rect(head_x - 4, 30 + y_off + head_y, 2, 3)
+    ctx.fill_rect(head_x + 2, 30 + y_off + head_y, 2, 3)
+    # Mouth
+    ctx.fill_style = '#44FF44'
+    ctx.fill_rect(head_x - 2, 35 + y_off + head_y, 5, 1)
+
+    # Legs
+    ctx.fill_style = '#1A0820'
+    ctx.fill_rect(22, 40 + y_off, 8, 16)
+    ctx.fill_rect(34, 40 + y_off, 8, 16)
+    # Boots
+    ctx.fill_style = '#110618'
+    ctx.fill_rect(20, 52 + y_off, 12, 8)
+    ctx.fill_rect(32, 52 + y_off, 12, 8)
+
+
+HORSEMAN_ATTACK_HEAD = [(8, 0), (22, -10), (42, -14), (56, -8)]
+
+
+def draw_horseman(ctx, anim, i):
+    if anim == 'idle':
+        draw_horseman_base(ctx, -1 if i in (1, 2) else 0, 8, math.sin(i * 1.5) * 2)
+    elif anim == 'walk':
+        draw_horseman_base(ctx, 0)
+        ctx.fill_style = '#1A0820'
+        off = 4 if i % 2 == 0 else -4
+        ctx.fill_rect(22 + off, 40, 8, 18)
+        ctx.fill_rect(34 - off, 40, 8, 14)
+    elif anim == 'attack':
+        head_x, head_y = HORSEMAN_ATTACK_HEAD[i]
+        draw_horseman_base(ctx, 0, head_x, head_y)
+    elif anim == 'hurt':
+        draw_horseman_base(ctx, 0)
+        ctx.fill_style = 'rgba(100, 0, 200, 0.4)'
+        ctx.fill_rect(0, 0, FRAME_SIZE, FRAME_SIZE)
+    elif anim == 'death':
+        ctx.save()
+        ctx.global_alpha = 1 - i * 0.22
+        ctx.translate(32, 32)
+        ctx.rotate(i * 0.3)
+        ctx.translate(-32, -32 + i * 6)
+        draw_horseman_base(ctx, 0)
+        # Ghost particles
+        ctx.fill_style = 'rgba(68, 255, 68, 0.5)'
+        for j in range(i * 3):
+            ctx.fill_circle(32 + (j * 17 % 40) - 20, 32 + (j * 13 % 40) - 20, 3)
+        ctx.restore()
+
+# ============== PYROMANCER ==============
+
+def draw_pyromancer_base(ctx, y_off, fire_size=6):
+    # Staff
+    ctx.fill_style = '#664422'
+    ctx.fill_rect(46, 4 + y_off, 4, 50)
+    # Fire on staff
+    ctx.fill_style = 'rgba(255, 100, 0, 0.2)'
+    ctx.fill_circle(48, 4 + y_off, fire_size * 2.5)
+    ctx.fill_style = '#FF6600'
+    ctx.fill_circle(48, 4 + y_off, fire_size)
+    ctx.fill_style = '#FFAA00'
+    ctx.fill_circle(48, 2 + y_off, fire_size * 0.6)
+
+    # Robe
+    ctx.fill_style = '#AA2200'
+    ctx.fill_polygon([(16, 20 + y_off), (10, 58 + y_off), (50, 58 + y_off), (44, 20 + y_off)])
+    ctx.fill_style = '#CC3311'
+    ctx.fill_polygon([(20, 24 + y_off), (16, 52 + y_off), (40, 52 + y_off), (38, 24 + y_off)])
+    # Belt
+    ctx.fill_style = '#661100'
+    ctx.fill_rect(16, 36 + y_off, 28, 4)
+    # Belt buckle
+    ctx.fill_style = '#FFAA00'
+    ctx.fill_rect(28, 35 + y_off, 4, 6)
+
+    # Hood/hat
+    ctx.fill_style = '#881800'
+    ctx.fill_polygon([(30, 0 + y_off), (14, 22 + y_off), (46, 22 + y_off)])
+    # Face shadow
+    ctx.fill_style = '#220800'
+    ctx.fill_circle(30, 16 + y_off, 8)
+    # Glowing eyes
+    ctx.fill_style = '#FF8800'
+    ctx.fill_rect(24, 14 + y_off, 4, 4)
+    ctx.fill_rect(32, 14 + y_off, 4, 4)
+    # Eye glow
+    ctx.fill_style = 'rgba(255, 136, 0, 0.3)'
+    ctx.fill_rect(22, 12 + y_off, 8, 8)
+    ctx.fill_rect(30, 12 + y_off, 8, 8)
+
+
+def draw_pyromancer(ctx, anim, i):
+    if anim == 'idle':
+        draw_pyromancer_base(ctx, -1 if i in (1, 2) else 0, 6 + math.sin(i * 1.5) * 2)
+    elif anim == 'walk':
+        draw_pyromancer_base(ctx, -2 if i % 2 == 0 else 0)
+    elif anim == 'attack':
+        draw_pyromancer_base(ctx, 0, 6 + i * 4)
+        # Growing fire effect during cast
+        if i >= 2:
+            ctx.fill_style = f'rgba(255, {80 + i * 20}, 0, 0.25)'
+            ctx.fill_circle(30, 28, 14 + i * 6)
+    elif anim == 'hurt':
+        draw_pyromancer_base(ctx, 0)
+        ctx.fill_style = 'rgba(255, 50, 0, 0.4)'
+        ctx.fill_rect(0, 0, FRAME_SIZE, FRAME_SIZE)
+    elif anim == 'death':
+        ctx.save()
+        ctx.global_alpha = 1 - i * 0.22
+        draw_pyromancer_base(ctx, i * 5, max(2, 10 - i * 2))
+        # Fire explosion
+        ctx.fill_style = '#FF6600'
+        for j in range(i * 4):
+            ctx.fill_circle(32 + (j * 19 % 48) - 24, 32 + (j * 11 % 48) - 24, 3 + j % 3)
+        ctx.restore()
+
+
+BOSS_DRAWERS = {
+    'minotaur': draw_minotaur,
+    'headless_horseman': draw_horseman,
+    'pyromancer': draw_pyromancer,
+}
+
+# ============== BAKING ==============
+
+def render_frame(draw_func, anim, index):
+    ctx = Canvas(FRAME_SIZE, FRAME_SIZE)
+    draw_func(ctx, anim, index)
+    return ctx.image
+
+
+def render_strip(draw_func, anim, count):
+    """Lay an animation's frames out left to right, as SpriteLoader.loadSpriteSheet expects."""
+    strip = Image.new('RGBA', (FRAME_SIZE * count, FRAME_SIZE), (0, 0, 0, 0))
+    for i in range(count):
+        strip.paste(render_frame(draw_func, anim, i), (i * FRAME_SIZE, 0))
+    return strip
+
+
+def bake_boss(boss_type, output_dir):
+    boss_dir = os.path.join(output_dir, boss_type)
+    os.makedirs(boss_dir, exist_ok=True)
+
+    animations = {}
+    for anim, count in FRAME_COUNTS.items():
+        path = os.path.join(boss_dir, f"{anim}.png")
+        save_png(render_strip(BOSS_DRAWERS[boss_type], anim, count), path)
+        animations[anim] = {
+            'file': os.path.relpath(path, BUILD_DIR).replace(os.sep, '/'),
+            'frames': count,
+        }
+        print(f"  Created: {path}")
+
+    return {'frameWidth': FRAME_SIZE, 'frameHeight': FRAME_SIZE, 'animations': animations}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bake procedural boss frames to sprite strips")
+    parser.add_argument('bosses', nargs='*', metavar='boss',
+                        help=f"bosses to bake (default: all of {', '.join(BOSS_DRAWERS)})")
+    parser.add_argument('-o', '--output', default=OUTPUT_DIR, help="output directory")
+    args = parser.parse_args(argv)
+    for boss_type in args.bosses:
+        if boss_type not in BOSS_DRAWERS:
+            parser.error(f"unknown boss: {boss_type}")
+
+    print("Baking procedural boss sprites...")
+    # Keep entries for bosses not re-baked this run
+    entries = load_manifest().get('bossSprites', {}) if args.bosses else {}
+    for boss_type in args.bosses or BOSS_DRAWERS:
+        print(f"\n{boss_type}:")
+        entries[boss_type] = bake_boss(boss_type, args.output)
+
+    register_assets('bossSprites', entries)
+    print(f"\nBoss sprites saved to: {args.output}/")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,182 @@
+"""
+Bitmap Font Baker
+Rasterizes the sans-serif fonts used by FloatingText and the HUD into one
+glyph atlas, with a black outlined copy of every glyph (strokeText with
+lineWidth 3), and writes per-glyph advance/offset metrics plus kerning
+pairs to JSON. The game lays a string out once from these metrics and then
+draws the cached result instead of calling strokeText/fillText every frame.
+
+Usage:
+    python bake_font.py
+    python bake_font.py --font /path/Regular.ttf --bold-font /path/Bold.ttf
+"""
+
+import argparse
+import json
+import os
+
+from PIL import Image, ImageDraw, ImageFont
+
+from asset_manifest import BUILD_DIR, register_assets, save_png
+
+OUTPUT_DIR = os.path.join(BUILD_DIR, 'fonts')
+ATLAS_WIDTH = 512
+CHARSET = ''.join(chr(c) for c in range(32, 127))
+OUTLINE_WIDTH = 2       # strokeText lineWidth 3 straddles the glyph edge: ~1.5px outside
+
+# CSS fonts drawn with fillText/strokeText in js/effects.js and js/ui.js
+FONTS = [
+    'bold 36px sans-serif',
+    'bold 18px sans-serif',
+    'bold 15px sans-serif',
+    '20px sans-serif',
+    'bold 20px sans-serif',
+    'bold 14px sans-serif',
+    'bold 12px sans-serif',
+]
+
+# What browsers typically resolve sans-serif to, per platform
+REGULAR_CANDIDATES = [
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+    '/usr/share/fonts/TTF/DejaVuSans.ttf',
+    '/usr/share/fonts/truetype/liberation/LiberationSans-Regular.ttf',
+    '/Library/Fonts/Arial.ttf',
+    '/System/Library/Fonts/Supplemental/Arial.ttf',
+    'C:/Windows/Fonts/arial.ttf',
+]
+BOLD_CANDIDATES = [
+    '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf',
+    '/usr/share/fonts/TTF/DejaVuSans-Bold.ttf',
+    '/usr/share/fonts/truetype/liberation/LiberationSans-Bold.ttf',
+    '/Library/Fonts/Arial Bold.ttf',
+    '/System/Library/Fonts/Supplemental/Arial Bold.ttf',
+    'C:/Windows/Fonts/arialbd.ttf',
+]
+
+
+def find_font(candidates):
+    for path in candidates:
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def parse_css_font(css):
+    """'bold 18px sans-serif' -> (bold, 18)"""
+    parts = css.split()
+    size = next(int(p[:-2]) for p in parts if p.endswith('px'))
+    return 'bold' in parts, size
+
+# ============== RASTERIZING ==============
+
+def render_glyph(font, ch, outline):
+    """Return (image, left, top) with left/top relative to the pen position on the baseline."""
+    stroke = OUTLINE_WIDTH
+    left, top, right, bottom = font.getbbox(ch, anchor='ls', stroke_width=stroke)
+    width, height = max(1, right - left), max(1, bottom - top)
+    image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    if outline:
+        draw.text((-left, -top), ch, font=font, anchor='ls', fill=(0, 0, 0, 255),
+                  stroke_width=stroke, stroke_fill=(0, 0, 0, 255))
+    else:
+        draw.text((-left, -top), ch, font=font, anchor='ls', fill=(255, 255, 255, 255))
+    return image, left, top
+
+
+def kerning_pairs(font, charset):
+    """Pairs whose combined advance differs from the sum of the single advances."""
+    advances = {ch: font.getlength(ch) for ch in charset}
+    pairs = {}
+    for a in charset:
+        for b in charset:
+            delta = font.getlength(a + b) - advances[a] - advances[b]
+            if abs(delta) >= 0.05:
+                pairs[a + b] = round(delta, 2)
+    return pairs
+
+
+class ShelfPacker:
+    """Row-by-row rectangle packing into a fixed-width atlas."""
+
+    def __init__(self, width):
+        self.width = width
+        self.x = self.y = self.row_height = 0
+
+    def place(self, w, h):
+        if self.x + w > self.width:
+            self.x, self.y = 0, self.y + self.row_height + 1
+            self.row_height = 0
+        pos = (self.x, self.y)
+        self.x += w + 1
+        self.row_height = max(self.row_height, h)
+        return pos
+
+    @property
+    def height(self):
+        return self.y + self.row_height
+
+
+def bake_fonts(fonts, regular_path, bold_path, charset=CHARSET):
+    """Return (atlas image, metrics). The outlined glyphs sit outlineOffset pixels below the fills."""
+    packer = ShelfPacker(ATLAS_WIDTH)
+    placed = []
+    metrics = {}
+    for css in fonts:
+        bold, size = parse_css_font(css)
+        font = ImageFont.truetype(bold_path if bold else regular_path, size)
+        ascent, descent = font.getmetrics()
+        glyphs = {}
+        for ch in charset:
+            fill, left, top = render_glyph(font, ch, outline=False)
+            outline, _, _ = render_glyph(font, ch, outline=True)
+            x, y = packer.place(fill.width, fill.height)
+            placed.append((x, y, fill, outline))
+            # [atlas x, atlas y, width, height, offset x, offset y, advance]
+            glyphs[ch] = [x, y, fill.width, fill.height, left, top, round(font.getlength(ch), 2)]
+        metrics[css] = {
+            'ascent': ascent + OUTLINE_WIDTH,
+            'descent': descent + OUTLINE_WIDTH,
+            'glyphs': glyphs,
+            'kerning': kerning_pairs(font, charset),
+        }
+
+    outline_offset = packer.height + 1
+    atlas = Image.new('RGBA', (ATLAS_WIDTH, outline_offset * 2), (0, 0, 0, 0))
+    for x, y, fill, outline in placed:
+        atlas.paste(fill, (x, y))
+        atlas.paste(outline, (x, y + outline_offset))
+    return atlas, {'outlineOffset': outline_offset, 'fonts': metrics}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bake the HUD/floating text fonts into a glyph atlas")
+    parser.add_argument('-o', '--output', default=OUTPUT_DIR, help="output directory")
+    parser.add_argument('--font', default=find_font(REGULAR_CANDIDATES), help="regular TTF/OTF file")
+    parser.add_argument('--bold-font', default=find_font(BOLD_CANDIDATES), help="bold TTF/OTF file")
+    args = parser.parse_args(argv)
+    if not args.font or not args.bold_font:
+        parser.error("no sans-serif font found; pass --font and --bold-font")
+
+    print(f"Baking {len(FONTS)} fonts from {os.path.basename(args.font)} / {os.path.basename(args.bold_font)}...")
+    atlas, metrics = bake_fonts(FONTS, args.font, args.bold_font)
+
+    os.makedirs(args.output, exist_ok=True)
+    atlas_path = os.path.join(args.output, 'font_atlas.png')
+    metrics_path = os.path.join(args.output, 'font_atlas.json')
+    save_png(atlas, atlas_path)
+    with open(metrics_path, 'w', encoding='utf-8') as f:
+        json.dump(metrics, f, separators=(',', ':'), sort_keys=True)
+    for css, entry in metrics['fonts'].items():
+        print(f"  {css}: {len(entry['glyphs'])} glyphs, {len(entry['kerning'])} kerning pairs")
+
+    register_assets('fonts', {
+        'file': os.path.relpath(atlas_path, BUILD_DIR).replace(os.sep, '/'),
+        'metrics': os.path.relpath(metrics_path, BUILD_DIR).replace(os.sep, '/'),
+        'fonts': FONTS,
+    })
+    print(f"\nFont atlas saved to: {atlas_path} ({atlas.width}x{atlas.height})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+Particle Atlas Baker
+Precomputes the particle and glow textures (solid dots, four-point sparks,
+soft glows and the shield ring) at several sizes and in every tint the game
+uses, packed into one atlas registered in the asset manifest. ParticleSystem,
+projectile trails and the glow effects then draw sprites instead of filling
+arcs, radial gradients and shadowBlur every frame.
+
+Usage:
+    python bake_particles.py
+"""
+
+import argparse
+import glob
+import os
+import re
+
+import numpy as np
+from PIL import Image
+
+from asset_manifest import BUILD_DIR, register_assets, save_png
+from canvas2d import Canvas, parse_color
+
+OUTPUT_PATH = os.path.join(BUILD_DIR, 'sprites', 'particles.png')
+PARTICLE_SOURCE = 'js/particles.js'
+JS_SOURCES = 'js/*.js'
+SUPERSAMPLE = 4
+
+# Trail colours picked in Projectile.update (js/projectile.js)
+PROJECTILE_TRAIL_COLORS = ['#ff6b6b', '#feca57', '#48dbfb', '#ff9ff3', '#54a0ff', '#5f27cd', '#ff4444', '#ff6666']
+# shadowColor of the enemy attack glow (js/enemies.js)
+GLOW_COLORS = ['#ff4400']
+SHIELD_COLOR = '#00aaff'
+SHIELD_INNER = 0.4      # createRadialGradient(c, 20, c, 50): inner radius / outer radius
+
+HEX_RE = re.compile(r"'(#[0-9a-fA-F]{6})'")
+EMIT_CALL_RE = re.compile(r"ParticleSystem\.\w+\([^)]*\)")
+
+# ============== PALETTE ==============
+
+def particle_palette():
+    """Every colour a particle can take: the preset lists plus literal colours passed in calls."""
+    colors = []
+    with open(PARTICLE_SOURCE, encoding='utf-8') as f:
+        colors += HEX_RE.findall(f.read())
+    for path in sorted(glob.glob(JS_SOURCES)):
+        with open(path, encoding='utf-8') as f:
+            for call in EMIT_CALL_RE.findall(f.read()):
+                colors += HEX_RE.findall(call)
+    colors += PROJECTILE_TRAIL_COLORS
+    return list(dict.fromkeys(c.lower() for c in colors))
+
+# ============== TEXTURES ==============
+# Each returns a (cell, cell) alpha array in [0, 1] for a texture of the given radius.
+
+def distance_grid(cell):
+    """Distance of every sub-pixel sample from the cell centre, shape (cell*SS, cell*SS)."""
+    coords = (np.arange(cell * SUPERSAMPLE) + 0.5) / SUPERSAMPLE - cell / 2
+    return coords[None, :], coords[:, None]
+
+
+def downsample(samples, cell):
+    return samples.reshape(cell, SUPERSAMPLE, cell, SUPERSAMPLE).mean(axis=(1, 3))
+
+
+def dot_alpha(radius, cell):
+    """The arc fill Particle.draw uses."""
+    ctx = Canvas(cell, cell)
+    ctx.fill_style = '#ffffff'
+    ctx.fill_circle(cell / 2, cell / 2, radius)
+    return np.asarray(ctx.image, dtype=np.float64)[:, :, 3] / 255
+
+
+def glow_alpha(radius, cell):
+    """Smooth falloff to zero at the radius, roughly what shadowBlur spreads around a shape."""
+    x, y = distance_grid(cell)
+    d = np.hypot(x, y) / radius
+    return downsample(np.where(d < 1, (1 - d ** 2) ** 2, 0.0), cell)
+
+
+def spark_alpha(radius, cell):
+    """Bright core with four tapering rays."""
+    x, y = distance_grid(cell)
+    ax, ay = np.abs(x) / radius, np.abs(y) / radius
+    width = 0.08
+    rays = np.maximum(np.exp(-ay / width) * np.clip(1 - ax, 0, 1),
+                      np.exp(-ax / width) * np.clip(1 - ay, 0, 1))
+    core = np.exp(-12 * (ax ** 2 + ay ** 2))
+    return downsample(np.clip(rays + core, 0, 1), cell)
+
+
+def ring_alpha(radius, cell):
+    """Player shield gradient: transparent -> colour at the midpoint -> transparent."""
+    x, y = distance_grid(cell)
+    t = (np.hypot(x, y) / radius - SHIELD_INNER) / (1 - SHIELD_INNER)
+    return downsample(np.where((t >= 0) & (t <= 1), 1 - np.abs(t - 0.5) * 2, 0.0), cell)
+
+
+def texture_table(palette):
+    """texture: (alpha function, radii, tints)"""
+    return {
+        'dot': (dot_alpha, [4, 8, 16], palette),
+        'spark': (spark_alpha, [8, 16], palette),
+        'glow': (glow_alpha, [32, 64], GLOW_COLORS),
+        'ring': (ring_alpha, [50], [SHIELD_COLOR]),
+    }
+
+# ============== BAKING ==============
+
+def tinted(alpha, color):
+    r, g, b, _ = parse_color(color)
+    pixels = np.empty(alpha.shape + (4,), dtype=np.uint8)
+    pixels[:, :, :3] = (r, g, b)
+    pixels[:, :, 3] = np.round(alpha * 255)
+    return Image.fromarray(pixels, 'RGBA')
+
+
+def bake_atlas(palette):
+    """Return (atlas image, manifest entry); each (texture, radius) is one row of tints."""
+    rows = []
+    textures = {}
+    y = 0
+    for name, (alpha_func, radii, tints) in texture_table(palette).items():
+        sizes = []
+        for radius in radii:
+            cell = 2 * radius + 2  # 1px transparent border keeps bilinear scaling clean
+            alpha = alpha_func(radius, cell)
+            rows.append((y, cell, [tinted(alpha, color) for color in tints]))
+            sizes.append({'radius': radius, 'cell': cell, 'y': y})
+            y += cell
+        textures[name] = {'sizes': sizes, 'tints': {color: i for i, color in enumerate(tints)}}
+
+    atlas = Image.new('RGBA', (max(cell * len(tiles) for _, cell, tiles in rows), y), (0, 0, 0, 0))
+    for row_y, cell, tiles in rows:
+        for i, tile in enumerate(tiles):
+            atlas.paste(tile, (i * cell, row_y))
+    return atlas, textures
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bake the particle and glow sprite atlas")
+    parser.add_argument('-o', '--output', default=OUTPUT_PATH, help="atlas PNG path")
+    args = parser.parse_args(argv)
+
+    palette = particle_palette()
+    print(f"Baking particle atlas ({len(palette)} particle colours)...")
+    atlas, textures = bake_atlas(palette)
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    save_png(atlas, args.output)
+    for name, entry in textures.items():
+        radii = ', '.join(str(size['radius']) for size in entry['sizes'])
+        print(f"  {name}: radius {radii} x {len(entry['tints'])} tints")
+
+    register_assets('particles', {
+        'file': os.path.relpath(args.output, BUILD_DIR).replace(os.sep, '/'),
+        'textures': textures,
+    })
+    print(f"\nParticle atlas saved to: {args.output} ({atlas.width}x{atlas.height})")
+
+
+if __name__ == '__main__':
+    main()
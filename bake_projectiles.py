@@ -0,0 +1,161 @@
+"""
+Projectile Rotation Sheet Baker
+Renders the procedurally drawn projectiles from js/projectile.js (bone,
+fireball, skull, rock) into one atlas with a row of pre-rotated frames per
+type, and registers the layout in the asset manifest so Projectile.draw can
+blit a frame instead of rebuilding paths under a rotation transform.
+
+Usage:
+    python bake_projectiles.py                # 32 rotation steps
+    python bake_projectiles.py --steps 64     # finer angle resolution
+"""
+
+import argparse
+import math
+import os
+
+from PIL import Image
+
+from asset_manifest import BUILD_DIR, register_assets, save_png
+from canvas2d import Canvas
+
+OUTPUT_PATH = os.path.join(BUILD_DIR, 'sprites', 'projectiles.png')
+ROTATION_STEPS = 32
+
+# ============== PROJECTILES (see Projectile.draw* in js/projectile.js) ==============
+# Each draw function paints around the origin, already rotated, for a
+# projectile of width w (the values set in setTypeProperties).
+
+def draw_bone(ctx, w):
+    ctx.fill_style = '#e8e0d0'
+    ctx.fill_rect(-w / 2, -3, w, 6)
+    ctx.fill_circle(-w / 2, 0, 5)
+    ctx.fill_circle(w / 2, 0, 5)
+
+
+def draw_fireball(ctx, w):
+    ctx.save()
+    ctx.global_alpha = 0.6
+    ctx.fill_style = '#ffaa00'
+    ctx.fill_circle(0, 0, w * 0.8)
+    ctx.restore()
+
+    ctx.fill_style = '#ff4400'
+    ctx.fill_circle(0, 0, w / 2)
+
+    ctx.fill_style = '#ffff00'
+    ctx.fill_circle(0, 0, w / 4)
+
+
+def draw_skull(ctx, w):
+    # Ghostly green glow
+    ctx.global_alpha = 0.5
+    ctx.fill_style = '#88ff88'
+    ctx.fill_circle(0, 0, w * 0.7)
+    ctx.global_alpha = 1
+
+    # Skull shape - main cranium
+    ctx.fill_style = '#e8e0d0'
+    ctx.fill_ellipse(0, -2, 8, 10)
+    # Jaw
+    ctx.fill_ellipse(0, 6, 6, 4, 0, math.pi)
+
+    # Eye sockets (dark)
+    ctx.fill_style = '#1a1a1a'
+    ctx.fill_ellipse(-3, -3, 2.5, 3)
+    ctx.fill_ellipse(3, -3, 2.5, 3)
+
+    # Glowing green eyes
+    ctx.fill_style = '#44ff44'
+    ctx.fill_circle(-3, -3, 1.5)
+    ctx.fill_circle(3, -3, 1.5)
+
+    # Nose hole
+    ctx.fill_style = '#1a1a1a'
+    ctx.fill_polygon([(0, 0), (-2, 3), (2, 3)])
+
+    # Teeth
+    ctx.fill_style = '#e8e0d0'
+    for i in range(-4, 5, 2):
+        ctx.fill_rect(i - 0.5, 4, 1.5, 3)
+
+
+def draw_rock(ctx, w):
+    # Rocky irregular shape
+    ctx.fill_style = '#888888'
+    ctx.fill_polygon([(-8, -4), (-4, -9), (4, -8), (9, -2), (7, 6), (-2, 9), (-9, 4)])
+
+    # Darker cracks
+    ctx.stroke_style = '#555555'
+    ctx.stroke_polyline([(-3, -6), (1, 2), (5, 4)], 1)
+
+    # Highlight
+    ctx.fill_style = '#aaaaaa'
+    ctx.fill_circle(-2, -3, 3)
+
+
+# type: (draw function, projectile width, frame size, rotates)
+# Frame sizes cover the drawing at any angle, glow included.
+PROJECTILES = {
+    'bone': (draw_bone, 20, 32, True),
+    'fireball': (draw_fireball, 20, 32, False),
+    'skull': (draw_skull, 24, 36, True),
+    'rock': (draw_rock, 22, 24, True),
+}
+
+# ============== BAKING ==============
+
+def render_frame(draw_func, width, frame_size, angle):
+    ctx = Canvas(frame_size, frame_size)
+    ctx.translate(frame_size / 2, frame_size / 2)
+    ctx.rotate(angle)
+    draw_func(ctx, width)
+    return ctx.image
+
+
+def bake_atlas(steps=ROTATION_STEPS):
+    """Return (atlas image, per-type layout); row i holds type i's rotation frames."""
+    rows = []
+    for name, (draw_func, width, frame_size, rotates) in PROJECTILES.items():
+        count = steps if rotates else 1
+        frames = [render_frame(draw_func, width, frame_size, 2 * math.pi * i / count) for i in range(count)]
+        rows.append((name, frame_size, frames))
+
+    atlas = Image.new('RGBA', (max(size * len(frames) for _, size, frames in rows),
+                               sum(size for _, size, _ in rows)), (0, 0, 0, 0))
+    types = {}
+    y = 0
+    for name, frame_size, frames in rows:
+        for i, frame in enumerate(frames):
+            atlas.paste(frame, (i * frame_size, y))
+        types[name] = {'y': y, 'frameSize': frame_size, 'frames': len(frames)}
+        y += frame_size
+    return atlas, types
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bake projectile rotation sheets")
+    parser.add_argument('-o', '--output', default=OUTPUT_PATH, help="atlas PNG path")
+    parser.add_argument('--steps', type=int, default=ROTATION_STEPS,
+                        help="rotation frames per full turn")
+    args = parser.parse_args(argv)
+    if args.steps < 1:
+        parser.error("--steps must be at least 1")
+
+    print(f"Baking projectile sheets at {args.steps} rotation steps...")
+    atlas, types = bake_atlas(args.steps)
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    save_png(atlas, args.output)
+    for name, entry in types.items():
+        print(f"  {name}: {entry['frames']} frames of {entry['frameSize']}px")
+
+    register_assets('projectiles', {
+        'file': os.path.relpath(args.output, BUILD_DIR).replace(os.sep, '/'),
+        'steps': args.steps,
+        'types': types,
+    })
+    print(f"\nProjectile atlas saved to: {args.output} ({atlas.width}x{atlas.height})")
+
+
+if __name__ == '__main__':
+    main()
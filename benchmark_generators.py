@@ -0,0 +1,227 @@
+"""
+Generator Benchmarks
+Times the pieces of the asset generators on fixed inputs - rasterizing
+pixel data (create_sprite, create_unicorn_frame), nearest-neighbour scaling,
+PNG encoding, deriving the pink/white player variants - and whole generator
+runs. Results are written as JSON and compared with a stored baseline; a
+benchmark slower than the baseline by more than the threshold fails the run.
+
+Generators that write files run inside a temporary directory, so the
+checked-in assets are never touched.
+
+Usage:
+    python benchmark_generators.py                  # run and compare with the baseline
+    python benchmark_generators.py --save-baseline  # run and store as the new baseline
+    python benchmark_generators.py --threshold 0.1  # fail on a 10% slowdown
+    python benchmark_generators.py -k rasterize     # only benchmarks matching a substring
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import timeit
+
+from asset_manifest import BUILD_DIR, save_png
+from build_cache import tool_versions
+import extract_unicorn
+import generate_boss_animations
+import generate_enemy_animations
+import generate_sprites
+import generate_unicorn
+import generate_unicorn_v2
+
+RESULTS_PATH = os.path.join(BUILD_DIR, 'benchmarks', 'latest.json')
+BASELINE_PATH = os.path.join(BUILD_DIR, 'benchmarks', 'baseline.json')
+THRESHOLD = 0.25    # fractional slowdown of the best time that counts as a regression
+REPEAT = 5
+
+# Copied into the scratch directory for the benchmarks that read them
+FIXTURES = ['Unicorn Assets/unicorn_strips', 'assets/player/rainbow']
+
+
+class Benchmark:
+    def __init__(self, name, setup, number=1, threshold=None):
+        self.name = name
+        self.setup = setup          # returns the function to time, called in the scratch directory
+        self.number = number        # calls per timed repeat
+        self.threshold = threshold  # overrides THRESHOLD for noisy benchmarks
+
+# ============== FIXED INPUTS ==============
+
+def unicorn_sprite():
+    return generate_unicorn.create_sprite(32, 32, generate_unicorn.get_run_frames()[0],
+                                          generate_unicorn.get_rainbow_palette())
+
+
+def boss_frame():
+    frames, palette = dict(generate_boss_animations.BOSSES)['dragon']()
+    return frames['attack'][0].strip().split('\n'), palette
+
+
+def bench_create_sprite():
+    frame, palette = generate_unicorn.get_run_frames()[0], generate_unicorn.get_rainbow_palette()
+    return lambda: generate_unicorn.create_sprite(32, 32, frame, palette)
+
+
+def bench_create_sprite_boss():
+    frame, palette = boss_frame()
+    return lambda: generate_boss_animations.create_sprite(64, 64, frame, palette)
+
+
+def bench_create_unicorn_frame():
+    frame = generate_unicorn_v2.get_run_frames('rainbow')[0]
+    return lambda: generate_unicorn_v2.create_unicorn_frame('rainbow', frame)
+
+
+def bench_scale_sprite():
+    sprite = unicorn_sprite()
+    return lambda: generate_unicorn.scale_sprite(sprite, 4)
+
+
+def bench_png_encode():
+    scaled = generate_unicorn.scale_sprite(unicorn_sprite(), 4)
+    return lambda: save_png(scaled, io.BytesIO())
+
+
+def quiet(main, *args):
+    """A call to a generator's main with its progress output swallowed."""
+    def run():
+        with contextlib.redirect_stdout(io.StringIO()):
+            main(*args)
+    return run
+
+
+BENCHMARKS = [
+    Benchmark('rasterize/create_sprite', bench_create_sprite, number=200),
+    Benchmark('rasterize/create_sprite_64', bench_create_sprite_boss, number=50),
+    Benchmark('rasterize/create_unicorn_frame', bench_create_unicorn_frame, number=200),
+    Benchmark('scale/scale_sprite', bench_scale_sprite, number=500),
+    Benchmark('encode/png', bench_png_encode, number=200),
+    Benchmark('variants/create_color_variants',
+              lambda: quiet(extract_unicorn.create_color_variants, 'assets/player/rainbow')),
+    Benchmark('main/extract_unicorn', lambda: quiet(extract_unicorn.main, []), threshold=0.4),
+    Benchmark('main/generate_unicorn', lambda: quiet(generate_unicorn.main, []), threshold=0.4),
+    Benchmark('main/generate_unicorn_v2', lambda: quiet(generate_unicorn_v2.generate_all_unicorn_sprites),
+              threshold=0.4),
+    Benchmark('main/generate_sprites', lambda: quiet(generate_sprites.main, []), threshold=0.4),
+    Benchmark('main/generate_enemy_animations', lambda: quiet(generate_enemy_animations.main, []),
+              threshold=0.4),
+    Benchmark('main/generate_boss_animations', lambda: quiet(generate_boss_animations.main, []),
+              threshold=0.4),
+]
+
+# ============== RUNNING ==============
+
+def run_benchmarks(benchmarks, repeat):
+    """{name: {best, median, number, repeat}} with times in seconds per call."""
+    root = os.getcwd()
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='retrocorn-bench-') as scratch:
+        for fixture in FIXTURES:
+            shutil.copytree(os.path.join(root, fixture), os.path.join(scratch, fixture))
+        os.chdir(scratch)
+        try:
+            for bench in benchmarks:
+                func = bench.setup()
+                func()  # warm-up: imports, caches, output directories
+                times = [t / bench.number for t in timeit.repeat(func, number=bench.number, repeat=repeat)]
+                results[bench.name] = {
+                    'best': min(times),
+                    'median': statistics.median(times),
+                    'number': bench.number,
+                    'repeat': repeat,
+                }
+                print(f"  {bench.name:<40}{format_time(min(times)):>12}")
+        finally:
+            os.chdir(root)
+    return results
+
+
+def format_time(seconds):
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f} ms"
+    return f"{seconds:.2f} s"
+
+
+def compare(benchmarks, results, baseline, threshold):
+    """[(name, baseline best, best, change, regressed)] for benchmarks in both runs."""
+    rows = []
+    for bench in benchmarks:
+        old = baseline.get(bench.name)
+        new = results.get(bench.name)
+        if not old or not new:
+            continue
+        change = new['best'] / old['best'] - 1
+        limit = bench.threshold if bench.threshold is not None else threshold
+        rows.append((bench.name, old['best'], new['best'], change, change > limit))
+    return rows
+
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the asset generators against a stored baseline")
+    parser.add_argument('-k', '--filter', default='', help="only run benchmarks whose name contains this")
+    parser.add_argument('--repeat', type=int, default=REPEAT, help="timed repeats per benchmark")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD,
+                        help="allowed slowdown of the best time, as a fraction (whole main() runs allow 0.4)")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON to compare with")
+    parser.add_argument('-o', '--output', default=RESULTS_PATH, help="where to write this run's results")
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the baseline")
+    args = parser.parse_args(argv)
+
+    benchmarks = [bench for bench in BENCHMARKS if args.filter in bench.name]
+    if not benchmarks:
+        parser.error(f"no benchmark matches '{args.filter}'")
+
+    print(f"Running {len(benchmarks)} benchmarks (best of {args.repeat})...")
+    results = run_benchmarks(benchmarks, max(1, args.repeat))
+    run = {'tools': tool_versions(), 'benchmarks': results}
+    write_json(args.output, run)
+    print(f"\nResults saved to: {args.output}")
+
+    if args.save_baseline:
+        if os.path.exists(args.baseline):
+            # Keep baseline entries for benchmarks this run filtered out
+            with open(args.baseline, encoding='utf-8') as f:
+                run['benchmarks'] = {**json.load(f)['benchmarks'], **results}
+        write_json(args.baseline, run)
+        print(f"Baseline saved to: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline} - run with --save-baseline to create one.")
+        return 0
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('tools') != run['tools']:
+        print(f"Warning: baseline was recorded with {baseline.get('tools')}, this run uses {run['tools']}")
+
+    rows = compare(benchmarks, results, baseline['benchmarks'], args.threshold)
+    print(f"\n  {'':<40}{'baseline':>12}{'now':>12}{'change':>9}")
+    for name, old, new, change, regressed in rows:
+        print(f"  {name:<40}{format_time(old):>12}{format_time(new):>12}{change:>+8.0%}"
+              + ("  REGRESSION" if regressed else ""))
+    regressions = [row for row in rows if row[4]]
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) regressed past the threshold")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,320 @@
+"""
+Asset Build
+Runs the asset pipeline as a graph of stages. Each stage is one script with
+declared inputs and outputs; a stage depends on every stage whose outputs
+overlap its inputs. Independent stages run in parallel, and a stage whose
+inputs (and command) haven't changed since its last successful run is
+skipped. Stages that do need building are first looked up in the shared
+build cache (build_cache.py) and restored from it when another checkout or
+machine has already built the same inputs. A timing breakdown per stage is
+printed at the end.
+
+By default only the stages writing build/ run. The "art" stages regenerate
+checked-in sources (the unicorn strips and player frames, the enemy and boss
+frame folders) and only run when asked for by name or with "all". Stages
+that aren't selected don't run; their outputs are used as they are.
+
+Usage:
+    python build.py                    # everything under build/
+    python build.py all                # also regenerate the art
+    python build.py player_frames collision
+    python build.py --force            # rebuild even if up to date or cached
+    python build.py --cache /mnt/build-cache
+    python build.py --no-cache
+    python build.py --list             # show the stages and their dependencies
+"""
+
+import argparse
+import concurrent.futures
+import glob
+import json
+import os
+import subprocess
+import sys
+import time
+
+from asset_manifest import BUILD_DIR, load_manifest, register_assets
+from bake_font import BOLD_CANDIDATES, REGULAR_CANDIDATES
+from build_cache import DEFAULT_CACHE_DIR, BuildCache, stage_key
+
+STATE_PATH = os.path.join(BUILD_DIR, '.build-state.json')
+# Read by every tool; part of each stage's key but never a dependency
+SHARED_SOURCES = ['asset_manifest.py']
+# Shared code of the art generators
+GENERATOR_SOURCES = ['profiling.py', 'frame_pipeline.py']
+
+
+class Stage:
+    def __init__(self, name, command, inputs, outputs, group='build', manifest=None):
+        self.name = name
+        self.command = command      # script and arguments, run with this Python
+        self.inputs = inputs        # glob patterns; the script is added automatically
+        self.outputs = outputs      # glob patterns
+        self.group = group
+        self.manifest = manifest    # build/manifest.json section the tool writes
+        self.deps = []
+
+
+STAGES = [
+    Stage('unicorn_strips', ['Unicorn Assets/unicorn_sprite_generator.py'],
+          GENERATOR_SOURCES, ['Unicorn Assets/unicorn_strips/*.png', 'Unicorn Assets/unicorn_spritesheet.png',
+               'Unicorn Assets/unicorn_projectile.png'], group='art'),
+    Stage('player_frames', ['extract_unicorn.py'],
+          ['Unicorn Assets/unicorn_strips/*.png'] + GENERATOR_SOURCES, ['assets/player/**/*.png'], group='art'),
+    Stage('enemy_sprites', ['generate_sprites.py'],
+          GENERATOR_SOURCES, ['assets/enemies/*.png', 'assets/bosses/*.png'], group='art'),
+    Stage('enemy_animations', ['generate_enemy_animations.py'],
+          GENERATOR_SOURCES, ['assets/enemies/*/*.png'], group='art'),
+    Stage('boss_animations', ['generate_boss_animations.py'],
+          GENERATOR_SOURCES, ['assets/bosses/*/*.png'], group='art'),
+    Stage('levels', ['compile_levels.py'],
+          ['js/level-data.js', 'js/level.js', 'js/enemies.js', 'level_chunks.py', 'canvas2d.py'], ['build/levels/**/*']),
+    Stage('sfx', ['render_sfx.py'], [], ['build/sfx/*.wav'], manifest='sfx'),
+    Stage('boss_sprites', ['bake_boss_sprites.py'], ['canvas2d.py'], ['build/sprites/bosses/**/*.png'],
+          manifest='bossSprites'),
+    Stage('projectiles', ['bake_projectiles.py'], ['canvas2d.py'], ['build/sprites/projectiles.png'],
+          manifest='projectiles'),
+    Stage('particles', ['bake_particles.py'], ['js/*.js', 'canvas2d.py'], ['build/sprites/particles.png'],
+          manifest='particles'),
+    # The system fonts it rasterizes are inputs too
+    Stage('font', ['bake_font.py'], REGULAR_CANDIDATES + BOLD_CANDIDATES, ['build/fonts/*'], manifest='fonts'),
+    Stage('collision', ['collision_masks.py'],
+          ['js/sprite.js', 'assets/sprites/**/*.png', 'assets/player/**/*.png', 'build/sprites/bosses/**/*.png'],
+          ['build/collision.json'], manifest='collision'),
+    Stage('delta_animations', ['encode_animations.py'],
+          ['collision_masks.py', 'js/sprite.js', 'assets/sprites/**/*.png', 'build/sprites/bosses/**/*.png'],
+          ['build/sprites/delta/*.png'], manifest='deltaAnimations'),
+]
+
+# ============== GRAPH ==============
+
+def static_prefix(pattern):
+    """Path components of a glob pattern before its first wildcard."""
+    parts = []
+    for part in pattern.split('/'):
+        if any(c in part for c in '*?['):
+            break
+        parts.append(part)
+    return parts
+
+
+def patterns_overlap(a, b):
+    """Whether two glob patterns can match a common file.
+
+    Conservative: true whenever one pattern's fixed leading directories are a
+    prefix of the other's, which can only add dependencies, never miss one.
+    """
+    a, b = static_prefix(a), static_prefix(b)
+    n = min(len(a), len(b))
+    return a[:n] == b[:n]
+
+
+def link_stages(stages):
+    """Fill in each stage's deps; raises ValueError on a cycle."""
+    for stage in stages:
+        sources = stage.inputs + [stage.command[0]]
+        stage.deps = [
+            other for other in stages
+            if other is not stage and any(patterns_overlap(i, o) for i in sources for o in other.outputs)
+        ]
+
+    visiting, done = set(), set()
+
+    def visit(stage, path):
+        if stage.name in done:
+            return
+        if stage.name in visiting:
+            raise ValueError(f"dependency cycle: {' -> '.join(path + [stage.name])}")
+        visiting.add(stage.name)
+        for dep in stage.deps:
+            visit(dep, path + [stage.name])
+        visiting.discard(stage.name)
+        done.add(stage.name)
+
+    for stage in stages:
+        visit(stage, [])
+
+
+def select_stages(stages, targets):
+    """Stages named by targets: stage names, group names or "all"."""
+    if not targets:
+        targets = ['build']
+    names = {stage.name for stage in stages}
+    groups = {stage.group for stage in stages}
+    for target in targets:
+        if target != 'all' and target not in names and target not in groups:
+            raise ValueError(f"unknown stage or group '{target}'")
+    return [
+        stage for stage in stages
+        if 'all' in targets or stage.name in targets or stage.group in targets
+    ]
+
+# ============== UP-TO-DATE CHECKS ==============
+
+def expand(patterns):
+    files = set()
+    for pattern in patterns:
+        files.update(path.replace(os.sep, '/') for path in glob.glob(pattern, recursive=True)
+                     if os.path.isfile(path))
+    return sorted(files)
+
+
+def snapshot(patterns):
+    """{path: (size, mtime_ns)} for the files matching the patterns."""
+    files = {}
+    for path in expand(patterns):
+        st = os.stat(path)
+        files[path] = (st.st_size, st.st_mtime_ns)
+    return files
+
+
+def signature(stage):
+    """The stage's build cache key: command, tool versions and input contents."""
+    return stage_key(stage.name, stage.command, expand(stage.inputs + [stage.command[0]] + SHARED_SOURCES))
+
+
+def load_state(path=STATE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_state(state, path=STATE_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+# ============== RUNNING ==============
+
+def restore_stage(stage, key, cache):
+    """Restore a stage's outputs from the cache; False on a miss."""
+    try:
+        entry = cache.lookup(key)
+        if entry is None:
+            return False
+        cache.restore(entry)
+    except OSError as e:
+        print(f"  cache unavailable for {stage.name}: {e}")
+        return False
+    if stage.manifest and entry['manifest'] is not None:
+        register_assets(stage.manifest, entry['manifest'])
+    return True
+
+
+def run_stage(stage, key, cache, use_cached=True):
+    """Restore the stage from the cache or run it; returns (status, output, seconds)."""
+    started = time.perf_counter()
+    if cache and use_cached and restore_stage(stage, key, cache):
+        return 'restored', '', time.perf_counter() - started
+
+    before = snapshot(stage.outputs)
+    result = subprocess.run([sys.executable] + stage.command, capture_output=True, text=True)
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        return 'FAILED', result.stdout + result.stderr, elapsed
+
+    if cache:
+        # Only what this run wrote: older files matching the output patterns
+        # (other tools' outputs, stale chunks) stay out of the entry
+        after = snapshot(stage.outputs)
+        produced = sorted(path for path, stamp in after.items() if before.get(path) != stamp)
+        manifest = load_manifest().get(stage.manifest) if stage.manifest else None
+        try:
+            cache.store(key, stage.name, produced, manifest)
+        except OSError as e:
+            print(f"  could not cache {stage.name}: {e}")
+    return 'built', '', elapsed
+
+
+def build(stages, jobs, force=False, cache=None):
+    """Run the selected stages; returns {name: (status, seconds)}."""
+    selected = {stage.name for stage in stages}
+    state = load_state()
+    results = {}
+    pending = list(stages)
+    running = {}
+
+    # Threads only wait on the subprocesses, so they never fight over the GIL
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as pool:
+        while pending or running:
+            for stage in list(pending):
+                if len(running) >= jobs:
+                    break
+                deps = [dep for dep in stage.deps if dep.name in selected]
+                if any(dep.name not in results for dep in deps):
+                    continue
+                pending.remove(stage)
+                if any(results[dep.name][0] in ('FAILED', 'blocked') for dep in deps):
+                    results[stage.name] = ('blocked', 0.0)
+                    print(f"  blocked: {stage.name}")
+                    continue
+                stage_signature = signature(stage)
+                if not force and state.get(stage.name) == stage_signature and expand(stage.outputs):
+                    results[stage.name] = ('up to date', 0.0)
+                    continue
+                print(f"  running: {stage.name}")
+                running[pool.submit(run_stage, stage, stage_signature, cache, not force)] = (stage, stage_signature)
+
+            if not running:
+                continue
+            finished, _ = concurrent.futures.wait(running, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in finished:
+                stage, stage_signature = running.pop(future)
+                status, output, elapsed = future.result()
+                results[stage.name] = (status, elapsed)
+                if status == 'FAILED':
+                    state.pop(stage.name, None)
+                    print(f"  FAILED: {stage.name}\n{output}")
+                else:
+                    state[stage.name] = stage_signature
+                    save_state(state)
+                    print(f"  {status}: {stage.name} ({elapsed:.2f}s)")
+    return results
+
+
+def print_timings(stages, results, wall):
+    print(f"\n{'stage':<20}{'status':<14}{'time':>8}")
+    for stage in stages:
+        status, seconds = results[stage.name]
+        print(f"{stage.name:<20}{status:<14}{seconds:>7.2f}s")
+    busy = sum(seconds for _, seconds in results.values())
+    print(f"\nStage time {busy:.2f}s in {wall:.2f}s wall"
+          + (f" ({busy / wall:.1f}x parallel)" if wall > 0 and busy > 0 else ""))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build the game assets as a dependency graph of stages")
+    parser.add_argument('targets', nargs='*', metavar='target',
+                        help="stage names, 'build' (default), 'art' or 'all'")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1, help="stages run at once")
+    parser.add_argument('--force', action='store_true', help="rebuild stages that are up to date or cached")
+    parser.add_argument('--cache', default=DEFAULT_CACHE_DIR,
+                        help="shared build cache directory (default: $RETROCORN_BUILD_CACHE or ~/.cache/retrocorn-build)")
+    parser.add_argument('--no-cache', action='store_true', help="don't read or write the build cache")
+    parser.add_argument('--list', action='store_true', help="list the stages and their dependencies")
+    args = parser.parse_args(argv)
+
+    link_stages(STAGES)
+    if args.list:
+        for stage in STAGES:
+            deps = ', '.join(dep.name for dep in stage.deps) or '-'
+            print(f"  {stage.name:<20}{stage.group:<8}after: {deps}")
+        return 0
+
+    try:
+        stages = select_stages(STAGES, args.targets)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print(f"Building {len(stages)} stages ({args.jobs} at a time)...")
+    started = time.perf_counter()
+    cache = None if args.no_cache else BuildCache(args.cache)
+    results = build(stages, max(1, args.jobs), args.force, cache)
+    print_timings(stages, results, time.perf_counter() - started)
+    return 1 if any(status in ('FAILED', 'blocked') for status, _ in results.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+Build Cache
+Content-addressed store for the outputs of build.py stages, meant to be
+shared between checkouts and machines. A stage's key hashes its name and
+command, the versions of the tools it runs with (Python, Pillow, numpy) and
+the contents of every input file, so a build whose inputs match an earlier
+one - anywhere - restores that build's outputs instead of recomputing them.
+
+Layout of the cache directory:
+    objects/<ab>/<sha256>   file contents, stored once however many entries share them
+    stages/<key>.json       {"stage", "files": {path: sha256}, "manifest": section}
+
+Every file is written under a temporary name and renamed into place, so
+several builds can use the same directory (a network mount, say) at once.
+Deleting the directory is always safe.
+"""
+
+import functools
+import hashlib
+import importlib.metadata
+import json
+import os
+import shutil
+import sys
+import uuid
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = (os.environ.get('RETROCORN_BUILD_CACHE')
+                     or os.path.join(os.path.expanduser('~'), '.cache', 'retrocorn-build'))
+TOOL_PACKAGES = ['pillow', 'numpy']
+
+
+def file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def tool_versions():
+    versions = {'python': f"{sys.version_info[0]}.{sys.version_info[1]}"}
+    for package in TOOL_PACKAGES:
+        try:
+            versions[package] = importlib.metadata.version(package)
+        except importlib.metadata.PackageNotFoundError:
+            versions[package] = None
+    return versions
+
+
+def stage_key(name, command, input_files):
+    """Cache key for a stage run over these input files (paths, sorted)."""
+    digest = hashlib.sha256(json.dumps({
+        'version': CACHE_VERSION,
+        'stage': name,
+        'command': command,
+        'tools': tool_versions(),
+    }, sort_keys=True).encode('utf-8'))
+    for path in input_files:
+        digest.update(f"{path}\0{file_digest(path)}\n".encode('utf-8'))
+    return digest.hexdigest()
+
+
+def write_atomic(path, write):
+    """Create path by calling write(file) on a temporary file and renaming it."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+    try:
+        with open(temp_path, 'wb') as f:
+            write(f)
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+
+class BuildCache:
+    def __init__(self, root=DEFAULT_CACHE_DIR):
+        self.root = root
+
+    def object_path(self, digest):
+        return os.path.join(self.root, 'objects', digest[:2], digest)
+
+    def entry_path(self, key):
+        return os.path.join(self.root, 'stages', f"{key}.json")
+
+    def lookup(self, key):
+        """The stored entry for a key, or None if it is missing or incomplete."""
+        try:
+            with open(self.entry_path(key), encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not all(os.path.exists(self.object_path(d)) for d in entry['files'].values()):
+            return None
+        return entry
+
+    def restore(self, entry):
+        """Copy an entry's files back into the working tree."""
+        for path, digest in entry['files'].items():
+            with open(self.object_path(digest), 'rb') as source:
+                write_atomic(path, lambda f: shutil.copyfileobj(source, f))
+
+    def store(self, key, stage, files, manifest=None):
+        """Record the files a stage produced (and its manifest section) under a key."""
+        hashes = {}
+        for path in files:
+            digest = file_digest(path)
+            target = self.object_path(digest)
+            if not os.path.exists(target):
+                with open(path, 'rb') as source:
+                    write_atomic(target, lambda f: shutil.copyfileobj(source, f))
+            hashes[path] = digest
+        # The entry goes last: once it exists, every object it names does too
+        entry = json.dumps({'stage': stage, 'files': hashes, 'manifest': manifest}, indent=2, sort_keys=True)
+        write_atomic(self.entry_path(key), lambda f: f.write(entry.encode('utf-8')))
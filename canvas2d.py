@@ -0,0 +1,137 @@
+"""
+Canvas 2D Helpers
+A minimal stand-in for CanvasRenderingContext2D on top of a PIL RGBA image,
+used by the offline bakers that port canvas drawing code from js/.
+Supports fillStyle, globalAlpha, save/restore, translate/rotate, filled
+rects, polygons, arcs and ellipses and thin strokes, composited source-over
+with antialiased edges.
+"""
+
+from PIL import Image
+import math
+import re
+
+import numpy as np
+
+SUPERSAMPLE = 4      # coverage samples per axis for antialiased edges
+ARC_SEGMENTS = 48
+
+
+def parse_color(css):
+    """Convert '#rrggbb' or 'rgba(r, g, b, a)' into an RGBA tuple."""
+    if css.startswith('#'):
+        return tuple(int(css[i:i + 2], 16) for i in (1, 3, 5)) + (255,)
+    r, g, b, a = re.findall(r'[\d.]+', css)
+    return (int(r), int(g), int(b), round(float(a) * 255))
+
+
+class Canvas:
+    """Just enough of the canvas API to replay the game's sprite drawing code."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.image = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        self.fill_style = '#000000'
+        self.stroke_style = '#000000'
+        self.global_alpha = 1.0
+        self.matrix = (1.0, 0.0, 0.0, 1.0, 0.0, 0.0)
+        self.stack = []
+
+    def save(self):
+        self.stack.append((self.fill_style, self.stroke_style, self.global_alpha, self.matrix))
+
+    def restore(self):
+        self.fill_style, self.stroke_style, self.global_alpha, self.matrix = self.stack.pop()
+
+    def translate(self, x, y):
+        a, b, c, d, e, f = self.matrix
+        self.matrix = (a, b, c, d, a * x + c * y + e, b * x + d * y + f)
+
+    def rotate(self, angle):
+        a, b, c, d, e, f = self.matrix
+        cos, sin = math.cos(angle), math.sin(angle)
+        self.matrix = (a * cos + c * sin, b * cos + d * sin,
+                       c * cos - a * sin, d * cos - b * sin, e, f)
+
+    def transform(self, x, y):
+        a, b, c, d, e, f = self.matrix
+        return (a * x + c * y + e, b * x + d * y + f)
+
+    def fill_polygon(self, points):
+        """Fill a closed path (moveTo/lineTo.../fill) with the current style."""
+        r, g, b, a = parse_color(self.fill_style)
+        alpha = a / 255 * self.global_alpha
+        if alpha <= 0 or len(points) < 3:
+            return
+
+        device = [self.transform(x, y) for x, y in points]
+        covered = self.coverage(device)
+        if covered is None:
+            return
+        coverage, origin = covered
+        mask = Image.fromarray(np.round(coverage * (255 * alpha)).astype(np.uint8), 'L')
+
+        # Only the polygon's bounding box is composited, so large canvases
+        # (whole levels) cost no more per shape than sprite-sized ones
+        layer = Image.new('RGBA', mask.size, (r, g, b, 0))
+        layer.putalpha(mask)
+        self.image.alpha_composite(layer, origin)
+
+    def coverage(self, points):
+        """(fraction of each pixel inside the polygon, (x, y) of its top-left), or None if empty.
+
+        The fractions cover the polygon's bounding box, clipped to the canvas,
+        under the even-odd rule. Samples a SUPERSAMPLE x SUPERSAMPLE grid of
+        sub-pixel centres, so axis-aligned edges on integer coordinates stay
+        perfectly crisp.
+        """
+        xs = [x for x, _ in points]
+        ys = [y for _, y in points]
+        x0, x1 = max(0, math.floor(min(xs))), min(self.width, math.ceil(max(xs)))
+        y0, y1 = max(0, math.floor(min(ys))), min(self.height, math.ceil(max(ys)))
+        if x0 >= x1 or y0 >= y1:
+            return None
+
+        px = x0 + (np.arange((x1 - x0) * SUPERSAMPLE) + 0.5) / SUPERSAMPLE
+        py = (y0 + (np.arange((y1 - y0) * SUPERSAMPLE) + 0.5) / SUPERSAMPLE)[:, None]
+        inside = np.zeros((len(py), len(px)), dtype=bool)
+        for (ax, ay), (bx, by) in zip(points, points[1:] + points[:1]):
+            if ay == by:
+                continue
+            crosses = (ay > py) != (by > py)
+            x_cross = ax + (py - ay) * (bx - ax) / (by - ay)
+            inside ^= crosses & (px < x_cross)
+
+        samples = inside.reshape(y1 - y0, SUPERSAMPLE, x1 - x0, SUPERSAMPLE).mean(axis=(1, 3))
+        return samples, (x0, y0)
+
+    def fill_rect(self, x, y, w, h):
+        self.fill_polygon([(x, y), (x + w, y), (x + w, y + h), (x, y + h)])
+
+    def fill_circle(self, cx, cy, radius):
+        """ctx.arc(cx, cy, radius, 0, 2 * PI) + fill."""
+        self.fill_ellipse(cx, cy, radius, radius)
+
+    def fill_ellipse(self, cx, cy, rx, ry, start=0.0, end=2 * math.pi):
+        """ctx.ellipse(cx, cy, rx, ry, 0, start, end) + fill; partial arcs close with a chord."""
+        if rx <= 0 or ry <= 0:
+            return
+        steps = max(2, math.ceil(ARC_SEGMENTS * (end - start) / (2 * math.pi)))
+        self.fill_polygon([
+            (cx + rx * math.cos(start + (end - start) * i / steps),
+             cy + ry * math.sin(start + (end - start) * i / steps))
+            for i in range(steps + 1)
+        ])
+
+    def stroke_polyline(self, points, line_width=1):
+        """moveTo/lineTo... + stroke with butt caps in the current stroke_style."""
+        fill_style, self.fill_style = self.fill_style, self.stroke_style
+        half = line_width / 2
+        for (ax, ay), (bx, by) in zip(points, points[1:]):
+            length = math.hypot(bx - ax, by - ay)
+            if length == 0:
+                continue
+            nx, ny = -(by - ay) / length * half, (bx - ax) / length * half
+            self.fill_polygon([(ax + nx, ay + ny), (bx + nx, by + ny), (bx - nx, by - ny), (ax - nx, ay - ny)])
+        self.fill_style = fill_style
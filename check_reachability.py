@@ -0,0 +1,256 @@
+"""
+Jump Reachability Checker
+Reads the player's movement constants from js/player.js, simulates one
+full-height jump arc frame by frame exactly as Player.update integrates it,
+and works out which platforms can be reached from the player start. Candidate
+platform pairs come from the same spatial grid compile_levels.py builds, and
+all candidate pairs are then tested against the arc at once with NumPy.
+Pickups and the level end are reported when no reachable surface can get the
+player's hitbox onto them.
+
+The check is optimistic: ceilings and head bonks are ignored, and moving
+platforms count as their whole swept range.
+
+Usage:
+    python check_reachability.py                 # every level
+    python check_reachability.py level3 level5   # selected levels
+"""
+
+import argparse
+import re
+import sys
+import time
+
+import numpy as np
+
+from compile_levels import CELL_SIZE, LEVEL_SOURCE, build_spatial_index, load_levels, rect_cells
+
+PLAYER_SOURCE = 'js/player.js'
+PHYSICS_FIELDS = ['speed', 'jumpForce', 'gravity', 'maxFallSpeed', 'maxJumpHoldTime',
+                  'hitboxOffsetX', 'hitboxOffsetY', 'hitboxWidth', 'hitboxHeight']
+FPS = 60
+MAX_DROP = 4096         # how far below the takeoff height the arc is simulated
+PICKUP_SIZE = 32        # collection box centred on a pickup (Game.checkPickups)
+
+# ============== PHYSICS ==============
+
+def load_physics(path=PLAYER_SOURCE):
+    """Numeric `this.<field> = <value>;` assignments from the Player constructor."""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    physics = {}
+    for name, value in re.findall(r'this\.(\w+) = (-?\d+(?:\.\d+)?);', source):
+        if name in PHYSICS_FIELDS and name not in physics:
+            physics[name] = float(value)
+    missing = [name for name in PHYSICS_FIELDS if name not in physics]
+    if missing:
+        raise ValueError(f"{path}: missing {', '.join(missing)}")
+    return physics
+
+
+class JumpArc:
+    """Feet height above the takeoff surface for every frame of a held jump."""
+
+    def __init__(self, physics, fps=FPS):
+        dt = 1 / fps
+        self.dt = dt
+        self.speed = physics['speed']
+
+        # Same order as Player.update: handleInput (hold), gravity, then move
+        heights = []
+        y = vy = hold = 0.0
+        while y < MAX_DROP:
+            if hold < physics['maxJumpHoldTime']:
+                hold += dt
+                vy = physics['jumpForce']
+            vy = min(vy + physics['gravity'] * dt, physics['maxFallSpeed'])
+            y += vy * dt
+            heights.append(-y)
+        self.heights = np.array(heights)
+        self.peak = int(np.argmax(self.heights))
+        self.apex = self.heights[self.peak]
+        self.descent = -self.heights[self.peak:]   # ascending, for searchsorted
+
+    def reach(self, rise):
+        """Horizontal distance covered by the time the falling feet pass `rise`.
+
+        `rise` is an array of heights above the takeoff surface (negative
+        below it). Entries the arc never gets up to come back as -1.
+        """
+        rise = np.asarray(rise, dtype=np.float64)
+        index = np.searchsorted(self.descent, -rise, side='left')
+        frames = self.peak + np.minimum(index, len(self.descent) - 1) + 1
+        return np.where(rise <= self.apex, self.speed * frames * self.dt, -1.0)
+
+# ============== LEVEL GRAPH ==============
+
+def surfaces(level):
+    """Arrays (left, right, land, takeoff) over static then moving platforms.
+
+    A moving platform spans its whole travel: it can be boarded at the lowest
+    point of its path and left from the highest.
+    """
+    rows = [(p['x'], p['x'] + p['width'], p['y'], p['y']) for p in level.get('platforms', [])]
+    for p in level.get('movingPlatforms', []):
+        dx, dy = abs(p.get('moveX', 0)), abs(p.get('moveY', 0))
+        rows.append((p['x'] - dx, p['x'] + p['width'] + dx, p['y'] + dy, p['y'] - dy))
+    table = np.array(rows, dtype=np.float64).reshape(-1, 4)
+    return table[:, 0], table[:, 1], table[:, 2], table[:, 3]
+
+
+def horizontal_gap(a_left, a_right, b_left, b_right, hitbox_width):
+    """Distance the hitbox has to travel from standing over A to overlapping B."""
+    return np.maximum.reduce([
+        np.zeros(np.broadcast(a_left, b_left).shape),
+        b_left - hitbox_width - a_right,
+        a_left - hitbox_width - b_right,
+    ])
+
+
+def candidate_pairs(level, arc, physics, cell_size):
+    """(from, to) surface indices close enough to be worth testing."""
+    left, right, land, takeoff = surfaces(level)
+    static_count = len(level.get('platforms', []))
+    moving = np.arange(static_count, len(left))
+    index = build_spatial_index(level, cell_size)
+    cols, rows = index['cols'], index['rows']
+    bottom = rows * cell_size
+    hitbox_width = physics['hitboxWidth']
+
+    sources, targets = [], []
+    for a in range(len(left)):
+        # Farthest the player can travel before dropping out of the grid
+        reach = float(arc.reach([takeoff[a] - bottom])[0])
+        window = {
+            'x': left[a] - hitbox_width - reach,
+            'y': takeoff[a] - arc.apex,
+            'width': right[a] - left[a] + hitbox_width + 2 * reach,
+            'height': bottom - takeoff[a] + arc.apex,
+        }
+        near = set(moving)
+        for cell in rect_cells(window, cell_size, cols, rows):
+            near.update(index['platforms'].get(str(cell), []))
+        near.discard(a)
+        sources += [a] * len(near)
+        targets += sorted(near)
+    return np.array(sources, dtype=np.intp), np.array(targets, dtype=np.intp)
+
+
+def start_surface(level, physics):
+    """Surface the player drops onto from playerStart, or None if there is none."""
+    left, right, land, _ = surfaces(level)
+    start = level.get('playerStart', {'x': 100, 'y': 100})
+    hitbox_x = start['x'] + physics['hitboxOffsetX']
+    feet = start['y'] + physics['hitboxOffsetY'] + physics['hitboxHeight']
+    below = (hitbox_x + physics['hitboxWidth'] > left) & (hitbox_x < right) & (land >= feet - 1)
+    if not below.any():
+        return None
+    return int(np.flatnonzero(below)[np.argmin(land[below])])
+
+
+def reachable_surfaces(level, arc, physics, cell_size=CELL_SIZE):
+    """Boolean array over surfaces() reachable from the player start."""
+    left, right, land, takeoff = surfaces(level)
+    reached = np.zeros(len(left), dtype=bool)
+    start = start_surface(level, physics)
+    if start is None:
+        return reached
+
+    a, b = candidate_pairs(level, arc, physics, cell_size)
+    gap = horizontal_gap(left[a], right[a], left[b], right[b], physics['hitboxWidth'])
+    ok = arc.reach(takeoff[a] - land[b]) >= gap
+    edges = {}
+    for source, target in zip(a[ok].tolist(), b[ok].tolist()):
+        edges.setdefault(source, []).append(target)
+
+    reached[start] = True
+    stack = [start]
+    while stack:
+        for target in edges.get(stack.pop(), []):
+            if not reached[target]:
+                reached[target] = True
+                stack.append(target)
+    return reached
+
+
+def rect_reachable(rect, reached, level, arc, physics):
+    """Whether the player's hitbox can touch a rect from any reachable surface."""
+    left, right, _, takeoff = surfaces(level)
+    left, right, takeoff = left[reached], right[reached], takeoff[reached]
+    if len(left) == 0:
+        return False
+    # Lowest the feet may be while the hitbox top still overlaps the rect
+    rise = takeoff - (rect['y'] + rect['height'] + physics['hitboxHeight'])
+    gap = horizontal_gap(left, right, rect['x'], rect['x'] + rect['width'], physics['hitboxWidth'])
+    return bool((arc.reach(rise) >= gap).any())
+
+
+def check_level(level, arc, physics, cell_size=CELL_SIZE):
+    """Return a list of problem descriptions for one level."""
+    problems = []
+    if start_surface(level, physics) is None:
+        return ["player start is not above any platform"]
+
+    reached = reachable_surfaces(level, arc, physics, cell_size)
+    platforms = level.get('platforms', [])
+    for i, ok in enumerate(reached):
+        if ok:
+            continue
+        if i < len(platforms):
+            p = platforms[i]
+            problems.append(f"platform {i} at ({p['x']}, {p['y']}) {p['width']}x{p['height']} is unreachable")
+        else:
+            p = level['movingPlatforms'][i - len(platforms)]
+            problems.append(f"moving platform {i - len(platforms)} at ({p['x']}, {p['y']}) is unreachable")
+
+    half = PICKUP_SIZE / 2
+    for pickup in level.get('pickups', []):
+        box = {'x': pickup['x'] - half, 'y': pickup['y'] - half, 'width': PICKUP_SIZE, 'height': PICKUP_SIZE}
+        if not rect_reachable(box, reached, level, arc, physics):
+            problems.append(f"{pickup['type']} pickup at ({pickup['x']}, {pickup['y']}) is unreachable")
+
+    end = level.get('levelEnd')
+    if end and not rect_reachable(end, reached, level, arc, physics):
+        problems.append(f"level end at ({end['x']}, {end['y']}) is unreachable")
+    return problems
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report unreachable platforms and pickups in js/level-data.js")
+    parser.add_argument('levels', nargs='*', help="level ids to check (default: all)")
+    parser.add_argument('--source', default=LEVEL_SOURCE, help="JS file containing LEVELS")
+    parser.add_argument('--fps', type=int, default=FPS, help="frame rate the jump arc is simulated at")
+    parser.add_argument('--cell-size', type=int, default=CELL_SIZE, help="spatial index cell size in pixels")
+    args = parser.parse_args(argv)
+
+    levels, _ = load_levels(args.source)
+    unknown = [level_id for level_id in args.levels if level_id not in levels]
+    if unknown:
+        parser.error(f"unknown level(s): {', '.join(unknown)}")
+
+    physics = load_physics()
+    arc = JumpArc(physics, args.fps)
+    print(f"Jump arc: {arc.apex:.0f}px high, {arc.reach([0.0])[0]:.0f}px across at {args.fps} fps")
+
+    total = 0
+    for level_id in args.levels or list(levels):
+        level = levels[level_id]
+        started = time.perf_counter()
+        problems = check_level(level, arc, physics, args.cell_size)
+        elapsed = (time.perf_counter() - started) * 1000
+        total += len(problems)
+        status = f"{len(problems)} problem(s)" if problems else "ok"
+        print(f"  {level_id}: {len(level.get('platforms', []))} platforms, "
+              f"{len(level.get('pickups', []))} pickups - {status} ({elapsed:.1f} ms)")
+        for problem in problems:
+            print(f"    {problem}")
+
+    if total:
+        print(f"\n{total} reachability problem(s) found.")
+        return 1
+    print("\nEverything is reachable.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
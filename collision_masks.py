@@ -0,0 +1,148 @@
+"""
+Collision Mask Builder
+Scans every animation frame the game loads (the sprite sheet strips listed
+in SpriteLoader.spriteSheetConfigs, the player frame PNGs and the baked boss
+strips) and computes, per frame, a tight alpha bounding box plus a 1-bit
+collision mask at a coarse cell resolution, packed row-major and base64
+encoded. Collision keeps its cheap rect tests and only consults a mask once
+two rects already intersect.
+
+Usage:
+    python collision_masks.py                # 4px mask cells
+    python collision_masks.py --cell 8       # coarser masks
+"""
+
+import argparse
+import base64
+import glob
+import json
+import os
+import re
+
+import numpy as np
+from PIL import Image
+
+from asset_manifest import BUILD_DIR, load_manifest, register_assets
+
+OUTPUT_PATH = os.path.join(BUILD_DIR, 'collision.json')
+SPRITE_SOURCE = 'js/sprite.js'
+PLAYER_FRAMES = 'assets/player/*/*.png'
+SHEET_ANIMATIONS = ['idle', 'walk', 'attack', 'hurt', 'death', 'fly']
+CELL_SIZE = 4
+ALPHA_THRESHOLD = 128   # pixels at least this opaque count as solid
+
+SHEET_CONFIG_RE = re.compile(
+    r"(\w+): \{ path: '([^']+)', frameWidth: (\d+), frameHeight: (\d+) \}"
+)
+
+# ============== SOURCES ==============
+
+def sprite_sheets():
+    """(image path, frame width, frame height) for every sheet strip the loader can request."""
+    with open(SPRITE_SOURCE, encoding='utf-8') as f:
+        source = f.read()
+    sheets = []
+    for _, path, width, height in SHEET_CONFIG_RE.findall(source):
+        for anim in SHEET_ANIMATIONS:
+            image_path = f"{path}/{anim}.png"
+            if os.path.exists(image_path):
+                sheets.append((image_path, int(width), int(height)))
+
+    # Strips baked by bake_boss_sprites.py are loaded the same way
+    for entry in load_manifest().get('bossSprites', {}).values():
+        for anim in entry['animations'].values():
+            image_path = f"{BUILD_DIR}/{anim['file']}"
+            if os.path.exists(image_path):
+                sheets.append((image_path, entry['frameWidth'], entry['frameHeight']))
+    return sheets
+
+
+def single_frames():
+    """Individually loaded frame images (SpriteLoader.loadAnimation)."""
+    return sorted(path.replace(os.sep, '/') for path in glob.glob(PLAYER_FRAMES))
+
+# ============== MASKS ==============
+
+def frame_alphas(image, frame_width, frame_height):
+    """Split a horizontal strip into an array of shape (frames, height, width)."""
+    alpha = np.asarray(image.convert('RGBA'))[:, :, 3]
+    count = max(1, int(image.width / frame_width + 0.5))    # Math.round: halves round up
+    # Pad short strips and crop to the frame height, as drawImage would
+    strip = np.zeros((frame_height, count * frame_width), dtype=np.uint8)
+    h, w = min(frame_height, alpha.shape[0]), min(count * frame_width, alpha.shape[1])
+    strip[:h, :w] = alpha[:h, :w]
+    return strip.reshape(frame_height, count, frame_width).transpose(1, 0, 2)
+
+
+def frame_entry(solid, cell):
+    """Tight bbox and packed cell mask for one (height, width) boolean frame."""
+    rows = np.flatnonzero(solid.any(axis=1))
+    if len(rows) == 0:
+        return {'bbox': None}
+    cols = np.flatnonzero(solid.any(axis=0))
+
+    height, width = solid.shape
+    grid_rows, grid_cols = -(-height // cell), -(-width // cell)
+    padded = np.zeros((grid_rows * cell, grid_cols * cell), dtype=bool)
+    padded[:height, :width] = solid
+    cells = padded.reshape(grid_rows, cell, grid_cols, cell).any(axis=(1, 3))
+
+    return {
+        'bbox': [int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1)],
+        'cols': grid_cols,
+        'rows': grid_rows,
+        'mask': base64.b64encode(np.packbits(cells.ravel()).tobytes()).decode('ascii'),
+    }
+
+
+def build_masks(cell=CELL_SIZE, threshold=ALPHA_THRESHOLD):
+    """Return {image path: {frameWidth, frameHeight, frames: [...]}}."""
+    sprites = {}
+    for path, frame_width, frame_height in sprite_sheets():
+        with Image.open(path) as image:
+            frames = frame_alphas(image, frame_width, frame_height) >= threshold
+        sprites[path] = {
+            'frameWidth': frame_width,
+            'frameHeight': frame_height,
+            'frames': [frame_entry(solid, cell) for solid in frames],
+        }
+
+    for path in single_frames():
+        with Image.open(path) as image:
+            solid = np.asarray(image.convert('RGBA'))[:, :, 3] >= threshold
+            sprites[path] = {
+                'frameWidth': image.width,
+                'frameHeight': image.height,
+                'frames': [frame_entry(solid, cell)],
+            }
+    return sprites
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compute per-frame hitboxes and collision masks")
+    parser.add_argument('-o', '--output', default=OUTPUT_PATH, help="output JSON path")
+    parser.add_argument('--cell', type=int, default=CELL_SIZE, help="mask cell size in pixels")
+    parser.add_argument('--threshold', type=int, default=ALPHA_THRESHOLD,
+                        help="minimum alpha (0-255) of a solid pixel")
+    args = parser.parse_args(argv)
+    if args.cell < 1:
+        parser.error("--cell must be at least 1")
+
+    print(f"Building collision masks ({args.cell}px cells)...")
+    sprites = build_masks(args.cell, args.threshold)
+    frame_count = sum(len(entry['frames']) for entry in sprites.values())
+
+    os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump({'cellSize': args.cell, 'sprites': sprites}, f, separators=(',', ':'), sort_keys=True)
+
+    register_assets('collision', {
+        'file': os.path.relpath(args.output, BUILD_DIR).replace(os.sep, '/'),
+        'cellSize': args.cell,
+    })
+    print(f"  {len(sprites)} images, {frame_count} frames")
+    print(f"\nCollision masks saved to: {args.output} ({os.path.getsize(args.output)} bytes)")
+
+
+if __name__ == '__main__':
+    main()
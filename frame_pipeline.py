@@ -0,0 +1,79 @@
+"""
+Frame Pipeline
+Streams generated frames to disk in bounded memory. A generator describes
+its output as an iterator of (path, image) pairs, written as a Python
+generator so each frame's pixel data is only read and rasterized when the
+pipeline asks for it. Rendered frames go through a bounded queue to a few
+writer threads that PNG-encode and write them; when the writers fall
+behind, the queue fills up and rendering the next frame waits. At most
+QUEUE_SIZE + WORKERS + 1 frames are ever held, however many entities and
+variants a generator covers.
+
+The encoding runs in zlib, which releases the GIL, so writing overlaps with
+rasterizing the following frames in pure Python.
+
+Usage (in a generator):
+    def unicorn_frames():
+        for ...:
+            yield f'assets/player/{variant}/{anim}_{i}.png', render(frame_data)
+
+    write_frames(unicorn_frames())
+"""
+
+import queue
+import threading
+
+from profiling import timings, write_png
+
+QUEUE_SIZE = 8      # rendered frames waiting to be written
+WORKERS = 2         # writer threads
+
+_DONE = object()
+
+
+def write_frames(frames, queue_size=QUEUE_SIZE, workers=WORKERS):
+    """Write every (path, image) the iterator yields; returns the number written.
+
+    The first error from rendering or writing stops the pipeline and is
+    re-raised here once the writer threads have finished.
+    """
+    pending = queue.Queue(maxsize=queue_size)
+    errors = []
+
+    def writer():
+        while True:
+            job = pending.get()
+            if job is _DONE:
+                return
+            if errors:
+                continue    # keep draining so the producer never blocks on a dead pipeline
+            path, image, entity = job
+            try:
+                # Encoding and writing show up as stages; the entity only
+                # gets the file count, as its time is the producer's
+                write_png(image, path, entity)
+            except Exception as e:
+                errors.append(e)
+
+    threads = [threading.Thread(target=writer, daemon=True) for _ in range(max(1, workers))]
+    for thread in threads:
+        thread.start()
+
+    count = 0
+    try:
+        for path, image in frames:
+            if errors:
+                break
+            # Blocks while the queue is full; that wait isn't the entity's work
+            with timings.excluded():
+                pending.put((path, image, timings.current_entity))
+            count += 1
+    finally:
+        for _ in threads:
+            pending.put(_DONE)
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+    return count
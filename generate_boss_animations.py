@@ -1,11 +1,21 @@
 """
 Boss Animation Generator - Part 2
 Generates idle, walk, attack, special, hurt, and death animations for 5 bosses
+
+Usage:
+    python generate_boss_animations.py                 # every boss
+    python generate_boss_animations.py dragon cyclops  # only these
+    python generate_boss_animations.py --timings       # time per stage and boss (see profiling.py)
 """
 
 from PIL import Image
+import argparse
 import os
 
+from frame_pipeline import write_frames
+import profiling
+from profiling import timings
+
 def create_sprite(width, height, pixel_data, palette):
     """Create a sprite from pixel data and color palette."""
     img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
@@ -1720,30 +1730,55 @@ kwwwwwwkRRRRxxxxxxxxxxxxxrrrrrrrrrrRRRRkkwwwwwwwk................
 
     return frames, palette
 
-def main():
-    os.makedirs('assets/bosses', exist_ok=True)
+BOSSES = [
+    ('dragon', create_dragon_animations),
+    ('minotaur', create_minotaur_animations),
+    ('cyclops', create_cyclops_animations),
+    ('dark_wizard', create_wizard_animations),
+    ('demon_lord', create_demon_animations),
+]
 
-    bosses = [
-        ('dragon', create_dragon_animations),
-        ('minotaur', create_minotaur_animations),
-        ('cyclops', create_cyclops_animations),
-        ('dark_wizard', create_wizard_animations),
-        ('demon_lord', create_demon_animations),
-    ]
-
-    for name, create_func in bosses:
-        print(f"Generating {name} animations...")
+def boss_frames(name, create_func):
+    """Yield (path, image) for each of a boss's frames"""
+    print(f"Generating {name} animations...")
+    with timings.stage('parse'):
         frames, palette = create_func()
 
-        for anim_name, anim_frames in frames.items():
-            os.makedirs(f'assets/bosses/{name}', exist_ok=True)
-            for i, frame_str in enumerate(anim_frames):
+    for anim_name, anim_frames in frames.items():
+        os.makedirs(f'assets/bosses/{name}', exist_ok=True)
+        for i, frame_str in enumerate(anim_frames):
+            with timings.stage('parse'):
                 frame_data = [line for line in frame_str.strip().split('\n')]
+            with timings.stage('rasterize'):
                 sprite = create_sprite(64, 64, frame_data, palette)
+            with timings.stage('scale'):
                 scaled = scale_sprite(sprite, 4)
-                scaled.save(f'assets/bosses/{name}/{anim_name}_{i}.png')
+            yield f'assets/bosses/{name}/{anim_name}_{i}.png', scaled
+
+    print(f"  Created: {name}/ (idle, walk, attack, hurt, death)")
 
-        print(f"  Created: {name}/ (idle, walk, attack, hurt, death)")
+def all_boss_frames(entities):
+    # Each boss's pixel data is only built once the previous one is queued
+    for name, create_func in entities:
+        with timings.entity(name):
+            yield from boss_frames(name, create_func)
+
+def generate_bosses(entities):
+    write_frames(all_boss_frames(entities))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate boss animation frames")
+    parser.add_argument('names', nargs='*', help="bosses to generate (default: all)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    bosses = dict(BOSSES)
+    unknown = [name for name in args.names if name not in bosses]
+    if unknown:
+        parser.error(f"unknown boss: {', '.join(unknown)}")
+
+    os.makedirs('assets/bosses', exist_ok=True)
+    profiling.run(args, generate_bosses, [(name, bosses[name]) for name in args.names or bosses])
 
     print("\nAll boss animations generated!")
 
@@ -1,11 +1,21 @@
 """
 Enemy Animation Generator - Part 1
 Generates idle, walk, attack, hurt, and death animations for all 10 enemies
+
+Usage:
+    python generate_enemy_animations.py              # every enemy
+    python generate_enemy_animations.py goblin bat   # only these
+    python generate_enemy_animations.py --timings    # time per stage and enemy (see profiling.py)
 """
 
 from PIL import Image
+import argparse
 import os
 
+from frame_pipeline import write_frames
+import profiling
+from profiling import timings, write_png
+
 def create_sprite(width, height, pixel_data, palette):
     """Create a sprite from pixel data and color palette."""
     img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
@@ -27,8 +37,9 @@ def save_animation(frames, path, scale=4):
     """Save animation frames."""
     os.makedirs(os.path.dirname(path), exist_ok=True)
     for i, frame in enumerate(frames):
-        scaled = scale_sprite(frame, scale)
-        scaled.save(f"{path}_{i}.png")
+        with timings.stage('scale'):
+            scaled = scale_sprite(frame, scale)
+        write_png(scaled, f"{path}_{i}.png")
 
 def shift_pixels(data, dx, dy):
     """Shift pixel data by dx, dy."""
@@ -2275,34 +2286,58 @@ def create_gnome_animations():
 
     return frames, palette
 
-def main():
-    os.makedirs('assets/enemies', exist_ok=True)
-
-    enemies = [
-        ('goblin', create_goblin_animations),
-        ('gnome', create_gnome_animations),
-        ('slime', create_slime_animations),
-        ('bat', create_bat_animations),
-        ('skeleton', create_skeleton_animations),
-        ('imp', create_imp_animations),
-        ('spider', create_spider_animations),
-        ('mushroom', create_mushroom_animations),
-        ('evil_fairy', create_fairy_animations),
-        ('rat', create_rat_animations),
-    ]
-
-    for name, create_func in enemies:
-        print(f"Generating {name} animations...")
+ENEMIES = [
+    ('goblin', create_goblin_animations),
+    ('gnome', create_gnome_animations),
+    ('slime', create_slime_animations),
+    ('bat', create_bat_animations),
+    ('skeleton', create_skeleton_animations),
+    ('imp', create_imp_animations),
+    ('spider', create_spider_animations),
+    ('mushroom', create_mushroom_animations),
+    ('evil_fairy', create_fairy_animations),
+    ('rat', create_rat_animations),
+]
+
+def enemy_frames(name, create_func):
+    """Yield (path, image) for each of an enemy's frames"""
+    print(f"Generating {name} animations...")
+    with timings.stage('parse'):
         frames, palette = create_func()
 
-        for anim_name, anim_frames in frames.items():
-            os.makedirs(f'assets/enemies/{name}', exist_ok=True)
-            for i, frame_data in enumerate(anim_frames):
+    for anim_name, anim_frames in frames.items():
+        os.makedirs(f'assets/enemies/{name}', exist_ok=True)
+        for i, frame_data in enumerate(anim_frames):
+            with timings.stage('rasterize'):
                 sprite = create_sprite(32, 32, frame_data, palette)
+            with timings.stage('scale'):
                 scaled = scale_sprite(sprite, 4)
-                scaled.save(f'assets/enemies/{name}/{anim_name}_{i}.png')
+            yield f'assets/enemies/{name}/{anim_name}_{i}.png', scaled
 
-        print(f"  Created: {name}/ (idle, walk, attack, hurt, death)")
+    print(f"  Created: {name}/ (idle, walk, attack, hurt, death)")
+
+def all_enemy_frames(entities):
+    # Each enemy's pixel data is only built once the previous one is queued
+    for name, create_func in entities:
+        with timings.entity(name):
+            yield from enemy_frames(name, create_func)
+
+def generate_enemies(entities):
+    write_frames(all_enemy_frames(entities))
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate enemy animation frames")
+    parser.add_argument('names', nargs='*', help="enemies to generate (default: all)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    enemies = dict(ENEMIES)
+    unknown = [name for name in args.names if name not in enemies]
+    if unknown:
+        parser.error(f"unknown enemy: {', '.join(unknown)}")
+
+    os.makedirs('assets/enemies', exist_ok=True)
+    profiling.run(args, generate_enemies, [(name, enemies[name]) for name in args.names or enemies])
 
     print("\nAll enemy animations generated!")
 
@@ -1,20 +1,30 @@
 """
 Pixel Art Sprite Generator for Retro 2D Platformer
 Generates 10 smaller enemies and 5 bosses
+
+Usage:
+    python generate_sprites.py
+    python generate_sprites.py --timings   # time per stage and sprite (see profiling.py)
 """
 
 from PIL import Image, ImageDraw
+import argparse
 import os
 
+from frame_pipeline import write_frames
+import profiling
+from profiling import timings
+
 def create_sprite(width, height, pixel_data, palette):
     """Create a sprite from pixel data and color palette."""
-    img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-    pixels = img.load()
+    with timings.stage('rasterize'):
+        img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
+        pixels = img.load()
 
-    for y, row in enumerate(pixel_data):
-        for x, color_idx in enumerate(row):
-            if color_idx != ' ' and color_idx in palette:
-                pixels[x, y] = palette[color_idx]
+        for y, row in enumerate(pixel_data):
+            for x, color_idx in enumerate(row):
+                if color_idx != ' ' and color_idx in palette:
+                    pixels[x, y] = palette[color_idx]
 
     return img
 
@@ -976,7 +986,19 @@ kwwwwwwkRRRRrrrrrrrrrrrrrrrrrrrrrrrRRRRkkwwwwwwwk................
 
     return create_sprite(64, 64, data, palette)
 
-def main():
+def sprite_frames(sprites, folder):
+    """Yield (path, image) for each (name, create_func), building one sprite at a time"""
+    for name, create_func in sprites:
+        with timings.entity(name):
+            # The create functions build their pixel rows, then rasterize them
+            with timings.stage('parse'):
+                sprite = create_func()
+            with timings.stage('scale'):
+                scaled = scale_sprite(sprite, 4)
+            yield f'{folder}/{name}.png', scaled
+        print(f"  Created: {name}.png")
+
+def generate_all():
     # Ensure directories exist
     os.makedirs('assets/enemies', exist_ok=True)
     os.makedirs('assets/bosses', exist_ok=True)
@@ -996,11 +1018,7 @@ def main():
     ]
 
     print("Generating smaller enemies (32x32, scaled to 128x128)...")
-    for name, create_func in enemies:
-        sprite = create_func()
-        scaled = scale_sprite(sprite, 4)
-        scaled.save(f'assets/enemies/{name}.png')
-        print(f"  Created: {name}.png")
+    write_frames(sprite_frames(enemies, 'assets/enemies'))
 
     # Create and save bosses
     bosses = [
@@ -1012,15 +1030,17 @@ def main():
     ]
 
     print("\nGenerating bosses (64x64, scaled to 256x256)...")
-    for name, create_func in bosses:
-        sprite = create_func()
-        scaled = scale_sprite(sprite, 4)
-        scaled.save(f'assets/bosses/{name}.png')
-        print(f"  Created: {name}.png")
+    write_frames(sprite_frames(bosses, 'assets/bosses'))
 
     print("\nAll sprites generated successfully!")
     print(f"\nEnemy sprites saved to: assets/enemies/")
     print(f"Boss sprites saved to: assets/bosses/")
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the static enemy and boss sprites")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    profiling.run(args, generate_all)
+
 if __name__ == '__main__':
     main()
@@ -0,0 +1,168 @@
+"""
+Stress Level Generator
+Builds a level in the LEVELS schema with as many platforms, enemies, moving
+platforms, hazards and pickups as requested, then compiles it into a pack
+next to the real ones (build/levels/<id>.json) so the game can load it like
+any other level. Open index.html?level=<id> and toggle the debug overlay
+(F1) to watch frame time as the entity counts grow.
+
+The layout is random but seeded, so the same arguments always produce the
+same level. Platforms are compiled without merging, so the pack holds exactly
+the number of platforms asked for.
+
+Usage:
+    python generate_stress_level.py                          # defaults below
+    python generate_stress_level.py --platforms 2000 --enemies 50 --width 40000
+    python generate_stress_level.py --id stress_small --platforms 100 --enemies 5
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+
+from compile_levels import (ENEMY_SOURCE, OUTPUT_DIR, PICKUP_TYPES, compile_level,
+                            load_enemy_types, validate_level, write_json)
+
+LEVEL_HEIGHT = 600
+GROUND_Y = 500
+GROUND_SEGMENT = 1000   # ground is laid in segments like the hand-made levels
+BOSS_TYPES = {'dragon', 'gargoyle', 'demon_lord', 'minotaur', 'headless_horseman', 'pyromancer'}
+FLYING_TYPES = {'flying_eye', 'imp', 'harpy'}
+
+# Floating platforms stay within one held jump (about 165px) of something below
+PLATFORM_Y_RANGE = (260, 440)
+PLATFORM_WIDTH_RANGE = (80, 220)
+
+# ============== GENERATION ==============
+
+def enemy_types(path=ENEMY_SOURCE):
+    """Regular enemy types with their own class in createEnemy() (aliases and bosses skipped)."""
+    with open(path, encoding='utf-8') as f:
+        source = f.read()
+    return sorted(set(re.findall(r"case '(\w+)': return new", source)) - BOSS_TYPES)
+
+
+def generate_level(width, platforms, enemies, moving, hazards, pickups, types, seed=0):
+    """Return a level dict; `enemies` is the count spawned of each type in `types`."""
+    rng = random.Random(seed)
+    span = (200, width - 300)   # keep the start and the exit clear
+
+    level = {
+        'name': f"Stress Test ({platforms} platforms, {enemies * len(types)} enemies)",
+        'width': width,
+        'height': LEVEL_HEIGHT,
+        'playerStart': {'x': 100, 'y': 380},
+        'levelEnd': {'x': width - 100, 'y': 400, 'width': 80, 'height': 100},
+        'platforms': [],
+        'movingPlatforms': [],
+        'enemySpawns': [],
+        'pickups': [],
+        'hazards': [],
+    }
+
+    for x in range(0, width, GROUND_SEGMENT):
+        level['platforms'].append({
+            'x': x, 'y': GROUND_Y, 'width': min(GROUND_SEGMENT, width - x),
+            'height': LEVEL_HEIGHT - GROUND_Y, 'isGround': True,
+        })
+
+    for _ in range(platforms):
+        w = rng.randrange(*PLATFORM_WIDTH_RANGE, 10)
+        level['platforms'].append({
+            'x': rng.randrange(span[0], span[1] - w),
+            'y': rng.randrange(*PLATFORM_Y_RANGE, 10),
+            'width': w,
+            'height': 20,
+        })
+
+    for _ in range(moving):
+        platform = {'width': 100, 'height': 20, 'speed': round(rng.uniform(0.8, 2.0), 2),
+                    'startOffset': round(rng.uniform(0, 6.28), 2)}
+        if rng.random() < 0.5:
+            platform['moveX'] = rng.randrange(50, 200, 10)
+            platform['y'] = rng.randrange(*PLATFORM_Y_RANGE, 10)
+        else:
+            platform['moveY'] = rng.randrange(40, 100, 10)
+            platform['y'] = rng.randrange(300, 380, 10)
+        reach = platform.get('moveX', 0)
+        platform['x'] = rng.randrange(span[0] + reach, span[1] - reach - platform['width'])
+        level['movingPlatforms'].append(platform)
+
+    for enemy_type in types:
+        for _ in range(enemies):
+            level['enemySpawns'].append({
+                'type': enemy_type,
+                'x': rng.randrange(span[0] + 200, span[1]),
+                'y': rng.randrange(200, 320) if enemy_type in FLYING_TYPES else 420,
+            })
+
+    for _ in range(hazards):
+        level['hazards'].append({
+            'type': 'spike_plant', 'x': rng.randrange(span[0] + 200, span[1] - 60),
+            'y': GROUND_Y - 40, 'width': 60, 'height': 40, 'damage': 1,
+        })
+
+    pickup_types = sorted(PICKUP_TYPES)
+    for i in range(pickups):
+        level['pickups'].append({
+            'type': pickup_types[i % len(pickup_types)],
+            'x': rng.randrange(*span),
+            'y': rng.randrange(200, 460),
+        })
+
+    return level
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a large level pack for runtime benchmarking")
+    parser.add_argument('--id', default='stress', help="level id (pack file name and ?level= value)")
+    parser.add_argument('-o', '--output', default=OUTPUT_DIR, help="level pack directory")
+    parser.add_argument('--width', type=int, default=20000, help="level width in pixels")
+    parser.add_argument('--platforms', type=int, default=500, help="floating platforms (ground not counted)")
+    parser.add_argument('--enemies', type=int, default=20, help="enemies of each type")
+    parser.add_argument('--types', nargs='+', help="enemy types to spawn (default: every non-boss type)")
+    parser.add_argument('--moving', type=int, default=50, help="moving platforms")
+    parser.add_argument('--hazards', type=int, default=50, help="spike plants")
+    parser.add_argument('--pickups', type=int, default=100, help="hearts, stars and crystals")
+    parser.add_argument('--seed', type=int, default=0, help="layout seed")
+    parser.add_argument('--no-chunks', action='store_true', help="skip pre-rendering platform chunks")
+    args = parser.parse_args(argv)
+
+    if args.width < 1000:
+        parser.error("--width must be at least 1000")
+    counts = [args.platforms, args.enemies, args.moving, args.hazards, args.pickups]
+    if min(counts) < 0:
+        parser.error("counts must not be negative")
+    types = args.types or enemy_types()
+    known = load_enemy_types()
+    unknown = [t for t in types if t not in known]
+    if unknown:
+        parser.error(f"unknown enemy type(s): {', '.join(unknown)}")
+
+    level = generate_level(args.width, args.platforms, args.enemies, args.moving,
+                           args.hazards, args.pickups, types, args.seed)
+    errors = validate_level(args.id, level, known)
+    if errors:
+        for error in errors:
+            print(f"  {error}")
+        return 1
+
+    print(f"Generating {args.id} ({args.width}px wide, seed {args.seed})...")
+    os.makedirs(args.output, exist_ok=True)
+    pack = compile_level(args.id, level, chunk_dir=None if args.no_chunks else args.output, merge=False)
+    path = os.path.join(args.output, f"{args.id}.json")
+    write_json(path, pack)
+
+    print(f"  platforms: {len(pack['platforms'])} ({args.platforms} floating + ground)")
+    print(f"  moving platforms: {len(level['movingPlatforms'])}")
+    print(f"  enemies: {len(level['enemySpawns'])} ({args.enemies} x {len(types)} types)")
+    print(f"  hazards: {len(level['hazards'])}, pickups: {len(level['pickups'])}")
+    print(f"\nStress level saved to: {path} ({os.path.getsize(path)} bytes)")
+    print(f"Play it with index.html?level={args.id}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -2,11 +2,20 @@
 Unicorn Player Sprite Generator
 Creates 3 unicorn variants (rainbow, pink, white) with full animations:
 - idle, run, jump, fall, attack, shoot, hurt, death
+
+Usage:
+    python generate_unicorn.py
+    python generate_unicorn.py --timings   # time per stage and variant (see profiling.py)
 """
 
 from PIL import Image
+import argparse
 import os
 
+from frame_pipeline import write_frames
+import profiling
+from profiling import timings
+
 def create_sprite(width, height, pixel_data, palette):
     """Create a sprite from pixel data and color palette."""
     img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
@@ -856,42 +865,57 @@ def apply_rainbow_mane(frame_data, frame_num):
         new_frame.append(new_row)
     return new_frame
 
-def main():
-    os.makedirs('assets/player', exist_ok=True)
-
-    variants = [
-        ('white', get_white_palette()),
-        ('pink', get_pink_palette()),
-        ('rainbow', get_rainbow_palette()),
-    ]
-
-    animations = {
-        'idle': get_idle_frames(),
-        'run': get_run_frames(),
-        'jump': get_jump_frames(),
-        'attack': get_attack_frames(),
-        'shoot': get_shoot_frames(),
-        'hurt': get_hurt_frames(),
-        'death': get_death_frames(),
-    }
-
-    for variant_name, palette in variants:
+ANIMATIONS = [
+    ('idle', get_idle_frames),
+    ('run', get_run_frames),
+    ('jump', get_jump_frames),
+    ('attack', get_attack_frames),
+    ('shoot', get_shoot_frames),
+    ('hurt', get_hurt_frames),
+    ('death', get_death_frames),
+]
+
+VARIANTS = [
+    ('white', get_white_palette),
+    ('pink', get_pink_palette),
+    ('rainbow', get_rainbow_palette),
+]
+
+def unicorn_frames():
+    """Yield (path, image) for every frame, reading one animation's pixel data at a time."""
+    for variant_name, get_palette in VARIANTS:
         print(f"Generating {variant_name} unicorn...")
         os.makedirs(f'assets/player/{variant_name}', exist_ok=True)
-
-        for anim_name, frames in animations.items():
-            for i, frame_data in enumerate(frames):
-                # Apply rainbow mane effect for rainbow variant
-                if variant_name == 'rainbow':
-                    frame_data = apply_rainbow_mane(frame_data, i)
-
-                sprite = create_sprite(32, 32, frame_data, palette)
-                scaled = scale_sprite(sprite, 4)
-                scaled.save(f'assets/player/{variant_name}/{anim_name}_{i}.png')
+        palette = get_palette()
+
+        with timings.entity(variant_name):
+            for anim_name, get_frames in ANIMATIONS:
+                with timings.stage('parse'):
+                    frames = get_frames()
+                for i, frame_data in enumerate(frames):
+                    # Apply rainbow mane effect for rainbow variant
+                    if variant_name == 'rainbow':
+                        with timings.stage('parse'):
+                            frame_data = apply_rainbow_mane(frame_data, i)
+
+                    with timings.stage('rasterize'):
+                        sprite = create_sprite(32, 32, frame_data, palette)
+                    with timings.stage('scale'):
+                        scaled = scale_sprite(sprite, 4)
+                    yield f'assets/player/{variant_name}/{anim_name}_{i}.png', scaled
 
         print(f"  Created: {variant_name}/ (idle, run, jump, attack, shoot, hurt, death)")
 
+def generate_all():
+    os.makedirs('assets/player', exist_ok=True)
+    write_frames(unicorn_frames())
     print("\nAll unicorn sprites generated!")
 
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the three unicorn player variants")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    profiling.run(args, generate_all)
+
 if __name__ == '__main__':
     main()
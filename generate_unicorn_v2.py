@@ -5,11 +5,20 @@ Generate proper unicorn sprites with clear unicorn features:
 - Flowing mane and tail
 - Four legs
 - Cute eye
+
+Usage:
+    python generate_unicorn_v2.py
+    python generate_unicorn_v2.py --timings   # time per stage and variant (see profiling.py)
 """
 
 from PIL import Image, ImageDraw
+import argparse
 import os
 
+from frame_pipeline import write_frames
+import profiling
+from profiling import timings
+
 # Output size (will be scaled up 4x from 32x32 base)
 BASE_SIZE = 32
 SCALE = 4
@@ -17,23 +26,25 @@ OUTPUT_SIZE = BASE_SIZE * SCALE
 
 def create_unicorn_frame(variant, frame_data, base_size=32):
     """Create a single unicorn frame from pixel data"""
-    img = Image.new('RGBA', (base_size, base_size), (0, 0, 0, 0))
-    pixels = img.load()
+    with timings.stage('rasterize'):
+        img = Image.new('RGBA', (base_size, base_size), (0, 0, 0, 0))
+        pixels = img.load()
 
-    palette = frame_data['palette']
-    pixel_data = frame_data['pixels']
+        palette = frame_data['palette']
+        pixel_data = frame_data['pixels']
 
-    for y, row in enumerate(pixel_data):
-        if y >= base_size:
-            break
-        for x, char in enumerate(row):
-            if x >= base_size:
+        for y, row in enumerate(pixel_data):
+            if y >= base_size:
                 break
-            if char in palette:
-                pixels[x, y] = palette[char]
+            for x, char in enumerate(row):
+                if x >= base_size:
+                    break
+                if char in palette:
+                    pixels[x, y] = palette[char]
 
     # Scale up 4x with nearest neighbor for pixel art look
-    return img.resize((base_size * SCALE, base_size * SCALE), Image.NEAREST)
+    with timings.stage('scale'):
+        return img.resize((base_size * SCALE, base_size * SCALE), Image.NEAREST)
 
 def get_unicorn_palettes():
     """Get color palettes for different unicorn variants"""
@@ -1015,69 +1026,46 @@ def get_death_frames(variant):
 
     return [frame1, frame2, frame3]
 
-def generate_all_unicorn_sprites():
-    """Generate all unicorn sprites for all variants"""
-    variants = ['white', 'pink', 'rainbow']
-
-    base_dir = "assets/player"
+VARIANTS = ['white', 'pink', 'rainbow']
+ANIMATIONS = [
+    ('idle', get_idle_frames),
+    ('run', get_run_frames),
+    ('jump', get_jump_frames),
+    ('attack', get_attack_frames),
+    ('shoot', get_shoot_frames),
+    ('hurt', get_hurt_frame),
+    ('death', get_death_frames),
+]
 
-    for variant in variants:
+def unicorn_frames(base_dir):
+    """Yield (path, image) for every frame, one animation's pixel data at a time"""
+    for variant in VARIANTS:
         variant_dir = os.path.join(base_dir, variant)
         os.makedirs(variant_dir, exist_ok=True)
 
         print(f"Generating {variant} unicorn...")
 
-        # Generate idle
-        idle_frames = get_idle_frames(variant)
-        for i, frame_data in enumerate(idle_frames):
-            img = create_unicorn_frame(variant, frame_data)
-            img.save(os.path.join(variant_dir, f"idle_{i}.png"))
-        print(f"  - {len(idle_frames)} idle frames")
-
-        # Generate run
-        run_frames = get_run_frames(variant)
-        for i, frame_data in enumerate(run_frames):
-            img = create_unicorn_frame(variant, frame_data)
-            img.save(os.path.join(variant_dir, f"run_{i}.png"))
-        print(f"  - {len(run_frames)} run frames")
-
-        # Generate jump
-        jump_frames = get_jump_frames(variant)
-        for i, frame_data in enumerate(jump_frames):
-            img = create_unicorn_frame(variant, frame_data)
-            img.save(os.path.join(variant_dir, f"jump_{i}.png"))
-        print(f"  - {len(jump_frames)} jump frames")
-
-        # Generate attack
-        attack_frames = get_attack_frames(variant)
-        for i, frame_data in enumerate(attack_frames):
-            img = create_unicorn_frame(variant, frame_data)
-            img.save(os.path.join(variant_dir, f"attack_{i}.png"))
-        print(f"  - {len(attack_frames)} attack frames")
+        with timings.entity(variant):
+            for anim_name, get_frames in ANIMATIONS:
+                with timings.stage('parse'):
+                    frames = get_frames(variant)
+                for i, frame_data in enumerate(frames):
+                    img = create_unicorn_frame(variant, frame_data)
+                    yield os.path.join(variant_dir, f"{anim_name}_{i}.png"), img
+                print(f"  - {len(frames)} {anim_name} frames")
 
-        # Generate shoot
-        shoot_frames = get_shoot_frames(variant)
-        for i, frame_data in enumerate(shoot_frames):
-            img = create_unicorn_frame(variant, frame_data)
-            img.save(os.path.join(variant_dir, f"shoot_{i}.png"))
-        print(f"  - {len(shoot_frames)} shoot frames")
-
-        # Generate hurt
-        hurt_frames = get_hurt_frame(variant)
-        for i, frame_data in enumerate(hurt_frames):
-            img = create_unicorn_frame(variant, frame_data)
-            img.save(os.path.join(variant_dir, f"hurt_{i}.png"))
-        print(f"  - {len(hurt_frames)} hurt frames")
+        print(f"  Done! Saved to {variant_dir}/")
 
-        # Generate death
-        death_frames = get_death_frames(variant)
-        for i, frame_data in enumerate(death_frames):
-            img = create_unicorn_frame(variant, frame_data)
-            img.save(os.path.join(variant_dir, f"death_{i}.png"))
-        print(f"  - {len(death_frames)} death frames")
+def generate_all_unicorn_sprites():
+    """Generate all unicorn sprites for all variants"""
+    write_frames(unicorn_frames("assets/player"))
 
-        print(f"  Done! Saved to {variant_dir}/")
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the three unicorn player variants (v2 art)")
+    profiling.add_arguments(parser)
+    args = parser.parse_args(argv)
+    profiling.run(args, generate_all_unicorn_sprites)
+    print("\nAll unicorn sprites generated successfully!")
 
 if __name__ == "__main__":
-    generate_all_unicorn_sprites()
-    print("\nAll unicorn sprites generated successfully!")
+    main()
@@ -0,0 +1,115 @@
+// Bitmap font rendering from the glyph atlas baked by bake_font.py
+// Each (text, font, colour) string is laid out once into a cached canvas and
+// then drawn with a single drawImage instead of strokeText + fillText.
+
+const BitmapFont = {
+    image: null,
+    fonts: null,
+    outlineOffset: 0,
+    cache: new Map(),
+    maxCached: 256,
+
+    async load() {
+        const entry = await AssetManifest.get('fonts');
+        if (!entry) return;
+        try {
+            const response = await fetch(AssetManifest.basePath + entry.metrics);
+            const metrics = await response.json();
+            this.image = await Utils.loadImage(AssetManifest.basePath + entry.file);
+            this.outlineOffset = metrics.outlineOffset;
+            this.fonts = metrics.fonts;
+        } catch (e) {
+            console.warn('Failed to load bitmap font atlas:', e);
+        }
+    },
+
+    // Advance width of a string, or null if the font/glyphs were not baked
+    measure(text, font) {
+        const metrics = this.fonts && this.fonts[font];
+        if (!metrics) return null;
+
+        let width = 0;
+        for (let i = 0; i < text.length; i++) {
+            const glyph = metrics.glyphs[text[i]];
+            if (!glyph) return null;
+            width += glyph[6];
+            if (i > 0) width += metrics.kerning[text[i - 1] + text[i]] || 0;
+        }
+        return width;
+    },
+
+    // Lay out a string into a canvas (outline underneath, tinted fill on top)
+    render(text, font, color, outline) {
+        const metrics = this.fonts[font];
+        const width = this.measure(text, font);
+        if (width === null) return null;
+
+        // Glyph boxes can overhang the pen position on either side
+        const positions = [];
+        let penX = 0;
+        let minX = 0;
+        let maxX = width;
+        for (let i = 0; i < text.length; i++) {
+            if (i > 0) penX += metrics.kerning[text[i - 1] + text[i]] || 0;
+            const glyph = metrics.glyphs[text[i]];
+            positions.push(penX);
+            minX = Math.min(minX, penX + glyph[4]);
+            maxX = Math.max(maxX, penX + glyph[4] + glyph[2]);
+            penX += glyph[6];
+        }
+
+        const canvas = document.createElement('canvas');
+        canvas.width = Math.max(1, Math.ceil(maxX - minX));
+        canvas.height = metrics.ascent + metrics.descent;
+        const ctx = canvas.getContext('2d');
+
+        const blit = (target, yOffset) => {
+            for (let i = 0; i < text.length; i++) {
+                const [gx, gy, gw, gh, ox, oy] = metrics.glyphs[text[i]];
+                target.drawImage(
+                    this.image, gx, gy + yOffset, gw, gh,
+                    Math.round(positions[i] + ox - minX), metrics.ascent + oy, gw, gh
+                );
+            }
+        };
+
+        // Fill glyphs are white: tint them on a scratch canvas first
+        const fill = document.createElement('canvas');
+        fill.width = canvas.width;
+        fill.height = canvas.height;
+        const fillCtx = fill.getContext('2d');
+        blit(fillCtx, 0);
+        fillCtx.globalCompositeOperation = 'source-in';
+        fillCtx.fillStyle = color;
+        fillCtx.fillRect(0, 0, fill.width, fill.height);
+
+        if (outline) blit(ctx, this.outlineOffset);
+        ctx.drawImage(fill, 0, 0);
+
+        return { canvas, width, left: minX, ascent: metrics.ascent };
+    },
+
+    // Draw like fillText (plus strokeText when outline is set) with the
+    // baseline at y. Returns false if the font is not baked so the caller
+    // can fall back to canvas text.
+    draw(ctx, text, x, y, font, color, align = 'left', outline = true) {
+        if (!this.fonts || !this.fonts[font]) return false;
+
+        const key = `${font}|${color}|${outline ? 1 : 0}|${text}`;
+        let entry = this.cache.get(key);
+        if (entry === undefined) {
+            entry = this.render(text, font, color, outline);
+            this.cache.set(key, entry);
+            if (this.cache.size > this.maxCached) {
+                this.cache.delete(this.cache.keys().next().value);
+            }
+        }
+        if (!entry) return false;
+
+        let drawX = x + entry.left;
+        if (align === 'center') drawX -= entry.width / 2;
+        else if (align === 'right' || align === 'end') drawX -= entry.width;
+        ctx.drawImage(entry.canvas, Math.round(drawX), Math.round(y - entry.ascent));
+        return true;
+    }
+};
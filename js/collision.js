@@ -1,6 +1,86 @@
 // Collision detection and handling
 
+// Per-frame tight bounding boxes and 1-bit masks built by collision_masks.py.
+// SpriteLoader attaches them to loaded frames as frame.collision.
+const CollisionMasks = {
+    promise: null,
+
+    load() {
+        if (!this.promise) {
+            this.promise = AssetManifest.get('collision')
+                .then(async (entry) => {
+                    if (!entry) return { cellSize: 1, sprites: {} };
+                    const response = await fetch(AssetManifest.basePath + entry.file);
+                    return await response.json();
+                })
+                .catch(() => ({ cellSize: 1, sprites: {} }));
+        }
+        return this.promise;
+    },
+
+    // Decoded collision data for each frame of an image, or null if not built
+    async forImage(path) {
+        const data = await this.load();
+        const entry = data.sprites[path];
+        if (!entry) return null;
+
+        return entry.frames.map(frame => {
+            const result = {
+                frameWidth: entry.frameWidth,
+                frameHeight: entry.frameHeight,
+                bbox: frame.bbox,
+                cellSize: data.cellSize
+            };
+            if (frame.bbox) {
+                const raw = atob(frame.mask);
+                result.cols = frame.cols;
+                result.bits = new Uint8Array(raw.length);
+                for (let i = 0; i < raw.length; i++) result.bits[i] = raw.charCodeAt(i);
+            }
+            return result;
+        });
+    }
+};
+
 const Collision = {
+    // Precise test for a rect already known to intersect the sprite's hitbox:
+    // checks the current frame's mask cells under the rect. Frames without
+    // mask data keep the rect result.
+    maskOverlaps(sprite, rect) {
+        const frame = sprite.getCurrentFrame();
+        const data = frame && frame.collision;
+        if (!data) return true;
+        if (!data.bbox) return false;
+
+        // Rect in frame pixels, mirrored when the sprite is drawn flipped
+        const scaleX = sprite.width / data.frameWidth;
+        const scaleY = sprite.height / data.frameHeight;
+        let left = (rect.x - sprite.x) / scaleX;
+        let right = (rect.x + rect.width - sprite.x) / scaleX;
+        if (sprite.spriteFacesLeft ? sprite.facingRight : !sprite.facingRight) {
+            [left, right] = [data.frameWidth - right, data.frameWidth - left];
+        }
+        const top = (rect.y - sprite.y) / scaleY;
+        const bottom = (rect.y + rect.height - sprite.y) / scaleY;
+
+        // Clip to the tight alpha box first
+        const [bx, by, bw, bh] = data.bbox;
+        const x0 = Math.max(left, bx), x1 = Math.min(right, bx + bw);
+        const y0 = Math.max(top, by), y1 = Math.min(bottom, by + bh);
+        if (x0 >= x1 || y0 >= y1) return false;
+
+        const cell = data.cellSize;
+        const colEnd = Math.ceil(x1 / cell);
+        const rowEnd = Math.ceil(y1 / cell);
+        for (let row = Math.floor(y0 / cell); row < rowEnd; row++) {
+            for (let col = Math.floor(x0 / cell); col < colEnd; col++) {
+                const bit = row * data.cols + col;
+                if (data.bits[bit >> 3] & (0x80 >> (bit & 7))) return true;
+            }
+        }
+        return false;
+    },
+
     // Check player vs enemies (attack-based damage only, no contact damage)
     checkPlayerEnemyCollisions(player, enemies) {
         if (player.isDead || player.invincible) return;
@@ -49,7 +129,8 @@ const Collision = {
                 };
 
                 // Also check body collision for flying bosses (swoops/dives)
-                const bodyHit = enemy.flying && Utils.rectIntersect(playerHitbox, enemyHitbox);
+                const bodyHit = enemy.flying && Utils.rectIntersect(playerHitbox, enemyHitbox) &&
+                    this.maskOverlaps(enemy, playerHitbox);
 
                 if (bodyHit || Utils.rectIntersect(playerHitbox, attackRange)) {
                     if (player.hasShield) {
@@ -81,7 +162,7 @@ const Collision = {
 
             const enemyHitbox = enemy.getHitbox();
 
-            if (Utils.rectIntersect(meleeHitbox, enemyHitbox)) {
+            if (Utils.rectIntersect(meleeHitbox, enemyHitbox) && this.maskOverlaps(enemy, meleeHitbox)) {
                 enemy.takeDamage(player.meleeDamage, true);
                 hitEnemies.push(enemy);
 
@@ -118,7 +199,7 @@ const Collision = {
 
                 const enemyHitbox = enemy.getHitbox();
 
-                if (Utils.rectIntersect(projBounds, enemyHitbox)) {
+                if (Utils.rectIntersect(projBounds, enemyHitbox) && this.maskOverlaps(enemy, projBounds)) {
                     enemy.takeDamage(projectile.damage);
                     projectile.markedForRemoval = true;
                     results.push({ enemy, projectile });
@@ -157,7 +238,7 @@ const Collision = {
 
             const projBounds = projectile.getBounds();
 
-            if (Utils.rectIntersect(projBounds, playerHitbox)) {
+            if (Utils.rectIntersect(projBounds, playerHitbox) && this.maskOverlaps(player, projBounds)) {
                 // Check if player has shield
                 if (player.hasShield) {
                     player.hasShield = false;
@@ -184,12 +265,12 @@ const Collision = {
         return results;
     },
 
-    // Check projectiles vs platforms
-    checkProjectilePlatformCollisions(projectiles, platforms) {
+    // Check projectiles vs platforms (static ones via the level's spatial index)
+    checkProjectilePlatformCollisions(projectiles, level) {
         for (const projectile of projectiles) {
             const projBounds = projectile.getBounds();
 
-            for (const platform of platforms) {
+            for (const platform of level.getPlatformsNear(projBounds)) {
                 if (Utils.rectIntersect(projBounds, platform)) {
                     projectile.markedForRemoval = true;
                     break;
@@ -148,11 +148,31 @@ const ScreenEffects = {
 };
 
 // High Score Manager
+// Uses the shared leaderboard served by run_game.py (/api/scores), falling
+// back to localStorage when there is no server. The list is kept in memory,
+// highest first, so the checks made during play never touch storage.
 const HighScoreManager = {
     STORAGE_KEY: 'retrocorn_highscores',
+    endpoint: 'api/scores',
     maxScores: 10,
+    scores: [],
+    useServer: false,
 
-    getScores() {
+    async load() {
+        try {
+            const response = await fetch(this.endpoint, { cache: 'no-store' });
+            if (response.ok) {
+                this.scores = (await response.json()).scores;
+                this.useServer = true;
+                return;
+            }
+        } catch (e) {
+            // No leaderboard server - use localStorage
+        }
+        this.scores = this.loadLocal();
+    },
+
+    loadLocal() {
         try {
             const data = localStorage.getItem(this.STORAGE_KEY);
             return data ? JSON.parse(data) : [];
@@ -161,41 +181,51 @@ const HighScoreManager = {
         }
     },
 
+    getScores() {
+        return this.scores;
+    },
+
     addScore(score, name = 'Player') {
-        const scores = this.getScores();
-        scores.push({
+        // Insert after any equal scores, like the stable sort it replaces
+        let index = this.scores.findIndex(entry => entry.score < score);
+        if (index === -1) index = this.scores.length;
+        this.scores.splice(index, 0, {
             score: score,
             name: name,
             date: new Date().toISOString()
         });
 
-        // Sort by score descending
-        scores.sort((a, b) => b.score - a.score);
-
         // Keep only top scores
-        scores.splice(this.maxScores);
-
-        try {
-            localStorage.setItem(this.STORAGE_KEY, JSON.stringify(scores));
-        } catch (e) {
-            console.warn('Could not save high score');
+        this.scores.splice(this.maxScores);
+
+        if (this.useServer) {
+            fetch(this.endpoint, {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ name: name, score: score })
+            }).catch(() => console.warn('Could not submit high score'));
+        } else {
+            try {
+                localStorage.setItem(this.STORAGE_KEY, JSON.stringify(this.scores));
+            } catch (e) {
+                console.warn('Could not save high score');
+            }
         }
 
-        return scores;
+        return this.scores;
     },
 
     isHighScore(score) {
-        const scores = this.getScores();
-        if (scores.length < this.maxScores) return true;
-        return score > scores[scores.length - 1].score;
+        if (this.scores.length < this.maxScores) return true;
+        return score > this.scores[this.scores.length - 1].score;
     },
 
     getHighScore() {
-        const scores = this.getScores();
-        return scores.length > 0 ? scores[0].score : 0;
+        return this.scores.length > 0 ? this.scores[0].score : 0;
     },
 
     clearScores() {
+        this.scores = [];
         try {
             localStorage.removeItem(this.STORAGE_KEY);
         } catch (e) {
@@ -227,6 +257,55 @@ const GameStats = {
     }
 };
 
+// Frame-time telemetry - samples are batched and POSTed to run_game.py,
+// then summarized offline by analyze_telemetry.py
+const Telemetry = {
+    endpoint: 'api/telemetry',
+    enabled: true,
+    batchSize: 300,  // ~5 seconds at 60 fps
+    samples: [],
+    session: Math.random().toString(36).slice(2, 10),
+
+    // frameMs: time since the previous frame, workMs: update + draw time
+    record(frameMs, workMs, game) {
+        if (!this.enabled) return;
+        this.samples.push({
+            t: Math.round(performance.now()),
+            frame: Math.round(frameMs * 100) / 100,
+            work: Math.round(workMs * 100) / 100,
+            state: game.state,
+            level: game.levelNames[game.currentLevelIndex] || null,
+            enemies: game.enemies.length,
+            projectiles: game.projectiles.length,
+            particles: ParticleSystem.particles.length
+        });
+        if (this.samples.length >= this.batchSize) {
+            this.flush();
+        }
+    },
+
+    flush(beacon = false) {
+        if (!this.enabled || this.samples.length === 0) return;
+        const body = JSON.stringify({ session: this.session, samples: this.samples });
+        this.samples = [];
+
+        if (beacon && navigator.sendBeacon) {
+            navigator.sendBeacon(this.endpoint, body);
+            return;
+        }
+        fetch(this.endpoint, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: body
+        }).then(response => {
+            // Served by something other than run_game.py - stop sending
+            if (!response.ok) this.enabled = false;
+        }).catch(() => {
+            this.enabled = false;
+        });
+    }
+};
+
 // Floating Text System - shows temporary messages on screen
 const FloatingText = {
     texts: [],
@@ -304,11 +383,8 @@ const FloatingText = {
                 drawY -= cameraY;
             }
 
-            if (t.large) {
-                ctx.font = 'bold 36px sans-serif';
-            } else {
-                ctx.font = 'bold 18px sans-serif';
-            }
+            const font = t.large ? 'bold 36px sans-serif' : 'bold 18px sans-serif';
+            ctx.font = font;
 
             if (t.centered) {
                 ctx.textAlign = 'center';
@@ -319,37 +395,33 @@ const FloatingText = {
                     const time = Date.now() / 1000;
                     const text = t.text;
                     // Measure full text to center it
-                    const fullWidth = ctx.measureText(text).width;
+                    const fullWidth = this.measure(ctx, text, font);
                     let charX = drawX - fullWidth / 2;
                     ctx.textAlign = 'left';
                     for (let ci = 0; ci < text.length; ci++) {
                         const colorIdx = Math.floor((ci + time * 4) % rainbowColors.length);
-                        ctx.fillStyle = rainbowColors[(colorIdx + rainbowColors.length) % rainbowColors.length];
-                        ctx.strokeText(text[ci], charX, drawY);
-                        ctx.fillText(text[ci], charX, drawY);
-                        charX += ctx.measureText(text[ci]).width;
+                        const color = rainbowColors[(colorIdx + rainbowColors.length) % rainbowColors.length];
+                        this.drawOutlined(ctx, text[ci], charX, drawY, font, color);
+                        charX += this.measure(ctx, text[ci], font);
                     }
                 } else {
                     // Draw with outline
-                    ctx.strokeText(t.text, drawX, drawY);
-                    ctx.fillText(t.text, drawX, drawY);
+                    this.drawOutlined(ctx, t.text, drawX, drawY, font, t.color);
                 }
 
                 // Draw subtext if present
                 if (t.subtext) {
-                    ctx.font = '20px sans-serif';
-                    ctx.fillStyle = '#ffffff';
                     ctx.textAlign = 'center';
-                    ctx.strokeText(t.subtext, drawX, drawY + 30);
-                    ctx.fillText(t.subtext, drawX, drawY + 30);
+                    this.drawOutlined(ctx, t.subtext, drawX, drawY + 30, '20px sans-serif', '#ffffff');
                 }
             } else if (t.villainBubble) {
                 // Dark speech bubble style
-                ctx.font = 'bold 15px sans-serif';
-                const metrics = ctx.measureText(t.text);
+                const bubbleFont = 'bold 15px sans-serif';
+                ctx.font = bubbleFont;
+                const textWidth = this.measure(ctx, t.text, bubbleFont);
                 const padX = 20;
                 const padY = 14;
-                const bw = metrics.width + padX * 2;
+                const bw = textWidth + padX * 2;
                 const bh = 20 + padY * 2;
                 const bx = drawX;
                 const by = drawY - padY - 4;
@@ -374,23 +446,36 @@ const FloatingText = {
 
                 // Text centered in bubble
                 ctx.textAlign = 'center';
-                ctx.fillStyle = t.color;
                 ctx.strokeStyle = '#000000';
                 ctx.lineWidth = 3;
                 const textX = bx - bw / 2 - 8;
                 const textY = by + bh / 2 + 5;
-                ctx.strokeText(t.text, textX, textY);
-                ctx.fillText(t.text, textX, textY);
+                this.drawOutlined(ctx, t.text, textX, textY, bubbleFont, t.color);
             } else {
                 ctx.textAlign = 'center';  // Center pickup text too
-                ctx.strokeText(t.text, drawX, drawY);
-                ctx.fillText(t.text, drawX, drawY);
+                this.drawOutlined(ctx, t.text, drawX, drawY, font, t.color);
             }
 
             ctx.restore();
         }
     },
 
+    // Outlined text at ctx.textAlign: baked glyphs if available, else stroke + fill
+    drawOutlined(ctx, text, x, y, font, color) {
+        if (BitmapFont.draw(ctx, text, x, y, font, color, ctx.textAlign)) return;
+        ctx.font = font;
+        ctx.fillStyle = color;
+        ctx.strokeText(text, x, y);
+        ctx.fillText(text, x, y);
+    },
+
+    measure(ctx, text, font) {
+        const width = BitmapFont.measure(text, font);
+        if (width !== null) return width;
+        ctx.font = font;
+        return ctx.measureText(text).width;
+    },
+
     // Villain speech bubble - dark bubble in upper right
     addVillainBubble(text, duration = 5) {
         this.texts.push({
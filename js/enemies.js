@@ -106,7 +106,7 @@ class Enemy extends Sprite {
         this.x += this.vx * deltaTime;
 
         let hitbox = this.getHitbox();
-        for (const platform of level.platforms) {
+        for (const platform of level.queryStatic('platforms', hitbox)) {
             if (this.rectIntersect(hitbox, platform)) {
                 if (this.vx > 0) {
                     this.x = platform.x - this.hitboxWidth - this.hitboxOffsetX;
@@ -123,7 +123,7 @@ class Enemy extends Sprite {
         this.y += this.vy * deltaTime;
 
         hitbox = this.getHitbox();
-        for (const platform of level.platforms) {
+        for (const platform of level.queryStatic('platforms', hitbox)) {
             if (this.rectIntersect(hitbox, platform)) {
                 if (this.vy > 0) {
                     this.y = platform.y - this.hitboxHeight - this.hitboxOffsetY;
@@ -1834,10 +1834,13 @@ class Pyromancer extends Boss {
             ctx.globalAlpha = 0.5 + Math.sin(Date.now() * 0.02) * 0.3;
         }
 
-        // Attack glow effect
+        // Attack glow effect - baked glow sprite behind the body, else shadowBlur
         if (this.isAttacking && !this.isDead) {
-            ctx.shadowColor = '#ff4400';
-            ctx.shadowBlur = 20;
+            const glowRadius = Math.max(this.width, this.height) / 2 + 20;
+            if (!ParticleAtlas.draw(ctx, 'glow', '#ff4400', drawX + this.width / 2, drawY + this.height / 2, glowRadius)) {
+                ctx.shadowColor = '#ff4400';
+                ctx.shadowBlur = 20;
+            }
         }
 
         // Draw static sprite directly - no animation involved
@@ -23,7 +23,8 @@ class Game {
 
         // Level progression
         this.currentLevelIndex = 0;
-        this.levelNames = LEVEL_ORDER;
+        this.levelNames = [];
+        this.levelIndex = { order: [], levels: {} };  // names for the level select, from LevelPacks
 
         // Character selection
         this.selectedCharacter = 'rainbow';
@@ -91,8 +92,27 @@ class Game {
         UI.init();
         SoundManager.init();
 
-        // Load projectile sprites
+        // Load projectile sprites and the baked particle/font atlases
         await Projectile.loadSprites();
+        await ParticleAtlas.load();
+        await BitmapFont.load();
+        await HighScoreManager.load();
+
+        this.levelIndex = await LevelPacks.loadIndex();
+        this.levelNames = this.levelIndex.order;
+
+        // ?level=<id> plays a single compiled pack, e.g. one written by
+        // generate_stress_level.py
+        const requestedLevel = new URLSearchParams(window.location.search).get('level');
+        if (requestedLevel) {
+            const data = await LevelPacks.load(requestedLevel);
+            if (data) {
+                this.levelIndex.levels[requestedLevel] = { name: data.name, isBossLevel: !!data.isBossLevel };
+                this.levelNames = [requestedLevel];
+            } else {
+                console.warn(`Level "${requestedLevel}" not found, playing the normal order`);
+            }
+        }
 
         // Set up start button
         if (this.startButton) {
@@ -108,7 +128,7 @@ class Game {
         });
 
         // Load first level
-        this.level = createLevel(this.levelNames[0]);
+        this.level = await fetchLevel(this.levelNames[0]);
 
         // Create and load player
         this.player = new Player(
@@ -127,6 +147,8 @@ class Game {
         // Start game loop (but game won't actually play until start is pressed)
         this.lastTime = performance.now();
         requestAnimationFrame(this.gameLoop);
+
+        LiveReload.connect();
     }
 
     showCharacterSelect() {
@@ -214,8 +236,8 @@ class Game {
         this.state = 'loading';
         UI.showLoading();
 
-        // Create level
-        this.level = createLevel(levelName);
+        // Create level (from its compiled pack when available)
+        this.level = await fetchLevel(levelName);
 
         // Reset player position
         this.player.reset(this.level.playerStart.x, this.level.playerStart.y);
@@ -350,7 +372,8 @@ class Game {
     gameLoop(currentTime) {
         try {
             // Calculate delta time
-            this.deltaTime = (currentTime - this.lastTime) / 1000;
+            const frameMs = currentTime - this.lastTime;
+            this.deltaTime = frameMs / 1000;
             this.lastTime = currentTime;
 
             // Cap delta time to prevent huge jumps
@@ -373,6 +396,8 @@ class Game {
 
             // Clear input state
             Input.update();
+
+            Telemetry.record(frameMs, performance.now() - currentTime, this);
         } catch (e) {
             console.error('Game loop error:', e);
         }
@@ -893,7 +918,7 @@ class Game {
         Collision.checkProjectileEnemyCollisions(this.projectiles, this.enemies);
 
         // Projectiles vs platforms (including moving platforms)
-        Collision.checkProjectilePlatformCollisions(this.projectiles, this.level.getAllPlatforms());
+        Collision.checkProjectilePlatformCollisions(this.projectiles, this.level);
 
         // Player attacks vs gems
         this.checkGemCollisions();
@@ -904,7 +929,7 @@ class Game {
 
         const playerHitbox = this.player.getHitbox();
 
-        for (const hazard of this.level.hazards) {
+        for (const hazard of this.level.queryStatic('hazards', playerHitbox)) {
             if (this.rectIntersect(playerHitbox, hazard)) {
                 this.player.takeDamage(hazard.damage || 1);
                 SoundManager.play('hurt');
@@ -1113,7 +1138,7 @@ class Game {
         this.ctx.fillText('SELECT LEVEL', centerX, centerY + 140);
 
         // Level name with arrows
-        const levelData = LEVELS[this.levelNames[this.selectedLevelIndex]];
+        const levelData = this.levelIndex.levels[this.levelNames[this.selectedLevelIndex]];
         const levelDisplayName = `${this.selectedLevelIndex + 1}. ${levelData.name}`;
 
         this.ctx.fillStyle = '#FFFFFF';
@@ -1351,3 +1376,6 @@ window.addEventListener('load', async () => {
     // Make game accessible for debugging
     window.game = game;
 });
+
+// Send whatever telemetry is still queued when the tab goes away
+window.addEventListener('pagehide', () => Telemetry.flush(true));
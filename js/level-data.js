@@ -0,0 +1,538 @@
+// Built-in level data: the source compile_levels.py turns into the
+// per-level packs in build/levels. The game never loads this file up front;
+// LevelPacks injects it only when the compiled packs aren't available.
+
+// Level data - 5 levels with increasing difficulty
+const LEVELS = {
+    // Level 1: Forest Meadow - Tutorial level with basic enemies
+    level1: {
+        name: "Forest Meadow",
+        width: 2400,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 2300, y: 400, width: 80, height: 100 },
+        platforms: [
+            // Main ground sections
+            { x: 0, y: 500, width: 550, height: 100, isGround: true },
+            { x: 650, y: 500, width: 450, height: 100, isGround: true },
+            { x: 1200, y: 500, width: 550, height: 100, isGround: true },
+            { x: 1850, y: 500, width: 550, height: 100, isGround: true },
+
+            // Floating platforms - first area
+            { x: 180, y: 400, width: 120, height: 28 },
+            { x: 400, y: 340, width: 100, height: 28 },
+            { x: 280, y: 260, width: 110, height: 28 },
+
+            // Bridge over gap
+            { x: 570, y: 450, width: 60, height: 28 },
+
+            // Middle area platforms
+            { x: 720, y: 400, width: 100, height: 28 },
+            { x: 900, y: 350, width: 120, height: 28 },
+            { x: 1050, y: 400, width: 100, height: 28 },
+
+            // Second area platforms
+            { x: 1280, y: 400, width: 110, height: 28 },
+            { x: 1450, y: 340, width: 130, height: 28 },
+
+            // Final area
+            { x: 1920, y: 380, width: 120, height: 28 },
+            { x: 2100, y: 300, width: 150, height: 28 },
+        ],
+        enemySpawns: [
+            { type: 'baby_dragon', x: 350, y: 430 },
+            { type: 'baby_dragon', x: 480, y: 430 },
+            { type: 'baby_dragon', x: 750, y: 430 },
+            { type: 'goblin', x: 950, y: 420 },
+            { type: 'baby_dragon', x: 1300, y: 430 },
+            { type: 'goblin', x: 1500, y: 420 },
+            { type: 'baby_dragon', x: 1980, y: 430 },
+        ],
+        pickups: [
+            { type: 'heart', x: 300, y: 220 },
+            { type: 'star', x: 920, y: 300 },
+            { type: 'crystal', x: 2150, y: 250 },
+        ]
+    },
+
+    // Level 2: Gargoyle's Lair - First boss level
+    level2: {
+        name: "Gargoyle's Lair",
+        width: 1600,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 1500, y: 400, width: 80, height: 100 },
+        isBossLevel: true,
+        theme: 'castle',
+        platforms: [
+            // Continuous main arena ground - no holes
+            { x: 0, y: 500, width: 1600, height: 100, isGround: true },
+
+            // Stone platforms for dodging gargoyle swoops
+            { x: 150, y: 400, width: 100, height: 32 },
+            { x: 350, y: 320, width: 120, height: 32 },
+            { x: 550, y: 380, width: 100, height: 32 },
+            { x: 700, y: 280, width: 140, height: 32 },
+            { x: 900, y: 350, width: 120, height: 32 },
+            { x: 1100, y: 400, width: 100, height: 32 },
+            { x: 1250, y: 300, width: 130, height: 32 },
+            { x: 1400, y: 380, width: 100, height: 32 },
+            // Higher platforms for aerial combat
+            { x: 450, y: 200, width: 100, height: 28 },
+            { x: 850, y: 180, width: 120, height: 28 },
+        ],
+        enemySpawns: [
+            { type: 'skeleton', x: 300, y: 430 },
+            { type: 'goblin', x: 600, y: 420 },
+            { type: 'gargoyle', x: 1100, y: 200 }, // Boss
+        ],
+        pickups: [
+            { type: 'heart', x: 770, y: 200 },
+        ]
+    },
+
+    // Level 3: Skeleton Crypt - Ranged enemy focus
+    level3: {
+        name: "Skeleton Crypt",
+        theme: 'crypt',
+        width: 2800,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 2700, y: 400, width: 80, height: 100 },
+        platforms: [
+            // Ground sections with more gaps
+            { x: 0, y: 500, width: 400, height: 100, isGround: true },
+            { x: 500, y: 500, width: 350, height: 100, isGround: true },
+            { x: 950, y: 500, width: 400, height: 100, isGround: true },
+            { x: 1450, y: 500, width: 350, height: 100, isGround: true },
+            { x: 1900, y: 500, width: 400, height: 100, isGround: true },
+            { x: 2400, y: 500, width: 400, height: 100, isGround: true },
+
+            // Multi-level platforms
+            { x: 150, y: 380, width: 100, height: 28 },
+            { x: 300, y: 280, width: 120, height: 28 },
+            { x: 420, y: 420, width: 60, height: 28 },
+
+            { x: 600, y: 380, width: 110, height: 28 },
+            { x: 780, y: 300, width: 100, height: 28 },
+            { x: 870, y: 420, width: 60, height: 28 },
+
+            { x: 1050, y: 380, width: 120, height: 28 },
+            { x: 1200, y: 280, width: 150, height: 28 },
+            { x: 1370, y: 420, width: 60, height: 28 },
+
+            { x: 1550, y: 350, width: 130, height: 28 },
+            { x: 1700, y: 250, width: 120, height: 28 },
+            { x: 1820, y: 420, width: 60, height: 28 },
+
+            { x: 2000, y: 380, width: 100, height: 28 },
+            { x: 2150, y: 300, width: 140, height: 28 },
+            { x: 2320, y: 420, width: 60, height: 28 },
+
+            { x: 2500, y: 350, width: 150, height: 28 },
+            { x: 2650, y: 280, width: 100, height: 28 },
+        ],
+        enemySpawns: [
+            { type: 'skeleton', x: 320, y: 210 },
+            { type: 'goblin', x: 550, y: 420 },
+            { type: 'skeleton', x: 800, y: 230 },
+            { type: 'baby_dragon', x: 1000, y: 430 },
+            { type: 'skeleton', x: 1220, y: 210 },
+            { type: 'goblin', x: 1500, y: 420 },
+            { type: 'skeleton', x: 1720, y: 180 },
+            { type: 'harpy', x: 1950, y: 280 },
+            { type: 'skeleton', x: 2170, y: 230 },
+            { type: 'goblin', x: 2450, y: 420 },
+        ],
+        pickups: [
+            { type: 'heart', x: 800, y: 250 },
+            { type: 'star', x: 1550, y: 290 },
+            { type: 'heart', x: 2170, y: 250 },
+            { type: 'crystal', x: 2670, y: 230 },
+        ]
+    },
+
+    // Level 4: Demon Caves - Flying enemy focus
+    level4: {
+        name: "Demon Caves",
+        theme: 'caves',
+        width: 3000,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 2900, y: 400, width: 80, height: 100 },
+        platforms: [
+            // Ground with large gaps
+            { x: 0, y: 500, width: 350, height: 100, isGround: true },
+            { x: 500, y: 500, width: 300, height: 100, isGround: true },
+            { x: 1000, y: 500, width: 350, height: 100, isGround: true },
+            { x: 1550, y: 500, width: 300, height: 100, isGround: true },
+            { x: 2050, y: 500, width: 400, height: 100, isGround: true },
+            { x: 2600, y: 500, width: 400, height: 100, isGround: true },
+
+            // Vertical platforming sections
+            { x: 200, y: 400, width: 100, height: 28 },
+            { x: 100, y: 300, width: 100, height: 28 },
+            { x: 250, y: 200, width: 100, height: 28 },
+
+            { x: 380, y: 420, width: 80, height: 28 },
+            { x: 420, y: 340, width: 80, height: 28 },
+
+            { x: 600, y: 380, width: 100, height: 28 },
+            { x: 750, y: 280, width: 120, height: 28 },
+            { x: 880, y: 380, width: 80, height: 28 },
+
+            { x: 1100, y: 380, width: 100, height: 28 },
+            { x: 1250, y: 280, width: 150, height: 28 },
+            { x: 1420, y: 350, width: 80, height: 28 },
+
+            { x: 1600, y: 380, width: 100, height: 28 },
+            { x: 1750, y: 280, width: 120, height: 28 },
+            { x: 1900, y: 350, width: 100, height: 28 },
+
+            { x: 2150, y: 380, width: 120, height: 28 },
+            { x: 2300, y: 280, width: 140, height: 28 },
+            { x: 2480, y: 350, width: 80, height: 28 },
+
+            { x: 2700, y: 380, width: 100, height: 28 },
+            { x: 2850, y: 300, width: 100, height: 28 },
+        ],
+        enemySpawns: [
+            { type: 'imp', x: 200, y: 250 },
+            { type: 'flying_eye', x: 350, y: 300 },
+            { type: 'goblin', x: 550, y: 420 },
+            { type: 'imp', x: 780, y: 200 },
+            { type: 'harpy', x: 950, y: 320 },
+            { type: 'skeleton', x: 1050, y: 430 },
+            { type: 'imp', x: 1280, y: 200 },
+            { type: 'flying_eye', x: 1500, y: 300 },
+            { type: 'goblin', x: 1600, y: 420 },
+            { type: 'imp', x: 1780, y: 200 },
+            { type: 'skeleton', x: 2100, y: 430 },
+            { type: 'harpy', x: 2250, y: 250 },
+            { type: 'imp', x: 2500, y: 280 },
+            { type: 'goblin', x: 2650, y: 420 },
+        ],
+        pickups: [
+            { type: 'heart', x: 270, y: 150 },
+            { type: 'star', x: 780, y: 230 },
+            { type: 'heart', x: 1280, y: 230 },
+            { type: 'star', x: 1780, y: 230 },
+            { type: 'heart', x: 2330, y: 230 },
+            { type: 'crystal', x: 2870, y: 250 },
+        ]
+    },
+
+    // Level 5: Demon Lord's Throne - Final Boss level
+    level5: {
+        name: "Demon Lord's Throne",
+        width: 1800,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 1700, y: 400, width: 80, height: 100 },
+        isBossLevel: true,
+        isFinalLevel: true,
+        theme: 'demon_throne',
+        bossType: 'demon_lord',
+        bossName: 'DEMON LORD',
+        bossSubtitle: '"Horns are SO overrated"',
+        platforms: [
+            // Arena ground
+            { x: 0, y: 500, width: 500, height: 100, isGround: true },
+            { x: 600, y: 500, width: 600, height: 100, isGround: true },
+            { x: 1300, y: 500, width: 500, height: 100, isGround: true },
+
+            // Elevated platforms for strategy
+            { x: 150, y: 380, width: 120, height: 28 },
+            { x: 350, y: 280, width: 100, height: 28 },
+
+            { x: 520, y: 420, width: 60, height: 28 },
+
+            { x: 700, y: 350, width: 150, height: 28 },
+            { x: 900, y: 250, width: 180, height: 28 },
+            { x: 1050, y: 350, width: 150, height: 28 },
+
+            { x: 1220, y: 420, width: 60, height: 28 },
+
+            { x: 1400, y: 380, width: 120, height: 28 },
+            { x: 1550, y: 280, width: 100, height: 28 },
+        ],
+        hasBossIntro: true,  // Boss spawns via intro sequence, not at start
+        enemySpawns: [
+            { type: 'imp', x: 300, y: 360 },
+            { type: 'imp', x: 500, y: 360 },
+            { type: 'imp', x: 1200, y: 360 },
+            { type: 'imp', x: 1450, y: 360 },
+        ],
+        pickups: [
+            { type: 'heart', x: 370, y: 230 },
+            { type: 'heart', x: 970, y: 200 },
+            { type: 'heart', x: 1570, y: 230 },
+        ]
+    },
+
+    // Pre-boss level 6a: Labyrinth Entrance - Lizardman enemies
+    level6a: {
+        name: "Labyrinth Entrance",
+        width: 2000,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 1900, y: 400, width: 80, height: 100 },
+        theme: 'labyrinth',
+        platforms: [
+            { x: 0, y: 500, width: 2000, height: 100, isGround: true },
+        ],
+        hazards: [
+            { type: 'spike_plant', x: 350, y: 460, width: 60, height: 40, damage: 1 },
+            { type: 'spike_plant', x: 800, y: 460, width: 55, height: 40, damage: 1 },
+            { type: 'spike_plant', x: 1250, y: 460, width: 60, height: 40, damage: 1 },
+            { type: 'spike_plant', x: 1650, y: 460, width: 55, height: 40, damage: 1 },
+        ],
+        enemySpawns: [
+            { type: 'lizardman', x: 300, y: 420 },
+            { type: 'lizardman', x: 550, y: 420 },
+            { type: 'lizardman', x: 900, y: 420 },
+            { type: 'lizardman', x: 1200, y: 420 },
+            { type: 'lizardman', x: 1500, y: 420 },
+            { type: 'lizardman', x: 1750, y: 420 },
+        ],
+        pickups: [
+            { type: 'heart', x: 450, y: 450 },
+            { type: 'star', x: 750, y: 450 },
+            { type: 'heart', x: 1100, y: 450 },
+            { type: 'star', x: 1400, y: 450 },
+            { type: 'heart', x: 1650, y: 450 },
+        ]
+    },
+
+    // Level 6: Minotaur's Labyrinth - Boss level (flat bridge arena)
+    level6: {
+        name: "Minotaur's Labyrinth",
+        width: 2000,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 1900, y: 400, width: 80, height: 100 },
+        isBossLevel: true,
+        theme: 'labyrinth',
+        bossType: 'minotaur',
+        bossName: 'MINOTAUR',
+        bossSubtitle: '"At least MY horn is useful"',
+        hasBossIntro: true,
+        platforms: [
+            // Single flat bridge - no gaps, no elevated platforms
+            { x: 0, y: 500, width: 2000, height: 100, isGround: true },
+        ],
+        hazards: [
+            // Spike plants reduced by half (4 instead of 8)
+            { type: 'spike_plant', x: 350, y: 460, width: 60, height: 40, damage: 1 },
+            { type: 'spike_plant', x: 800, y: 460, width: 55, height: 40, damage: 1 },
+            { type: 'spike_plant', x: 1250, y: 460, width: 60, height: 40, damage: 1 },
+            { type: 'spike_plant', x: 1650, y: 460, width: 55, height: 40, damage: 1 },
+        ],
+        enemySpawns: [
+            // No regular enemies - just the Minotaur boss
+        ],
+        pickups: [
+            { type: 'heart', x: 550, y: 450 },
+            { type: 'heart', x: 1000, y: 450 },
+            { type: 'heart', x: 1450, y: 450 },
+        ]
+    },
+
+    // Pre-boss level 7a: Graveyard Path - Skeleton enemies
+    level7a: {
+        name: "Graveyard Path",
+        width: 2200,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 2100, y: 400, width: 80, height: 100 },
+        theme: 'graveyard',
+        platforms: [
+            { x: 0, y: 500, width: 2200, height: 100, isGround: true },
+            { x: 100, y: 380, width: 100, height: 28 },
+            { x: 300, y: 300, width: 110, height: 28 },
+            { x: 550, y: 350, width: 120, height: 28 },
+            { x: 780, y: 280, width: 140, height: 28 },
+            { x: 1050, y: 330, width: 130, height: 28 },
+            { x: 1280, y: 260, width: 160, height: 28 },
+            { x: 1500, y: 330, width: 130, height: 28 },
+            { x: 1750, y: 280, width: 140, height: 28 },
+            { x: 2000, y: 350, width: 100, height: 28 },
+        ],
+        enemySpawns: [
+            { type: 'skeleton', x: 200, y: 430 },
+            { type: 'skeleton', x: 450, y: 430 },
+            { type: 'skeleton', x: 700, y: 430 },
+            { type: 'skeleton', x: 950, y: 430 },
+            { type: 'skeleton', x: 1200, y: 430 },
+            { type: 'skeleton', x: 1450, y: 430 },
+            { type: 'skeleton', x: 1700, y: 430 },
+            { type: 'skeleton', x: 1950, y: 430 },
+        ],
+        pickups: [
+            { type: 'heart', x: 340, y: 250 },
+            { type: 'star', x: 830, y: 230 },
+            { type: 'heart', x: 1340, y: 210 },
+            { type: 'star', x: 1800, y: 230 },
+        ]
+    },
+
+    // Level 7: Haunted Graveyard - Boss level
+    level7: {
+        name: "Haunted Graveyard",
+        width: 2200,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 2100, y: 400, width: 80, height: 100 },
+        isBossLevel: true,
+        theme: 'graveyard',
+        bossType: 'headless_horseman',
+        bossName: 'HEADLESS HORSEMAN',
+        bossSubtitle: '"I eat rainbow sparkles for breakfast"',
+        hasBossIntro: true,
+        platforms: [
+            // Continuous ground - no holes
+            { x: 0, y: 500, width: 2200, height: 100, isGround: true },
+
+            // Floating tombstone platforms - raised higher to avoid blocking horseman
+            { x: 100, y: 380, width: 100, height: 28 },
+            { x: 300, y: 300, width: 110, height: 28 },
+
+            { x: 550, y: 350, width: 120, height: 28 },
+            { x: 780, y: 280, width: 140, height: 28 },
+
+            { x: 1050, y: 330, width: 130, height: 28 },
+            { x: 1280, y: 260, width: 160, height: 28 },
+            { x: 1500, y: 330, width: 130, height: 28 },
+
+            { x: 1750, y: 280, width: 140, height: 28 },
+            { x: 2000, y: 350, width: 100, height: 28 },
+        ],
+        enemySpawns: [
+            // Skeletons only (no bats or harpies)
+            { type: 'skeleton', x: 200, y: 430 },
+            { type: 'skeleton', x: 400, y: 430 },
+            { type: 'skeleton', x: 650, y: 430 },
+            { type: 'skeleton', x: 900, y: 430 },
+            { type: 'skeleton', x: 1100, y: 430 },
+            { type: 'skeleton', x: 1350, y: 430 },
+            { type: 'skeleton', x: 1600, y: 430 },
+            { type: 'skeleton', x: 1850, y: 430 },
+        ],
+        pickups: [
+            { type: 'heart', x: 340, y: 250 },
+            { type: 'star', x: 830, y: 230 },
+            { type: 'heart', x: 1340, y: 210 },
+            { type: 'crystal', x: 1800, y: 230 },
+        ]
+    },
+
+    // Pre-boss level 8a: Forge Approach - Skeleton Mage enemies
+    level8a: {
+        name: "Forge Approach",
+        width: 2000,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 1900, y: 400, width: 80, height: 100 },
+        theme: 'volcanic',
+        platforms: [
+            { x: 0, y: 500, width: 2000, height: 100, isGround: true },
+        ],
+        enemySpawns: [
+            { type: 'skeleton_mage', x: 300, y: 400 },
+            { type: 'skeleton_mage', x: 600, y: 400 },
+            { type: 'skeleton_mage', x: 900, y: 400 },
+            { type: 'skeleton_mage', x: 1200, y: 400 },
+            { type: 'skeleton_mage', x: 1500, y: 400 },
+            { type: 'skeleton_mage', x: 1800, y: 400 },
+        ],
+        pickups: [
+            { type: 'heart', x: 450, y: 350 },
+            { type: 'star', x: 750, y: 350 },
+            { type: 'heart', x: 1050, y: 350 },
+            { type: 'star', x: 1350, y: 350 },
+            { type: 'heart', x: 1700, y: 350 },
+        ]
+    },
+
+    // Level 8: Volcanic Forge - Pyromancer boss (stationary with moving platforms)
+    level8: {
+        name: "Volcanic Forge",
+        width: 2000,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 1900, y: 400, width: 80, height: 100 },
+        isBossLevel: true,
+        theme: 'volcanic',
+        bossType: 'pyromancer',
+        bossName: 'PYROMANCER',
+        bossSubtitle: '"Time to make glue!"',
+        hasBossIntro: true,
+        platforms: [
+            // Continuous ground - no holes
+            { x: 0, y: 500, width: 2000, height: 100, isGround: true },
+        ],
+        movingPlatforms: [],
+        enemySpawns: [],
+        gemSpawns: [
+            // 5 power gems on the floor - destroy all to bring down the Evil Wizard
+            { x: 200, y: 436 },
+            { x: 550, y: 436 },
+            { x: 900, y: 436 },
+            { x: 1250, y: 436 },
+            { x: 1600, y: 436 },
+        ],
+        pickups: [
+            { type: 'heart', x: 450, y: 350 },
+            { type: 'heart', x: 1050, y: 350 },
+            { type: 'heart', x: 1700, y: 350 },
+        ]
+    },
+
+    // Keep test level for backwards compatibility
+    test: {
+        name: "Test Level",
+        width: 2400,
+        height: 600,
+        playerStart: { x: 100, y: 380 },
+        levelEnd: { x: 2300, y: 400, width: 80, height: 100 },
+        platforms: [
+            { x: 0, y: 500, width: 550, height: 100, isGround: true },
+            { x: 650, y: 500, width: 450, height: 100, isGround: true },
+            { x: 1200, y: 500, width: 550, height: 100, isGround: true },
+            { x: 1850, y: 500, width: 550, height: 100, isGround: true },
+            { x: 180, y: 400, width: 120, height: 28 },
+            { x: 400, y: 340, width: 100, height: 28 },
+            { x: 280, y: 260, width: 110, height: 28 },
+            { x: 480, y: 200, width: 140, height: 28 },
+            { x: 570, y: 450, width: 60, height: 28 },
+            { x: 720, y: 400, width: 100, height: 28 },
+            { x: 900, y: 350, width: 120, height: 28 },
+            { x: 1050, y: 400, width: 100, height: 28 },
+            { x: 1280, y: 400, width: 110, height: 28 },
+            { x: 1450, y: 340, width: 130, height: 28 },
+            { x: 1350, y: 250, width: 150, height: 28 },
+            { x: 1580, y: 280, width: 120, height: 28 },
+            { x: 1700, y: 200, width: 130, height: 28 },
+            { x: 1920, y: 380, width: 120, height: 28 },
+            { x: 2100, y: 300, width: 150, height: 28 },
+            { x: 2280, y: 220, width: 100, height: 28 },
+        ],
+        enemySpawns: [
+            { type: 'baby_dragon', x: 350, y: 430 },
+            { type: 'goblin', x: 480, y: 420 },
+            { type: 'baby_dragon', x: 500, y: 130 },
+            { type: 'baby_dragon', x: 750, y: 430 },
+            { type: 'goblin', x: 950, y: 420 },
+            { type: 'baby_dragon', x: 1300, y: 430 },
+            { type: 'goblin', x: 1480, y: 420 },
+            { type: 'baby_dragon', x: 1600, y: 430 },
+            { type: 'goblin', x: 1400, y: 180 },
+            { type: 'baby_dragon', x: 1980, y: 430 },
+            { type: 'goblin', x: 2150, y: 230 },
+        ],
+        pickups: []
+    }
+};
+
+// Level order for progression
+const LEVEL_ORDER = ['level1', 'level2', 'level6a', 'level6', 'level7a', 'level7', 'level8a', 'level8', 'level3', 'level5'];
@@ -12,6 +12,7 @@ class Level {
         this.pickups = data.pickups || [];
         this.gemSpawns = data.gemSpawns || [];  // Power gems for Pyromancer fight
         this.hazards = data.hazards || [];  // Spike plants and other hazards
+        this.spatialIndex = data.spatialIndex || null;  // Grid from compile_levels.py
         this.movingPlatforms = (data.movingPlatforms || []).map(p => ({
             ...p,
             startX: p.x,
@@ -30,12 +31,21 @@ class Level {
         this.bgLayers = [];
         this.bgLoaded = false;
 
-        // Generate decorations for themed levels
-        this.decorations = [];
-        this.generateDecorations();
+        // Generate decorations for themed levels (compiled packs ship their own)
+        this.decorations = data.decorations ? data.decorations.map(d => ({ ...d })) : [];
+        if (!data.decorations) {
+            this.generateDecorations();
+        }
+
+        // Pre-rendered static geometry chunks from compile_levels.py
+        this.chunks = data.chunks || null;
+        this.chunkImages = [];
+        this.decorationChunkImages = [];
+        this.chunksLoaded = false;
 
         // Load background assets
         this.loadBackgrounds();
+        this.loadChunks();
     }
 
     generateDecorations() {
@@ -225,6 +235,22 @@ class Level {
         this.bgLoaded = true;
     }
 
+    async loadChunks() {
+        if (!this.chunks) return;
+
+        const load = files => Promise.all(files.map(file =>
+            file ? Utils.loadImage(LevelPacks.basePath + file) : null
+        ));
+        try {
+            this.chunkImages = await load(this.chunks.files);
+            this.decorationChunkImages = await load(this.chunks.decorationFiles || []);
+            this.chunksLoaded = true;
+        } catch (e) {
+            // Keep drawing platforms live if any chunk is missing
+            console.warn('Failed to load level chunks:', e);
+        }
+    }
+
     update(deltaTime) {
         // Update moving platforms and track their movement delta
         for (const plat of this.movingPlatforms) {
@@ -285,6 +311,37 @@ class Level {
         return [...this.platforms, ...this.movingPlatforms];
     }
 
+    // Broad-phase lookup of static platforms/hazards overlapping a rect.
+    // Uses the compiled spatial index when present, otherwise the full list.
+    // Candidates keep their original order so collision resolution is unchanged.
+    queryStatic(kind, rect) {
+        const items = this[kind];
+        const index = this.spatialIndex;
+        if (!index || !index[kind]) return items;
+
+        const size = index.cellSize;
+        const col0 = Utils.clamp(Math.floor(rect.x / size), 0, index.cols - 1);
+        const col1 = Utils.clamp(Math.floor((rect.x + rect.width) / size), 0, index.cols - 1);
+        const row0 = Utils.clamp(Math.floor(rect.y / size), 0, index.rows - 1);
+        const row1 = Utils.clamp(Math.floor((rect.y + rect.height) / size), 0, index.rows - 1);
+
+        const ids = new Set();
+        for (let row = row0; row <= row1; row++) {
+            for (let col = col0; col <= col1; col++) {
+                const cell = index[kind][row * index.cols + col];
+                if (cell) {
+                    for (const id of cell) ids.add(id);
+                }
+            }
+        }
+        return [...ids].sort((a, b) => a - b).map(id => items[id]);
+    }
+
+    // Static platforms near a rect plus all moving platforms
+    getPlatformsNear(rect) {
+        return [...this.queryStatic('platforms', rect), ...this.movingPlatforms];
+    }
+
     draw(ctx, cameraX, cameraY, canvasWidth, canvasHeight) {
         // Draw background
         this.drawBackground(ctx, cameraX, canvasWidth, canvasHeight);
@@ -1260,7 +1317,16 @@ class Level {
     }
 
     drawDecorations(ctx, cameraX, canvasHeight, time) {
+        const baked = this.chunksLoaded && this.chunks.decorationFiles ? this.chunks.bakedDecorations : [];
+        if (baked.length) {
+            // Decoration chunks are screen-space vertically, like the live decorations
+            this.drawChunkRow(ctx, this.decorationChunkImages, cameraX, 0, ctx.canvas.width);
+        }
+
         for (const deco of this.decorations) {
+            // Static decorations are already in the chunk images
+            if (baked.includes(deco.type)) continue;
+
             const x = deco.x - cameraX;
             const y = deco.y;
 
@@ -1640,9 +1706,13 @@ class Level {
     }
 
     drawPlatforms(ctx, cameraX, cameraY, canvasWidth, canvasHeight) {
-        // Draw static platforms
-        for (const platform of this.platforms) {
-            this.drawSinglePlatform(ctx, platform, cameraX, cameraY, canvasWidth, canvasHeight);
+        // Draw static platforms (only the visible pre-rendered chunks when available)
+        if (this.chunksLoaded) {
+            this.drawChunks(ctx, cameraX, cameraY, canvasWidth);
+        } else {
+            for (const platform of this.platforms) {
+                this.drawSinglePlatform(ctx, platform, cameraX, cameraY, canvasWidth, canvasHeight);
+            }
         }
 
         // Draw moving platforms
@@ -1651,6 +1721,24 @@ class Level {
         }
     }
 
+    drawChunks(ctx, cameraX, cameraY, canvasWidth) {
+        this.drawChunkRow(ctx, this.chunkImages, cameraX, cameraY, canvasWidth);
+    }
+
+    // Blit the chunk images that overlap the visible columns
+    drawChunkRow(ctx, images, cameraX, cameraY, canvasWidth) {
+        const chunkWidth = this.chunks.width;
+        const first = Math.max(0, Math.floor(cameraX / chunkWidth));
+        const last = Math.min(images.length - 1, Math.floor((cameraX + canvasWidth) / chunkWidth));
+
+        for (let i = first; i <= last; i++) {
+            const img = images[i];
+            if (img) {
+                ctx.drawImage(img, Math.floor(i * chunkWidth - cameraX), Math.floor(-cameraY));
+            }
+        }
+    }
+
     drawSinglePlatform(ctx, platform, cameraX, cameraY, canvasWidth, canvasHeight, isMoving = false) {
         // Skip if off screen
         if (platform.x + platform.width < cameraX ||
@@ -2111,543 +2199,72 @@ class Level {
     }
 }
 
-// Level data - 5 levels with increasing difficulty
-const LEVELS = {
-    // Level 1: Forest Meadow - Tutorial level with basic enemies
-    level1: {
-        name: "Forest Meadow",
-        width: 2400,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 2300, y: 400, width: 80, height: 100 },
-        platforms: [
-            // Main ground sections
-            { x: 0, y: 500, width: 550, height: 100, isGround: true },
-            { x: 650, y: 500, width: 450, height: 100, isGround: true },
-            { x: 1200, y: 500, width: 550, height: 100, isGround: true },
-            { x: 1850, y: 500, width: 550, height: 100, isGround: true },
-
-            // Floating platforms - first area
-            { x: 180, y: 400, width: 120, height: 28 },
-            { x: 400, y: 340, width: 100, height: 28 },
-            { x: 280, y: 260, width: 110, height: 28 },
-
-            // Bridge over gap
-            { x: 570, y: 450, width: 60, height: 28 },
-
-            // Middle area platforms
-            { x: 720, y: 400, width: 100, height: 28 },
-            { x: 900, y: 350, width: 120, height: 28 },
-            { x: 1050, y: 400, width: 100, height: 28 },
-
-            // Second area platforms
-            { x: 1280, y: 400, width: 110, height: 28 },
-            { x: 1450, y: 340, width: 130, height: 28 },
-
-            // Final area
-            { x: 1920, y: 380, width: 120, height: 28 },
-            { x: 2100, y: 300, width: 150, height: 28 },
-        ],
-        enemySpawns: [
-            { type: 'baby_dragon', x: 350, y: 430 },
-            { type: 'baby_dragon', x: 480, y: 430 },
-            { type: 'baby_dragon', x: 750, y: 430 },
-            { type: 'goblin', x: 950, y: 420 },
-            { type: 'baby_dragon', x: 1300, y: 430 },
-            { type: 'goblin', x: 1500, y: 420 },
-            { type: 'baby_dragon', x: 1980, y: 430 },
-        ],
-        pickups: [
-            { type: 'heart', x: 300, y: 220 },
-            { type: 'star', x: 920, y: 300 },
-            { type: 'crystal', x: 2150, y: 250 },
-        ]
-    },
-
-    // Level 2: Gargoyle's Lair - First boss level
-    level2: {
-        name: "Gargoyle's Lair",
-        width: 1600,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 1500, y: 400, width: 80, height: 100 },
-        isBossLevel: true,
-        theme: 'castle',
-        platforms: [
-            // Continuous main arena ground - no holes
-            { x: 0, y: 500, width: 1600, height: 100, isGround: true },
-
-            // Stone platforms for dodging gargoyle swoops
-            { x: 150, y: 400, width: 100, height: 32 },
-            { x: 350, y: 320, width: 120, height: 32 },
-            { x: 550, y: 380, width: 100, height: 32 },
-            { x: 700, y: 280, width: 140, height: 32 },
-            { x: 900, y: 350, width: 120, height: 32 },
-            { x: 1100, y: 400, width: 100, height: 32 },
-            { x: 1250, y: 300, width: 130, height: 32 },
-            { x: 1400, y: 380, width: 100, height: 32 },
-            // Higher platforms for aerial combat
-            { x: 450, y: 200, width: 100, height: 28 },
-            { x: 850, y: 180, width: 120, height: 28 },
-        ],
-        enemySpawns: [
-            { type: 'skeleton', x: 300, y: 430 },
-            { type: 'goblin', x: 600, y: 420 },
-            { type: 'gargoyle', x: 1100, y: 200 }, // Boss
-        ],
-        pickups: [
-            { type: 'heart', x: 770, y: 200 },
-        ]
-    },
-
-    // Level 3: Skeleton Crypt - Ranged enemy focus
-    level3: {
-        name: "Skeleton Crypt",
-        theme: 'crypt',
-        width: 2800,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 2700, y: 400, width: 80, height: 100 },
-        platforms: [
-            // Ground sections with more gaps
-            { x: 0, y: 500, width: 400, height: 100, isGround: true },
-            { x: 500, y: 500, width: 350, height: 100, isGround: true },
-            { x: 950, y: 500, width: 400, height: 100, isGround: true },
-            { x: 1450, y: 500, width: 350, height: 100, isGround: true },
-            { x: 1900, y: 500, width: 400, height: 100, isGround: true },
-            { x: 2400, y: 500, width: 400, height: 100, isGround: true },
-
-            // Multi-level platforms
-            { x: 150, y: 380, width: 100, height: 28 },
-            { x: 300, y: 280, width: 120, height: 28 },
-            { x: 420, y: 420, width: 60, height: 28 },
-
-            { x: 600, y: 380, width: 110, height: 28 },
-            { x: 780, y: 300, width: 100, height: 28 },
-            { x: 870, y: 420, width: 60, height: 28 },
-
-            { x: 1050, y: 380, width: 120, height: 28 },
-            { x: 1200, y: 280, width: 150, height: 28 },
-            { x: 1370, y: 420, width: 60, height: 28 },
-
-            { x: 1550, y: 350, width: 130, height: 28 },
-            { x: 1700, y: 250, width: 120, height: 28 },
-            { x: 1820, y: 420, width: 60, height: 28 },
-
-            { x: 2000, y: 380, width: 100, height: 28 },
-            { x: 2150, y: 300, width: 140, height: 28 },
-            { x: 2320, y: 420, width: 60, height: 28 },
-
-            { x: 2500, y: 350, width: 150, height: 28 },
-            { x: 2650, y: 280, width: 100, height: 28 },
-        ],
-        enemySpawns: [
-            { type: 'skeleton', x: 320, y: 210 },
-            { type: 'goblin', x: 550, y: 420 },
-            { type: 'skeleton', x: 800, y: 230 },
-            { type: 'baby_dragon', x: 1000, y: 430 },
-            { type: 'skeleton', x: 1220, y: 210 },
-            { type: 'goblin', x: 1500, y: 420 },
-            { type: 'skeleton', x: 1720, y: 180 },
-            { type: 'harpy', x: 1950, y: 280 },
-            { type: 'skeleton', x: 2170, y: 230 },
-            { type: 'goblin', x: 2450, y: 420 },
-        ],
-        pickups: [
-            { type: 'heart', x: 800, y: 250 },
-            { type: 'star', x: 1550, y: 290 },
-            { type: 'heart', x: 2170, y: 250 },
-            { type: 'crystal', x: 2670, y: 230 },
-        ]
-    },
-
-    // Level 4: Demon Caves - Flying enemy focus
-    level4: {
-        name: "Demon Caves",
-        theme: 'caves',
-        width: 3000,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 2900, y: 400, width: 80, height: 100 },
-        platforms: [
-            // Ground with large gaps
-            { x: 0, y: 500, width: 350, height: 100, isGround: true },
-            { x: 500, y: 500, width: 300, height: 100, isGround: true },
-            { x: 1000, y: 500, width: 350, height: 100, isGround: true },
-            { x: 1550, y: 500, width: 300, height: 100, isGround: true },
-            { x: 2050, y: 500, width: 400, height: 100, isGround: true },
-            { x: 2600, y: 500, width: 400, height: 100, isGround: true },
-
-            // Vertical platforming sections
-            { x: 200, y: 400, width: 100, height: 28 },
-            { x: 100, y: 300, width: 100, height: 28 },
-            { x: 250, y: 200, width: 100, height: 28 },
-
-            { x: 380, y: 420, width: 80, height: 28 },
-            { x: 420, y: 340, width: 80, height: 28 },
-
-            { x: 600, y: 380, width: 100, height: 28 },
-            { x: 750, y: 280, width: 120, height: 28 },
-            { x: 880, y: 380, width: 80, height: 28 },
-
-            { x: 1100, y: 380, width: 100, height: 28 },
-            { x: 1250, y: 280, width: 150, height: 28 },
-            { x: 1420, y: 350, width: 80, height: 28 },
-
-            { x: 1600, y: 380, width: 100, height: 28 },
-            { x: 1750, y: 280, width: 120, height: 28 },
-            { x: 1900, y: 350, width: 100, height: 28 },
-
-            { x: 2150, y: 380, width: 120, height: 28 },
-            { x: 2300, y: 280, width: 140, height: 28 },
-            { x: 2480, y: 350, width: 80, height: 28 },
-
-            { x: 2700, y: 380, width: 100, height: 28 },
-            { x: 2850, y: 300, width: 100, height: 28 },
-        ],
-        enemySpawns: [
-            { type: 'imp', x: 200, y: 250 },
-            { type: 'flying_eye', x: 350, y: 300 },
-            { type: 'goblin', x: 550, y: 420 },
-            { type: 'imp', x: 780, y: 200 },
-            { type: 'harpy', x: 950, y: 320 },
-            { type: 'skeleton', x: 1050, y: 430 },
-            { type: 'imp', x: 1280, y: 200 },
-            { type: 'flying_eye', x: 1500, y: 300 },
-            { type: 'goblin', x: 1600, y: 420 },
-            { type: 'imp', x: 1780, y: 200 },
-            { type: 'skeleton', x: 2100, y: 430 },
-            { type: 'harpy', x: 2250, y: 250 },
-            { type: 'imp', x: 2500, y: 280 },
-            { type: 'goblin', x: 2650, y: 420 },
-        ],
-        pickups: [
-            { type: 'heart', x: 270, y: 150 },
-            { type: 'star', x: 780, y: 230 },
-            { type: 'heart', x: 1280, y: 230 },
-            { type: 'star', x: 1780, y: 230 },
-            { type: 'heart', x: 2330, y: 230 },
-            { type: 'crystal', x: 2870, y: 250 },
-        ]
-    },
-
-    // Level 5: Demon Lord's Throne - Final Boss level
-    level5: {
-        name: "Demon Lord's Throne",
-        width: 1800,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 1700, y: 400, width: 80, height: 100 },
-        isBossLevel: true,
-        isFinalLevel: true,
-        theme: 'demon_throne',
-        bossType: 'demon_lord',
-        bossName: 'DEMON LORD',
-        bossSubtitle: '"Horns are SO overrated"',
-        platforms: [
-            // Arena ground
-            { x: 0, y: 500, width: 500, height: 100, isGround: true },
-            { x: 600, y: 500, width: 600, height: 100, isGround: true },
-            { x: 1300, y: 500, width: 500, height: 100, isGround: true },
-
-            // Elevated platforms for strategy
-            { x: 150, y: 380, width: 120, height: 28 },
-            { x: 350, y: 280, width: 100, height: 28 },
-
-            { x: 520, y: 420, width: 60, height: 28 },
-
-            { x: 700, y: 350, width: 150, height: 28 },
-            { x: 900, y: 250, width: 180, height: 28 },
-            { x: 1050, y: 350, width: 150, height: 28 },
-
-            { x: 1220, y: 420, width: 60, height: 28 },
-
-            { x: 1400, y: 380, width: 120, height: 28 },
-            { x: 1550, y: 280, width: 100, height: 28 },
-        ],
-        hasBossIntro: true,  // Boss spawns via intro sequence, not at start
-        enemySpawns: [
-            { type: 'imp', x: 300, y: 360 },
-            { type: 'imp', x: 500, y: 360 },
-            { type: 'imp', x: 1200, y: 360 },
-            { type: 'imp', x: 1450, y: 360 },
-        ],
-        pickups: [
-            { type: 'heart', x: 370, y: 230 },
-            { type: 'heart', x: 970, y: 200 },
-            { type: 'heart', x: 1570, y: 230 },
-        ]
-    },
-
-    // Pre-boss level 6a: Labyrinth Entrance - Lizardman enemies
-    level6a: {
-        name: "Labyrinth Entrance",
-        width: 2000,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 1900, y: 400, width: 80, height: 100 },
-        theme: 'labyrinth',
-        platforms: [
-            { x: 0, y: 500, width: 2000, height: 100, isGround: true },
-        ],
-        hazards: [
-            { type: 'spike_plant', x: 350, y: 460, width: 60, height: 40, damage: 1 },
-            { type: 'spike_plant', x: 800, y: 460, width: 55, height: 40, damage: 1 },
-            { type: 'spike_plant', x: 1250, y: 460, width: 60, height: 40, damage: 1 },
-            { type: 'spike_plant', x: 1650, y: 460, width: 55, height: 40, damage: 1 },
-        ],
-        enemySpawns: [
-            { type: 'lizardman', x: 300, y: 420 },
-            { type: 'lizardman', x: 550, y: 420 },
-            { type: 'lizardman', x: 900, y: 420 },
-            { type: 'lizardman', x: 1200, y: 420 },
-            { type: 'lizardman', x: 1500, y: 420 },
-            { type: 'lizardman', x: 1750, y: 420 },
-        ],
-        pickups: [
-            { type: 'heart', x: 450, y: 450 },
-            { type: 'star', x: 750, y: 450 },
-            { type: 'heart', x: 1100, y: 450 },
-            { type: 'star', x: 1400, y: 450 },
-            { type: 'heart', x: 1650, y: 450 },
-        ]
-    },
-
-    // Level 6: Minotaur's Labyrinth - Boss level (flat bridge arena)
-    level6: {
-        name: "Minotaur's Labyrinth",
-        width: 2000,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 1900, y: 400, width: 80, height: 100 },
-        isBossLevel: true,
-        theme: 'labyrinth',
-        bossType: 'minotaur',
-        bossName: 'MINOTAUR',
-        bossSubtitle: '"At least MY horn is useful"',
-        hasBossIntro: true,
-        platforms: [
-            // Single flat bridge - no gaps, no elevated platforms
-            { x: 0, y: 500, width: 2000, height: 100, isGround: true },
-        ],
-        hazards: [
-            // Spike plants reduced by half (4 instead of 8)
-            { type: 'spike_plant', x: 350, y: 460, width: 60, height: 40, damage: 1 },
-            { type: 'spike_plant', x: 800, y: 460, width: 55, height: 40, damage: 1 },
-            { type: 'spike_plant', x: 1250, y: 460, width: 60, height: 40, damage: 1 },
-            { type: 'spike_plant', x: 1650, y: 460, width: 55, height: 40, damage: 1 },
-        ],
-        enemySpawns: [
-            // No regular enemies - just the Minotaur boss
-        ],
-        pickups: [
-            { type: 'heart', x: 550, y: 450 },
-            { type: 'heart', x: 1000, y: 450 },
-            { type: 'heart', x: 1450, y: 450 },
-        ]
-    },
-
-    // Pre-boss level 7a: Graveyard Path - Skeleton enemies
-    level7a: {
-        name: "Graveyard Path",
-        width: 2200,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 2100, y: 400, width: 80, height: 100 },
-        theme: 'graveyard',
-        platforms: [
-            { x: 0, y: 500, width: 2200, height: 100, isGround: true },
-            { x: 100, y: 380, width: 100, height: 28 },
-            { x: 300, y: 300, width: 110, height: 28 },
-            { x: 550, y: 350, width: 120, height: 28 },
-            { x: 780, y: 280, width: 140, height: 28 },
-            { x: 1050, y: 330, width: 130, height: 28 },
-            { x: 1280, y: 260, width: 160, height: 28 },
-            { x: 1500, y: 330, width: 130, height: 28 },
-            { x: 1750, y: 280, width: 140, height: 28 },
-            { x: 2000, y: 350, width: 100, height: 28 },
-        ],
-        enemySpawns: [
-            { type: 'skeleton', x: 200, y: 430 },
-            { type: 'skeleton', x: 450, y: 430 },
-            { type: 'skeleton', x: 700, y: 430 },
-            { type: 'skeleton', x: 950, y: 430 },
-            { type: 'skeleton', x: 1200, y: 430 },
-            { type: 'skeleton', x: 1450, y: 430 },
-            { type: 'skeleton', x: 1700, y: 430 },
-            { type: 'skeleton', x: 1950, y: 430 },
-        ],
-        pickups: [
-            { type: 'heart', x: 340, y: 250 },
-            { type: 'star', x: 830, y: 230 },
-            { type: 'heart', x: 1340, y: 210 },
-            { type: 'star', x: 1800, y: 230 },
-        ]
-    },
-
-    // Level 7: Haunted Graveyard - Boss level
-    level7: {
-        name: "Haunted Graveyard",
-        width: 2200,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 2100, y: 400, width: 80, height: 100 },
-        isBossLevel: true,
-        theme: 'graveyard',
-        bossType: 'headless_horseman',
-        bossName: 'HEADLESS HORSEMAN',
-        bossSubtitle: '"I eat rainbow sparkles for breakfast"',
-        hasBossIntro: true,
-        platforms: [
-            // Continuous ground - no holes
-            { x: 0, y: 500, width: 2200, height: 100, isGround: true },
-
-            // Floating tombstone platforms - raised higher to avoid blocking horseman
-            { x: 100, y: 380, width: 100, height: 28 },
-            { x: 300, y: 300, width: 110, height: 28 },
-
-            { x: 550, y: 350, width: 120, height: 28 },
-            { x: 780, y: 280, width: 140, height: 28 },
-
-            { x: 1050, y: 330, width: 130, height: 28 },
-            { x: 1280, y: 260, width: 160, height: 28 },
-            { x: 1500, y: 330, width: 130, height: 28 },
-
-            { x: 1750, y: 280, width: 140, height: 28 },
-            { x: 2000, y: 350, width: 100, height: 28 },
-        ],
-        enemySpawns: [
-            // Skeletons only (no bats or harpies)
-            { type: 'skeleton', x: 200, y: 430 },
-            { type: 'skeleton', x: 400, y: 430 },
-            { type: 'skeleton', x: 650, y: 430 },
-            { type: 'skeleton', x: 900, y: 430 },
-            { type: 'skeleton', x: 1100, y: 430 },
-            { type: 'skeleton', x: 1350, y: 430 },
-            { type: 'skeleton', x: 1600, y: 430 },
-            { type: 'skeleton', x: 1850, y: 430 },
-        ],
-        pickups: [
-            { type: 'heart', x: 340, y: 250 },
-            { type: 'star', x: 830, y: 230 },
-            { type: 'heart', x: 1340, y: 210 },
-            { type: 'crystal', x: 1800, y: 230 },
-        ]
+// Compiled per-level packs written by compile_levels.py.
+// Only the level being played is fetched. js/level-data.js (every level's
+// source data) is loaded as the fallback when the packs haven't been built
+// or the page is opened without a server.
+const LevelPacks = {
+    basePath: 'build/levels/',
+    fallbackPath: 'js/level-data.js',
+    fallbackPromise: null,
+
+    async fetchJSON(file) {
+        try {
+            const response = await fetch(this.basePath + file);
+            if (response.ok) {
+                return await response.json();
+            }
+        } catch (e) {
+            // Fall through to the built-in data
+        }
+        return null;
     },
 
-    // Pre-boss level 8a: Forge Approach - Skeleton Mage enemies
-    level8a: {
-        name: "Forge Approach",
-        width: 2000,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 1900, y: 400, width: 80, height: 100 },
-        theme: 'volcanic',
-        platforms: [
-            { x: 0, y: 500, width: 2000, height: 100, isGround: true },
-        ],
-        enemySpawns: [
-            { type: 'skeleton_mage', x: 300, y: 400 },
-            { type: 'skeleton_mage', x: 600, y: 400 },
-            { type: 'skeleton_mage', x: 900, y: 400 },
-            { type: 'skeleton_mage', x: 1200, y: 400 },
-            { type: 'skeleton_mage', x: 1500, y: 400 },
-            { type: 'skeleton_mage', x: 1800, y: 400 },
-        ],
-        pickups: [
-            { type: 'heart', x: 450, y: 350 },
-            { type: 'star', x: 750, y: 350 },
-            { type: 'heart', x: 1050, y: 350 },
-            { type: 'star', x: 1350, y: 350 },
-            { type: 'heart', x: 1700, y: 350 },
-        ]
+    // Resolves to the LEVELS object once js/level-data.js has run
+    loadFallback() {
+        if (!this.fallbackPromise) {
+            this.fallbackPromise = new Promise((resolve, reject) => {
+                const script = document.createElement('script');
+                script.src = this.fallbackPath;
+                script.onload = () => resolve({ levels: LEVELS, order: LEVEL_ORDER });
+                script.onerror = () => reject(new Error(`Failed to load ${this.fallbackPath}`));
+                document.head.appendChild(script);
+            });
+        }
+        return this.fallbackPromise;
     },
 
-    // Level 8: Volcanic Forge - Pyromancer boss (stationary with moving platforms)
-    level8: {
-        name: "Volcanic Forge",
-        width: 2000,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 1900, y: 400, width: 80, height: 100 },
-        isBossLevel: true,
-        theme: 'volcanic',
-        bossType: 'pyromancer',
-        bossName: 'PYROMANCER',
-        bossSubtitle: '"Time to make glue!"',
-        hasBossIntro: true,
-        platforms: [
-            // Continuous ground - no holes
-            { x: 0, y: 500, width: 2000, height: 100, isGround: true },
-        ],
-        movingPlatforms: [],
-        enemySpawns: [],
-        gemSpawns: [
-            // 5 power gems on the floor - destroy all to bring down the Evil Wizard
-            { x: 200, y: 436 },
-            { x: 550, y: 436 },
-            { x: 900, y: 436 },
-            { x: 1250, y: 436 },
-            { x: 1600, y: 436 },
-        ],
-        pickups: [
-            { type: 'heart', x: 450, y: 350 },
-            { type: 'heart', x: 1050, y: 350 },
-            { type: 'heart', x: 1700, y: 350 },
-        ]
+    // { order: [ids], levels: { id: { name, isBossLevel } } } for the level select
+    async loadIndex() {
+        const index = await this.fetchJSON('index.json');
+        if (index) {
+            return index;
+        }
+        const fallback = await this.loadFallback();
+        const levels = {};
+        for (const [id, level] of Object.entries(fallback.levels)) {
+            levels[id] = { name: level.name, isBossLevel: !!level.isBossLevel };
+        }
+        return { order: fallback.order, levels };
     },
 
-    // Keep test level for backwards compatibility
-    test: {
-        name: "Test Level",
-        width: 2400,
-        height: 600,
-        playerStart: { x: 100, y: 380 },
-        levelEnd: { x: 2300, y: 400, width: 80, height: 100 },
-        platforms: [
-            { x: 0, y: 500, width: 550, height: 100, isGround: true },
-            { x: 650, y: 500, width: 450, height: 100, isGround: true },
-            { x: 1200, y: 500, width: 550, height: 100, isGround: true },
-            { x: 1850, y: 500, width: 550, height: 100, isGround: true },
-            { x: 180, y: 400, width: 120, height: 28 },
-            { x: 400, y: 340, width: 100, height: 28 },
-            { x: 280, y: 260, width: 110, height: 28 },
-            { x: 480, y: 200, width: 140, height: 28 },
-            { x: 570, y: 450, width: 60, height: 28 },
-            { x: 720, y: 400, width: 100, height: 28 },
-            { x: 900, y: 350, width: 120, height: 28 },
-            { x: 1050, y: 400, width: 100, height: 28 },
-            { x: 1280, y: 400, width: 110, height: 28 },
-            { x: 1450, y: 340, width: 130, height: 28 },
-            { x: 1350, y: 250, width: 150, height: 28 },
-            { x: 1580, y: 280, width: 120, height: 28 },
-            { x: 1700, y: 200, width: 130, height: 28 },
-            { x: 1920, y: 380, width: 120, height: 28 },
-            { x: 2100, y: 300, width: 150, height: 28 },
-            { x: 2280, y: 220, width: 100, height: 28 },
-        ],
-        enemySpawns: [
-            { type: 'baby_dragon', x: 350, y: 430 },
-            { type: 'goblin', x: 480, y: 420 },
-            { type: 'baby_dragon', x: 500, y: 130 },
-            { type: 'baby_dragon', x: 750, y: 430 },
-            { type: 'goblin', x: 950, y: 420 },
-            { type: 'baby_dragon', x: 1300, y: 430 },
-            { type: 'goblin', x: 1480, y: 420 },
-            { type: 'baby_dragon', x: 1600, y: 430 },
-            { type: 'goblin', x: 1400, y: 180 },
-            { type: 'baby_dragon', x: 1980, y: 430 },
-            { type: 'goblin', x: 2150, y: 230 },
-        ],
-        pickups: []
+    async load(levelName) {
+        const pack = await this.fetchJSON(`${levelName}.json`);
+        if (pack) {
+            return pack;
+        }
+        try {
+            const fallback = await this.loadFallback();
+            return fallback.levels[levelName] || null;
+        } catch (e) {
+            console.error(e);
+            return null;
+        }
     }
 };
 
-// Level order for progression
-const LEVEL_ORDER = ['level1', 'level2', 'level6a', 'level6', 'level7a', 'level7', 'level8a', 'level8', 'level3', 'level5'];
-
-function createLevel(levelName) {
-    const data = LEVELS[levelName];
+async function fetchLevel(levelName) {
+    const data = await LevelPacks.load(levelName);
     if (!data) {
         console.error(`Level "${levelName}" not found`);
         return null;
@@ -1,7 +1,7 @@
 // Particle System for visual effects
 
 class Particle {
-    constructor(x, y, vx, vy, color, size, life, gravity = 0) {
+    constructor(x, y, vx, vy, color, size, life, gravity = 0, texture = 'dot') {
         this.x = x;
         this.y = y;
         this.vx = vx;
@@ -11,6 +11,7 @@ class Particle {
         this.maxLife = life;
         this.life = life;
         this.gravity = gravity;
+        this.texture = texture;
         this.alpha = 1;
     }
 
@@ -26,10 +27,12 @@ class Particle {
     draw(ctx, cameraX, cameraY) {
         ctx.save();
         ctx.globalAlpha = this.alpha;
-        ctx.fillStyle = this.color;
-        ctx.beginPath();
-        ctx.arc(this.x - cameraX, this.y - cameraY, this.size, 0, Math.PI * 2);
-        ctx.fill();
+        if (!ParticleAtlas.draw(ctx, this.texture, this.color, this.x - cameraX, this.y - cameraY, this.size)) {
+            ctx.fillStyle = this.color;
+            ctx.beginPath();
+            ctx.arc(this.x - cameraX, this.y - cameraY, this.size, 0, Math.PI * 2);
+            ctx.fill();
+        }
         ctx.restore();
     }
 
@@ -38,6 +41,50 @@ class Particle {
     }
 }
 
+// Sprite atlas baked by bake_particles.py: tinted dot, spark, glow and ring
+// textures at a few radii. draw() returns false when a texture/tint was not
+// baked so callers can fall back to canvas drawing.
+const ParticleAtlas = {
+    image: null,
+    textures: null,
+
+    async load() {
+        const sheet = await AssetManifest.get('particles');
+        if (!sheet) return;
+        try {
+            this.image = await Utils.loadImage(AssetManifest.basePath + sheet.file);
+            this.textures = sheet.textures;
+        } catch (e) {
+            console.warn('Failed to load particle atlas');
+        }
+    },
+
+    // Draw a texture centred on (x, y), scaled to the given radius
+    draw(ctx, texture, color, x, y, radius) {
+        const entry = this.textures && this.textures[texture];
+        if (!entry) return false;
+        const tint = entry.tints[color.toLowerCase()];
+        if (tint === undefined) return false;
+
+        // Smallest baked radius that does not need upscaling
+        let size = entry.sizes[entry.sizes.length - 1];
+        for (const s of entry.sizes) {
+            if (s.radius >= radius) {
+                size = s;
+                break;
+            }
+        }
+
+        const drawSize = size.cell * radius / size.radius;
+        ctx.drawImage(
+            this.image,
+            tint * size.cell, size.y, size.cell, size.cell,
+            x - drawSize / 2, y - drawSize / 2, drawSize, drawSize
+        );
+        return true;
+    }
+};
+
 const ParticleSystem = {
     particles: [],
     maxParticles: 500,
@@ -66,6 +113,7 @@ const ParticleSystem = {
         const spread = config.spread || Math.PI * 2;
         const angle = config.angle || 0;
         const gravity = config.gravity || 0;
+        const texture = config.texture || 'dot';
 
         for (let i = 0; i < count; i++) {
             if (this.particles.length >= this.maxParticles) break;
@@ -81,7 +129,7 @@ const ParticleSystem = {
             this.particles.push(new Particle(
                 x + (Math.random() - 0.5) * 10,
                 y + (Math.random() - 0.5) * 10,
-                vx, vy, color, particleSize, particleLife, gravity
+                vx, vy, color, particleSize, particleLife, gravity, texture
             ));
         }
     },
@@ -104,7 +152,8 @@ const ParticleSystem = {
             colors: ['#ffffff', '#ffff00', '#00ffff', '#ff00ff'],
             speed: 80,
             size: 4,
-            life: 0.3
+            life: 0.3,
+            texture: 'spark'
         });
     },
 
@@ -247,7 +247,7 @@ class Player extends Sprite {
 
         // Check horizontal collisions
         let hitbox = this.getHitbox();
-        for (const platform of level.getAllPlatforms()) {
+        for (const platform of level.getPlatformsNear(hitbox)) {
             if (this.rectIntersect(hitbox, platform)) {
                 if (this.vx > 0) {
                     this.x = platform.x - this.hitboxWidth - this.hitboxOffsetX;
@@ -274,7 +274,7 @@ class Player extends Sprite {
 
         // Check vertical collisions
         hitbox = this.getHitbox();
-        for (const platform of level.getAllPlatforms()) {
+        for (const platform of level.getPlatformsNear(hitbox)) {
             if (this.rectIntersect(hitbox, platform)) {
                 if (this.vy > 0) {
                     this.y = platform.y - this.hitboxHeight - this.hitboxOffsetY;
@@ -294,7 +294,7 @@ class Player extends Sprite {
 
         // Final stuck check with smarter resolution
         hitbox = this.getHitbox();
-        for (const platform of level.getAllPlatforms()) {
+        for (const platform of level.getPlatformsNear(hitbox)) {
             if (this.rectIntersect(hitbox, platform)) {
                 // Calculate overlaps in all directions
                 const overlapLeft = (hitbox.x + hitbox.width) - platform.x;
@@ -484,14 +484,16 @@ class Player extends Sprite {
 
             ctx.save();
             ctx.globalAlpha = 0.3 + Math.sin(time * 4) * 0.1;
-            const gradient = ctx.createRadialGradient(centerX, centerY, 20, centerX, centerY, 50);
-            gradient.addColorStop(0, 'transparent');
-            gradient.addColorStop(0.5, '#00aaff');
-            gradient.addColorStop(1, 'transparent');
-            ctx.fillStyle = gradient;
-            ctx.beginPath();
-            ctx.arc(centerX, centerY, 50, 0, Math.PI * 2);
-            ctx.fill();
+            if (!ParticleAtlas.draw(ctx, 'ring', '#00aaff', centerX, centerY, 50)) {
+                const gradient = ctx.createRadialGradient(centerX, centerY, 20, centerX, centerY, 50);
+                gradient.addColorStop(0, 'transparent');
+                gradient.addColorStop(0.5, '#00aaff');
+                gradient.addColorStop(1, 'transparent');
+                ctx.fillStyle = gradient;
+                ctx.beginPath();
+                ctx.arc(centerX, centerY, 50, 0, Math.PI * 2);
+                ctx.fill();
+            }
             ctx.restore();
         }
 
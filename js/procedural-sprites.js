@@ -1,5 +1,6 @@
 // Procedural sprite generator for bosses without sprite sheet assets
 // Generates simple pixel-art style sprites using canvas drawing
+// bake_boss_sprites.py mirrors these draws offline; keep the two in sync
 
 const ProceduralSprites = {
     createFrame(width, height, drawFunc) {
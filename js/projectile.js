@@ -7,6 +7,9 @@ class Projectile {
         loaded: false
     };
 
+    // Pre-rotated frames baked by bake_projectiles.py, if built
+    static rotationSheet = null;
+
     static async loadSprites() {
         if (Projectile.sprites.loaded) return;
 
@@ -20,6 +23,16 @@ class Projectile {
             }
         }
 
+        const sheet = await AssetManifest.get('projectiles');
+        if (sheet) {
+            try {
+                sheet.image = await Utils.loadImage(AssetManifest.basePath + sheet.file);
+                Projectile.rotationSheet = sheet;
+            } catch (e) {
+                console.warn('Failed to load projectile rotation sheet');
+            }
+        }
+
         Projectile.sprites.loaded = true;
     }
 
@@ -150,13 +163,18 @@ class Projectile {
         ctx.save();
         for (const p of this.trailParticles) {
             ctx.globalAlpha = p.alpha * 0.7;
-            ctx.fillStyle = p.color || this.glowColor;
-            ctx.beginPath();
-            ctx.arc(p.x - cameraX, p.y - cameraY, p.size, 0, Math.PI * 2);
-            ctx.fill();
+            const color = p.color || this.glowColor;
+            if (!ParticleAtlas.draw(ctx, 'dot', color, p.x - cameraX, p.y - cameraY, p.size)) {
+                ctx.fillStyle = color;
+                ctx.beginPath();
+                ctx.arc(p.x - cameraX, p.y - cameraY, p.size, 0, Math.PI * 2);
+                ctx.fill();
+            }
         }
         ctx.restore();
 
+        if (this.drawFromSheet(ctx, centerX, centerY)) return;
+
         if (this.type === 'bone') {
             this.drawBone(ctx, centerX, centerY);
         } else if (this.type === 'fireball') {
@@ -172,6 +190,23 @@ class Projectile {
         }
     }
 
+    // Blit the baked frame nearest to the current rotation
+    drawFromSheet(ctx, centerX, centerY) {
+        const sheet = Projectile.rotationSheet;
+        const entry = sheet && sheet.types[this.type];
+        if (!entry) return false;
+
+        const step = Math.PI * 2 / entry.frames;
+        const frame = ((Math.round(this.rotation / step) % entry.frames) + entry.frames) % entry.frames;
+        const size = entry.frameSize;
+        ctx.drawImage(
+            sheet.image,
+            frame * size, entry.y, size, size,
+            Math.round(centerX - size / 2), Math.round(centerY - size / 2), size, size
+        );
+        return true;
+    }
+
     drawPlayerMagic(ctx, drawX, drawY) {
         // Use animated sprite if available
         const sprites = Projectile.sprites.unicorn;
@@ -8,10 +8,49 @@ const SoundManager = {
     muted: false,
     initialized: false,
 
+    buffers: {},        // Pre-rendered effects from render_sfx.py
+    bufferVolume: 0.5,  // sfxVolume the buffers were rendered at
+
     init() {
         // Create sounds using Web Audio API oscillators (no external files needed)
         this.audioContext = new (window.AudioContext || window.webkitAudioContext)();
+        this.sfxGain = this.audioContext.createGain();
+        this.sfxGain.connect(this.audioContext.destination);
         this.initialized = true;
+        this.loadBuffers();
+    },
+
+    // Decode the pre-rendered effects listed in the asset manifest, if built.
+    // Effects without a buffer keep using the oscillator code below.
+    async loadBuffers() {
+        const sfx = await AssetManifest.get('sfx');
+        if (!sfx) return;
+
+        this.bufferVolume = sfx.volume;
+        this.updateSfxGain();
+        for (const [name, entry] of Object.entries(sfx.effects)) {
+            try {
+                const response = await fetch(AssetManifest.basePath + entry.file);
+                const data = await response.arrayBuffer();
+                this.buffers[name] = await this.audioContext.decodeAudioData(data);
+            } catch (e) {
+                console.warn(`Failed to load sound ${name}:`, e);
+            }
+        }
+    },
+
+    updateSfxGain() {
+        if (this.sfxGain) {
+            this.sfxGain.gain.value = this.sfxVolume / this.bufferVolume;
+        }
+    },
+
+    // Play a decoded effect with a single source node
+    playBuffer(buffer) {
+        const source = this.audioContext.createBufferSource();
+        source.buffer = buffer;
+        source.connect(this.sfxGain);
+        source.start(this.audioContext.currentTime);
     },
 
     // Resume audio context (needed after user interaction)
@@ -26,6 +65,11 @@ const SoundManager = {
         if (this.muted || !this.initialized) return;
         this.resume();
 
+        if (this.buffers[soundName]) {
+            this.playBuffer(this.buffers[soundName]);
+            return;
+        }
+
         switch (soundName) {
             case 'shoot':
                 this.playTone(880, 0.1, 'square', 0.3);
@@ -168,6 +212,7 @@ const SoundManager = {
 
     setVolume(sfx, music) {
         if (sfx !== undefined) this.sfxVolume = Math.max(0, Math.min(1, sfx));
+        this.updateSfxGain();
         if (music !== undefined) this.musicVolume = Math.max(0, Math.min(1, music));
     }
 };
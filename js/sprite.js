@@ -42,6 +42,48 @@ class Animation {
     }
 }
 
+// One frame of a strip that encode_animations.py stored as a keyframe plus
+// dirty rects. Nothing is decoded until the frame is first drawn: image()
+// then copies the previous frame (unless this one is a keyframe) and redraws
+// the changed rects from the atlas. Frames that are never shown, such as the
+// death animation of an enemy that is never killed, never take a canvas.
+class DeltaFrame {
+    constructor(atlas, entry, index, previous) {
+        this.atlas = atlas;
+        this.rects = entry.frames[index];
+        this.previous = previous;
+        this.width = entry.frameWidth;
+        this.height = entry.frameHeight;
+        this.canvas = null;
+    }
+
+    isKeyframe() {
+        return this.rects.length === 1 && this.rects[0][2] === this.width && this.rects[0][3] === this.height;
+    }
+
+    image() {
+        if (!this.canvas) {
+            const canvas = document.createElement('canvas');
+            canvas.width = this.width;
+            canvas.height = this.height;
+            const ctx = canvas.getContext('2d');
+            ctx.imageSmoothingEnabled = false;
+            if (this.previous && !this.isKeyframe()) ctx.drawImage(this.previous.image(), 0, 0);
+            for (const [x, y, w, h, sx, sy] of this.rects) {
+                ctx.clearRect(x, y, w, h);
+                ctx.drawImage(this.atlas, sx, sy, w, h, x, y, w, h);
+            }
+            this.canvas = canvas;
+        }
+        return this.canvas;
+    }
+
+    // Something drawImage accepts, for a frame from any loader
+    static drawable(frame) {
+        return frame instanceof DeltaFrame ? frame.image() : frame;
+    }
+}
+
 class Sprite {
     constructor(x, y, width, height) {
         this.x = x;
@@ -79,7 +121,7 @@ class Sprite {
         const anim = this.animations[this.currentAnimation];
         if (!anim) return;
 
-        const frame = anim.getCurrentFrame();
+        const frame = DeltaFrame.drawable(anim.getCurrentFrame());
         if (!frame) return;
 
         ctx.save();
@@ -102,6 +144,11 @@ class Sprite {
         ctx.restore();
     }
 
+    getCurrentFrame() {
+        const anim = this.animations[this.currentAnimation];
+        return anim ? anim.getCurrentFrame() : null;
+    }
+
     isAnimationFinished() {
         if (!this.currentAnimation || !this.animations[this.currentAnimation]) {
             return true;
@@ -132,6 +179,8 @@ const SpriteLoader = {
                 frames.push(this.cache[path]);
             } else {
                 const img = await Utils.loadImage(path);
+                const collision = await CollisionMasks.forImage(path);
+                if (collision) img.collision = collision[0];
                 this.cache[path] = img;
                 frames.push(img);
             }
@@ -147,6 +196,16 @@ const SpriteLoader = {
             return this.sheetCache[cacheKey];
         }
 
+        const collision = await CollisionMasks.forImage(imagePath);
+        const deltaFrames = await this.loadDeltaFrames(imagePath);
+        if (deltaFrames) {
+            deltaFrames.forEach((frame, i) => {
+                if (collision && collision[i]) frame.collision = collision[i];
+            });
+            this.sheetCache[cacheKey] = deltaFrames;
+            return deltaFrames;
+        }
+
         const img = await Utils.loadImage(imagePath);
         const frameCount = Math.round(img.width / frameWidth);
         const frames = [];
@@ -163,6 +222,7 @@ const SpriteLoader = {
             const frameImg = new Image();
             frameImg.src = canvas.toDataURL();
             await new Promise(resolve => { frameImg.onload = resolve; });
+            if (collision && collision[i]) frameImg.collision = collision[i];
             frames.push(frameImg);
         }
 
@@ -170,6 +230,56 @@ const SpriteLoader = {
         return frames;
     },
 
+    // Frames of a strip that encode_animations.py stored as a keyframe plus
+    // dirty rects, as DeltaFrames decoded when first drawn. Null when the
+    // strip has no delta encoding or its atlas fails to load.
+    async loadDeltaFrames(imagePath) {
+        const deltas = await AssetManifest.get('deltaAnimations');
+        const entry = deltas && deltas[imagePath];
+        if (!entry) return null;
+
+        let atlas;
+        try {
+            atlas = await Utils.loadImage(AssetManifest.basePath + entry.file);
+        } catch (e) {
+            console.warn(`Failed to load delta atlas for ${imagePath}:`, e);
+            return null;
+        }
+
+        const frames = [];
+        for (let i = 0; i < entry.frames.length; i++) {
+            frames.push(new DeltaFrame(atlas, entry, i, frames[i - 1] || null));
+        }
+        return frames;
+    },
+
+    // Redraw a cached sheet's frames from the file on disk, in place, so
+    // every sprite holding those frame images picks up the change
+    async reloadSheet(imagePath, bust) {
+        const frames = this.sheetCache[imagePath];
+        if (!frames) return;
+
+        const img = new Image();
+        img.src = imagePath + bust;
+        await img.decode();
+        const frameWidth = frames[0].width;
+        const frameHeight = frames[0].height;
+        frames.forEach((frameImg, i) => {
+            const canvas = document.createElement('canvas');
+            canvas.width = frameWidth;
+            canvas.height = frameHeight;
+            const ctx = canvas.getContext('2d');
+            ctx.imageSmoothingEnabled = false;
+            ctx.drawImage(img, i * frameWidth, 0, frameWidth, frameHeight, 0, 0, frameWidth, frameHeight);
+            if (frameImg instanceof DeltaFrame) {
+                // The edited strip replaces the delta decoding
+                frameImg.canvas = canvas;
+            } else {
+                frameImg.src = canvas.toDataURL();
+            }
+        });
+    },
+
     // Sprite sheet configurations for new sprites
     // frameWidth/frameHeight are the actual pixel dimensions per frame in the sheet
     spriteSheetConfigs: {
@@ -192,7 +302,9 @@ const SpriteLoader = {
         lizardman: { path: 'assets/sprites/dwarf_warrior', frameWidth: 128, frameHeight: 128 },
     },
 
-    async loadSpriteSheetAnimations(spriteType) {
+    // fallback(anim, config) may supply frames for animations whose sheet
+    // fails to load; returning null leaves the magenta placeholder
+    async loadSpriteSheetAnimations(spriteType, fallback = null) {
         const config = this.spriteSheetConfigs[spriteType];
         if (!config) {
             console.error(`No sprite sheet config for: ${spriteType}`);
@@ -210,6 +322,11 @@ const SpriteLoader = {
                     config.frameHeight
                 );
             } catch (e) {
+                const frames = fallback ? await fallback(anim, config) : null;
+                if (frames) {
+                    result[anim] = frames;
+                    continue;
+                }
                 console.warn(`Failed to load ${spriteType}/${anim}:`, e);
                 // Create a 1-frame fallback
                 const canvas = document.createElement('canvas');
@@ -218,10 +335,10 @@ const SpriteLoader = {
                 const ctx = canvas.getContext('2d');
                 ctx.fillStyle = '#ff00ff';
                 ctx.fillRect(0, 0, config.frameWidth, config.frameHeight);
-                const fallback = new Image();
-                fallback.src = canvas.toDataURL();
-                await new Promise(resolve => { fallback.onload = resolve; });
-                result[anim] = [fallback];
+                const placeholder = new Image();
+                placeholder.src = canvas.toDataURL();
+                await new Promise(resolve => { placeholder.onload = resolve; });
+                result[anim] = [placeholder];
             }
         }
 
@@ -277,6 +394,40 @@ const SpriteLoader = {
         };
     },
 
+    // Frames of an animation baked by bake_boss_sprites.py, or null when the
+    // boss doesn't bake it. Baked frames are smaller than the sheet frames, so
+    // each is placed bottom-centred on a canvas of the sheet's frame size to
+    // keep its scale next to the boss's other animations.
+    async loadBakedBossFrames(bossType, anim, config) {
+        const baked = await AssetManifest.get('bossSprites');
+        const entry = baked && baked[bossType];
+        if (!entry || !entry.animations[anim]) return null;
+
+        let frames;
+        try {
+            frames = await this.loadSpriteSheet(
+                AssetManifest.basePath + entry.animations[anim].file,
+                entry.frameWidth,
+                entry.frameHeight
+            );
+        } catch (e) {
+            console.warn(`Failed to load baked ${bossType}/${anim}:`, e);
+            return null;
+        }
+
+        return frames.map(frame => {
+            const canvas = document.createElement('canvas');
+            canvas.width = config.frameWidth;
+            canvas.height = config.frameHeight;
+            const ctx = canvas.getContext('2d');
+            ctx.imageSmoothingEnabled = false;
+            ctx.drawImage(DeltaFrame.drawable(frame),
+                Math.floor((config.frameWidth - entry.frameWidth) / 2),
+                config.frameHeight - entry.frameHeight);
+            return canvas;
+        });
+    },
+
     async loadBossAnimations(bossType) {
         // Check if this boss uses sprite sheets
         const sheetType = {
@@ -289,7 +440,8 @@ const SpriteLoader = {
         }[bossType];
 
         if (sheetType) {
-            return await this.loadSpriteSheetAnimations(sheetType);
+            return await this.loadSpriteSheetAnimations(sheetType,
+                (anim, config) => this.loadBakedBossFrames(bossType, anim, config));
         }
 
         // Load from individual frame files for bosses without sprite sheets
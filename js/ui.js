@@ -139,8 +139,11 @@ const UI = {
         ctx.fillStyle = '#00ffff';
         ctx.strokeStyle = '#000000';
         ctx.lineWidth = 3;
-        ctx.strokeText(`PROTECTED: ${timeLeft}`, 400, 120);
-        ctx.fillText(`PROTECTED: ${timeLeft}`, 400, 120);
+        const text = `PROTECTED: ${timeLeft}`;
+        if (!BitmapFont.draw(ctx, text, 400, 120, 'bold 20px sans-serif', '#00ffff', 'center')) {
+            ctx.strokeText(text, 400, 120);
+            ctx.fillText(text, 400, 120);
+        }
         ctx.restore();
     },
 
@@ -158,10 +161,13 @@ const UI = {
         ctx.save();
 
         // "Q" label
+        const labelColor = ready ? '#ffffff' : '#888888';
         ctx.font = 'bold 14px sans-serif';
-        ctx.fillStyle = ready ? '#ffffff' : '#888888';
+        ctx.fillStyle = labelColor;
         ctx.textAlign = 'left';
-        ctx.fillText('Q', barX, barY + segHeight - 1);
+        if (!BitmapFont.draw(ctx, 'Q', barX, barY + segHeight - 1, 'bold 14px sans-serif', labelColor, 'left', false)) {
+            ctx.fillText('Q', barX, barY + segHeight - 1);
+        }
 
         const segsStartX = barX + 18;
 
@@ -208,8 +214,10 @@ const UI = {
             ctx.fillStyle = '#ff69b4';
             ctx.strokeStyle = '#000000';
             ctx.lineWidth = 2;
-            ctx.strokeText('READY!', textX, barY + segHeight - 1);
-            ctx.fillText('READY!', textX, barY + segHeight - 1);
+            if (!BitmapFont.draw(ctx, 'READY!', textX, barY + segHeight - 1, 'bold 12px sans-serif', '#ff69b4')) {
+                ctx.strokeText('READY!', textX, barY + segHeight - 1);
+                ctx.fillText('READY!', textX, barY + segHeight - 1);
+            }
             ctx.globalAlpha = 1;
         }
 
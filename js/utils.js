@@ -36,11 +36,18 @@ const Utils = {
         return Math.random() * (max - min) + min;
     },
 
+    // Every image loaded through loadImage, by source (for live reload)
+    loadedImages: new Map(),
+
     // Load an image and return a promise
     loadImage(src) {
         return new Promise((resolve, reject) => {
             const img = new Image();
-            img.onload = () => resolve(img);
+            img.onload = () => {
+                if (!this.loadedImages.has(src)) this.loadedImages.set(src, []);
+                this.loadedImages.get(src).push(img);
+                resolve(img);
+            };
             img.onerror = () => reject(new Error(`Failed to load image: ${src}`));
             img.src = src;
         });
@@ -56,3 +63,55 @@ const Utils = {
         return images;
     }
 };
+
+// Index of baked build artifacts (build/manifest.json, written by the offline tools).
+// Resolves to an empty manifest when nothing has been built.
+const AssetManifest = {
+    basePath: 'build/',
+    promise: null,
+
+    load() {
+        if (!this.promise) {
+            this.promise = fetch(this.basePath + 'manifest.json')
+                .then(response => response.ok ? response.json() : {})
+                .catch(() => ({}));
+        }
+        return this.promise;
+    },
+
+    async get(section) {
+        const manifest = await this.load();
+        return manifest[section] || null;
+    }
+};
+
+// Live reload for `run_game.py --watch`: rebuilt images are swapped into the
+// Image objects already in use, stylesheets are re-fetched, and script or
+// page changes reload the page. Without --watch the event stream 404s and
+// EventSource gives up.
+const LiveReload = {
+    connect() {
+        if (!window.EventSource) return;
+        const source = new EventSource('api/events');
+        source.addEventListener('reload', () => window.location.reload());
+        source.addEventListener('assets', (e) => this.swap(JSON.parse(e.data).files));
+    },
+
+    swap(files) {
+        const bust = `?t=${Date.now()}`;
+        for (const file of files) {
+            if (file.endsWith('.css')) {
+                for (const link of document.querySelectorAll('link[rel="stylesheet"]')) {
+                    if (link.getAttribute('href').split('?')[0] === file) link.href = file + bust;
+                }
+                continue;
+            }
+            // Sheets are sliced into frame images at load time; re-slice those
+            SpriteLoader.reloadSheet(file, bust);
+            for (const img of Utils.loadedImages.get(file) || []) {
+                img.src = file + bust;
+            }
+        }
+        console.log('Live reload:', files.join(', '));
+    }
+};
@@ -0,0 +1,75 @@
+"""
+Leaderboard
+SQLite-backed high score table shared by everyone playing through
+run_game.py. Scores are indexed by value, the current top list is cached in
+memory until the next write invalidates it, and new scores are queued and
+inserted in batches (one transaction per flush) instead of one commit each.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+DB_PATH = os.path.join('data', 'leaderboard.db')
+TOP_SCORES = 10         # HighScoreManager.maxScores
+BATCH_SIZE = 32
+MAX_NAME_LENGTH = 16
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS scores (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS scores_by_score ON scores (score DESC, id);
+"""
+
+
+class Leaderboard:
+    def __init__(self, path=DB_PATH, top=TOP_SCORES, batch_size=BATCH_SIZE):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.executescript(SCHEMA)
+        self.top_count = top
+        self.batch_size = batch_size
+        self.pending = []
+        self.cache = None
+        self.lock = threading.Lock()
+
+    def add(self, name, score):
+        """Queue a score; it is written with the next batch."""
+        name = (str(name).strip() or 'Player')[:MAX_NAME_LENGTH]
+        with self.lock:
+            self.pending.append((name, int(score), time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())))
+            self.cache = None
+            if len(self.pending) >= self.batch_size:
+                self._flush()
+
+    def top(self):
+        """The best scores as [{name, score, date}], highest first."""
+        with self.lock:
+            if self.cache is None:
+                self._flush()
+                rows = self.db.execute(
+                    'SELECT name, score, date FROM scores ORDER BY score DESC, id LIMIT ?',
+                    (self.top_count,),
+                ).fetchall()
+                self.cache = [{'name': n, 'score': s, 'date': d} for n, s, d in rows]
+            return self.cache
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        if not self.pending:
+            return
+        with self.db:
+            self.db.executemany('INSERT INTO scores (name, score, date) VALUES (?, ?, ?)', self.pending)
+        self.pending = []
+
+    def close(self):
+        self.flush()
+        self.db.close()
@@ -0,0 +1,364 @@
+"""
+Level Chunk Renderer
+Pre-renders each level's static geometry into fixed-width transparent PNG
+chunks for compile_levels.py, drawn with canvas2d.Canvas so the chunks match
+what the canvas code in js/level.js draws. Platforms are world-space and go
+into one set of chunks; the non-animated decorations are drawn in screen
+space vertically (the runtime ignores cameraY for them), so they go into a
+second set the runtime blits with the decorations' old transform. The runtime
+then blits the visible chunks instead of redrawing every platform each frame.
+"""
+
+import hashlib
+import io
+import math
+import os
+import re
+
+from asset_manifest import save_png
+from canvas2d import Canvas
+
+CHUNK_WIDTH = 512
+CORNER_SEGMENTS = 8     # points per rounded corner
+
+# Decorations with no time-based animation; the others are still drawn live
+BAKED_DECORATIONS = ['stalactite', 'skull', 'demon_statue', 'stone_pillar', 'gravestone', 'dead_tree']
+
+# ============== DRAWING HELPERS ==============
+
+def fill_rect(ctx, x, y, w, h, color):
+    ctx.fill_style = color
+    ctx.fill_rect(x, y, w, h)
+
+
+def round_rect_points(x, y, w, h, radii):
+    """Outline of ctx.roundRect; radii are (top-left, top-right, bottom-right, bottom-left).
+
+    Radii too large for the rect are scaled down together, as the canvas does.
+    """
+    tl, tr, br, bl = radii
+    scale = min([1.0] + [side / pair for side, pair in
+                         ((w, tl + tr), (w, bl + br), (h, tl + bl), (h, tr + br)) if pair > 0])
+    corners = [
+        (x + tl * scale, y + tl * scale, tl * scale, math.pi),
+        (x + w - tr * scale, y + tr * scale, tr * scale, 1.5 * math.pi),
+        (x + w - br * scale, y + h - br * scale, br * scale, 0.0),
+        (x + bl * scale, y + h - bl * scale, bl * scale, 0.5 * math.pi),
+    ]
+    points = []
+    for cx, cy, r, start in corners:
+        steps = CORNER_SEGMENTS if r > 0 else 0
+        for i in range(steps + 1):
+            angle = start + 0.5 * math.pi * i / max(1, steps)
+            points.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+    return points
+
+
+def fill_round_rect(ctx, x, y, w, h, radius, color, corners=None):
+    """ctx.roundRect + fill; corners is (top-left, top-right, bottom-right, bottom-left)."""
+    if w > 0 and h > 0:
+        radii = [radius if rounded else 0 for rounded in corners or (True,) * 4]
+        ctx.fill_style = color
+        ctx.fill_polygon(round_rect_points(x, y, w, h, radii))
+
+
+def fill_polygon(ctx, points, color):
+    ctx.fill_style = color
+    ctx.fill_polygon(points)
+
+
+def fill_ellipse(ctx, cx, cy, rx, ry, color, start=0.0, end=2 * math.pi):
+    ctx.fill_style = color
+    ctx.fill_ellipse(cx, cy, rx, ry, start, end)
+
+
+def stroke_line(ctx, points, color, width=1):
+    ctx.stroke_style = color
+    ctx.stroke_polyline(points, width)
+
+
+def quad_curve(p0, p1, p2, steps=8):
+    """Sample a quadratic Bezier (ctx.quadraticCurveTo) into points, excluding p0."""
+    points = []
+    for i in range(1, steps + 1):
+        t = i / steps
+        points.append((
+            (1 - t) ** 2 * p0[0] + 2 * (1 - t) * t * p1[0] + t ** 2 * p2[0],
+            (1 - t) ** 2 * p0[1] + 2 * (1 - t) * t * p1[1] + t ** 2 * p2[1],
+        ))
+    return points
+
+
+TOP = (True, True, False, False)
+BOTTOM = (False, False, True, True)
+
+# ============== PLATFORMS (see Level.draw*Platform in js/level.js) ==============
+
+def draw_ground_platform(ctx, x, y, w, h):
+    fill_rect(ctx, x, y, w, h, '#4A3728')
+    for dx in range(8, w - 8, 20):
+        fill_rect(ctx, x + dx, y + 16, 8, h - 24, '#3D2D20')
+    fill_rect(ctx, x, y, w, 14, '#5DAA32')
+    fill_rect(ctx, x, y, w, 6, '#7EC850')
+    for dx in range(6, w - 10, 18):
+        fill_polygon(ctx, [(x + dx, y), (x + dx + 5, y - 6), (x + dx + 10, y)], '#8FD860')
+    fill_rect(ctx, x, y + h - 4, w, 4, '#2A1A10')
+    fill_rect(ctx, x, y + 14, 3, h - 18, '#3A2818')
+    fill_rect(ctx, x + w - 3, y + 14, 3, h - 18, '#3A2818')
+
+
+def draw_floating_platform(ctx, x, y, w, h):
+    fill_round_rect(ctx, x, y + 10, w, h - 10, 6, '#5D4837')
+    fill_rect(ctx, x + 4, y + 14, w - 8, h - 22, '#6D5847')
+    fill_round_rect(ctx, x + 2, y + h - 8, w - 4, 8, 4, '#3D2817', BOTTOM)
+    fill_round_rect(ctx, x, y, w, 14, 6, '#5DAA32', TOP)
+    fill_round_rect(ctx, x + 2, y, w - 4, 6, 4, '#7EC850', TOP)
+    for dx in range(10, w - 14, 22):
+        fill_polygon(ctx, [(x + dx, y), (x + dx + 4, y - 5), (x + dx + 8, y)], '#8FD860')
+
+
+def draw_cave_ground_platform(ctx, x, y, w, h):
+    fill_rect(ctx, x, y, w, h, '#3a2820')
+    for dx in range(5, w - 5, 25):
+        fill_rect(ctx, x + dx, y + 12, 12, h - 20, '#2a1a15')
+    fill_rect(ctx, x, y, w, 12, '#4a3830')
+    fill_rect(ctx, x + 2, y + 2, w - 4, 4, '#5a4840')
+    for dx in range(15, w - 20, 40):
+        fill_rect(ctx, x + dx, y + h - 6, 8, 6, 'rgba(255, 100, 0, 0.3)')
+    fill_rect(ctx, x, y + h - 4, w, 4, '#1a0a05')
+    fill_rect(ctx, x, y + 12, 3, h - 16, '#1a0a05')
+    fill_rect(ctx, x + w - 3, y + 12, 3, h - 16, '#1a0a05')
+
+
+def draw_cave_floating_platform(ctx, x, y, w, h):
+    fill_round_rect(ctx, x, y + 8, w, h - 8, 4, '#3a2820')
+    fill_rect(ctx, x + 3, y + 12, w - 6, h - 18, '#4a3830')
+    fill_round_rect(ctx, x, y, w, 12, 4, '#5a4840', TOP)
+    fill_round_rect(ctx, x + 2, y + 2, w - 4, 4, 2, '#6a5850', TOP)
+    fill_round_rect(ctx, x + 2, y + h - 6, w - 4, 6, 3, '#2a1810', BOTTOM)
+
+
+def draw_demon_ground_platform(ctx, x, y, w, h):
+    fill_rect(ctx, x, y, w, h, '#1a0a10')
+    for dx in range(8, w - 8, 30):
+        fill_rect(ctx, x + dx, y + 14, 15, h - 22, '#2a1520')
+    fill_rect(ctx, x, y, w, 14, '#3a2030')
+    fill_rect(ctx, x + 4, y + 4, w - 8, 2, 'rgba(255, 0, 100, 0.4)')
+    for dx in range(20, w - 20, 60):
+        stroke_line(ctx, [(x + dx, y + 8), (x + dx + 8, y + 12), (x + dx + 16, y + 8)], 'rgba(255, 0, 100, 0.5)')
+    fill_rect(ctx, x, y + h - 5, w, 5, '#0a0005')
+    fill_rect(ctx, x, y + h - 8, w, 8, 'rgba(255, 50, 0, 0.2)')
+
+
+def draw_demon_floating_platform(ctx, x, y, w, h):
+    fill_round_rect(ctx, x, y + 6, w, h - 6, 4, '#1a0a10')
+    fill_rect(ctx, x + 3, y + 10, w - 6, h - 14, '#2a1520')
+    fill_round_rect(ctx, x, y, w, 10, 4, '#3a2030', TOP)
+    fill_round_rect(ctx, x + 2, y + 2, w - 4, 3, 2, 'rgba(255, 0, 100, 0.3)', TOP)
+    fill_round_rect(ctx, x + 2, y + h - 5, w - 4, 5, 2, '#0a0005', BOTTOM)
+    fill_rect(ctx, x, y + h - 3, w, 3, 'rgba(255, 50, 0, 0.15)')
+
+
+def draw_labyrinth_ground_platform(ctx, x, y, w, h):
+    fill_rect(ctx, x, y, w, h, '#2a2a34')
+    for dx in range(0, w, 40):
+        for dy in range(10, h - 5, 25):
+            stagger = (dy // 25) % 2 * 20
+            fill_rect(ctx, x + dx + stagger, y + dy, 38, 23, '#323240')
+            fill_rect(ctx, x + dx + stagger, y + dy + 23, 38, 2, '#1a1a24')
+    fill_rect(ctx, x, y, w, 10, '#3a3a48')
+    fill_rect(ctx, x, y, w, 4, '#444455')
+    fill_rect(ctx, x, y + h - 5, w, 5, '#14141c')
+
+
+def draw_labyrinth_floating_platform(ctx, x, y, w, h):
+    fill_round_rect(ctx, x, y + 4, w, h - 4, 3, '#2a2a34')
+    fill_rect(ctx, x + 4, y + 8, w - 8, h - 12, '#323240')
+    fill_round_rect(ctx, x, y, w, 8, 3, '#3a3a48', TOP)
+    fill_rect(ctx, x + 2, y + 2, w - 4, 2, '#4a4a58')
+    fill_round_rect(ctx, x + 2, y + h - 4, w - 4, 4, 2, '#1a1a24', BOTTOM)
+
+
+def draw_graveyard_ground_platform(ctx, x, y, w, h):
+    fill_rect(ctx, x, y, w, h, '#1a1820')
+    for dx in range(8, w - 8, 25):
+        fill_rect(ctx, x + dx, y + 14, 12, h - 20, '#141218')
+    fill_rect(ctx, x, y, w, 12, '#2a3025')
+    fill_rect(ctx, x, y, w, 5, '#3a4030')
+    for dx in range(8, w - 12, 22):
+        fill_polygon(ctx, [(x + dx, y), (x + dx + 4, y - 5), (x + dx + 8, y)], '#3a3a30')
+    fill_rect(ctx, x, y + h - 5, w, 5, '#0a0810')
+
+
+def draw_graveyard_floating_platform(ctx, x, y, w, h):
+    fill_round_rect(ctx, x, y + 5, w, h - 5, 4, '#2a2830')
+    fill_rect(ctx, x + 4, y + 9, w - 8, h - 13, '#323038')
+    fill_round_rect(ctx, x, y, w, 9, 4, '#2a3428', TOP)
+    fill_rect(ctx, x + 3, y + 2, 15, 4, '#3a4535')
+    fill_rect(ctx, x + w - 20, y + 3, 12, 3, '#3a4535')
+    fill_round_rect(ctx, x + 2, y + h - 4, w - 4, 4, 2, '#141218', BOTTOM)
+
+
+def draw_volcanic_ground_platform(ctx, x, y, w, h):
+    fill_rect(ctx, x, y, w, h, '#2a1810')
+    for dx in range(12, w - 10, 30):
+        stroke_line(ctx, [(x + dx, y + 12), (x + dx + 5, y + h * 0.5), (x + dx - 3, y + h - 8)], '#1a0a05', 2)
+    fill_rect(ctx, x, y, w, 10, '#3a2015')
+    fill_rect(ctx, x, y, w, 4, '#4a2818')
+    for dx in range(20, w - 20, 60):
+        fill_rect(ctx, x + dx, y + 10, 3, 15, 'rgba(255, 100, 0, 0.25)')
+    fill_rect(ctx, x, y + h - 6, w, 6, '#0a0500')
+    fill_rect(ctx, x, y + h - 4, w, 4, 'rgba(255, 80, 0, 0.2)')
+
+
+def draw_volcanic_floating_platform(ctx, x, y, w, h):
+    fill_round_rect(ctx, x, y + 5, w, h - 5, 4, '#2a1810')
+    fill_rect(ctx, x + 4, y + 9, w - 8, h - 13, '#3a2218')
+    fill_round_rect(ctx, x, y, w, 9, 4, '#4a2820', TOP)
+    fill_rect(ctx, x + 2, y + 2, w - 4, 2, 'rgba(255, 120, 0, 0.3)')
+    fill_round_rect(ctx, x + 2, y + h - 5, w - 4, 5, 2, '#0a0500', BOTTOM)
+    fill_rect(ctx, x + 4, y + h - 3, w - 8, 3, 'rgba(255, 80, 0, 0.25)')
+
+
+# theme -> (ground, floating); anything else uses the forest style
+PLATFORM_STYLES = {
+    'dragon_cave': (draw_cave_ground_platform, draw_cave_floating_platform),
+    'demon_throne': (draw_demon_ground_platform, draw_demon_floating_platform),
+    'labyrinth': (draw_labyrinth_ground_platform, draw_labyrinth_floating_platform),
+    'graveyard': (draw_graveyard_ground_platform, draw_graveyard_floating_platform),
+    'volcanic': (draw_volcanic_ground_platform, draw_volcanic_floating_platform),
+}
+DEFAULT_STYLE = (draw_ground_platform, draw_floating_platform)
+
+# ============== DECORATIONS (see Level.draw* in js/level.js) ==============
+
+def draw_stalactite(ctx, x, y, size):
+    fill_polygon(ctx, [(x - size * 0.3, y), (x + size * 0.3, y), (x + size * 0.1, y + size * 0.7),
+                        (x, y + size), (x - size * 0.1, y + size * 0.7)], '#3a2a2a')
+    fill_polygon(ctx, [(x - size * 0.2, y), (x, y), (x - size * 0.05, y + size * 0.8)], '#4a3a3a')
+
+
+def draw_skull(ctx, x, y, size):
+    fill_ellipse(ctx, x, y - size * 0.3, size * 0.5, size * 0.4, '#d0c8b0')
+    fill_ellipse(ctx, x, y + size * 0.1, size * 0.35, size * 0.2, '#d0c8b0', 0, math.pi)
+    fill_ellipse(ctx, x - size * 0.2, y - size * 0.35, size * 0.12, size * 0.15, '#1a0a0a')
+    fill_ellipse(ctx, x + size * 0.2, y - size * 0.35, size * 0.12, size * 0.15, '#1a0a0a')
+    fill_polygon(ctx, [(x, y - size * 0.15), (x - size * 0.08, y), (x + size * 0.08, y)], '#1a0a0a')
+
+
+def draw_demon_statue(ctx, x, y, size):
+    fill_rect(ctx, x, y - size, size * 0.8, size, '#1a0a10')
+    fill_polygon(ctx, [(x + size * 0.4, y - size), (x + size * 0.1, y - size * 0.3),
+                        (x + size * 0.7, y - size * 0.3)], '#2a1520')
+    fill_ellipse(ctx, x + size * 0.4, y - size * 0.75, size * 0.2, size * 0.2, '#2a1520')
+    fill_polygon(ctx, [(x + size * 0.25, y - size * 0.85), (x + size * 0.1, y - size * 1.1),
+                        (x + size * 0.3, y - size * 0.8)], '#1a0a10')
+    fill_polygon(ctx, [(x + size * 0.55, y - size * 0.85), (x + size * 0.7, y - size * 1.1),
+                        (x + size * 0.5, y - size * 0.8)], '#1a0a10')
+    fill_ellipse(ctx, x + size * 0.35, y - size * 0.77, 3, 3, '#ff0044')
+    fill_ellipse(ctx, x + size * 0.45, y - size * 0.77, 3, 3, '#ff0044')
+
+
+def draw_stone_pillar(ctx, x, y, size):
+    fill_rect(ctx, x - size * 0.25, y - size, size * 0.5, size, '#3a3a44')
+    fill_rect(ctx, x - size * 0.2, y - size + 5, size * 0.4, size - 10, '#4a4a55')
+    fill_rect(ctx, x - size * 0.35, y - size - 10, size * 0.7, 15, '#2a2a34')
+    stroke_line(ctx, [(x - size * 0.1, y - size * 0.8), (x, y - size * 0.5),
+                       (x + size * 0.05, y - size * 0.2)], '#1a1a24')
+
+
+def draw_gravestone(ctx, x, y, size):
+    fill_rect(ctx, x - size * 0.4, y - 5, size * 0.8, 8, '#3a3a40')
+    left, right = (x - size * 0.35, y - size * 0.7), (x + size * 0.35, y - size * 0.7)
+    outline = [(x - size * 0.35, y - 5), left] + quad_curve(left, (x, y - size), right) + [(x + size * 0.35, y - 5)]
+    fill_polygon(ctx, outline, '#4a4a55')
+    fill_rect(ctx, x - 2, y - size * 0.75, 4, size * 0.4, '#2a2a34')
+    fill_rect(ctx, x - size * 0.15, y - size * 0.65, size * 0.3, 4, '#2a2a34')
+    fill_ellipse(ctx, x - size * 0.2, y - 6, size * 0.12, 4, '#2a3a2a')
+
+
+def draw_dead_tree(ctx, x, y, size):
+    fill_polygon(ctx, [(x - size * 0.1, y), (x - size * 0.15, y - size * 0.6),
+                        (x + size * 0.15, y - size * 0.6), (x + size * 0.1, y)], '#2a1a15')
+    stroke_line(ctx, [(x, y - size * 0.5), (x - size * 0.4, y - size * 0.8)], '#2a1a15', 4)
+    stroke_line(ctx, [(x - size * 0.25, y - size * 0.65), (x - size * 0.35, y - size * 0.55)], '#2a1a15', 4)
+    stroke_line(ctx, [(x, y - size * 0.55), (x + size * 0.35, y - size * 0.75)], '#2a1a15', 4)
+    stroke_line(ctx, [(x + size * 0.2, y - size * 0.65), (x + size * 0.4, y - size * 0.6)], '#2a1a15', 4)
+    stroke_line(ctx, [(x, y - size * 0.6), (x - size * 0.15, y - size), (x + size * 0.1, y - size * 0.85)],
+                '#2a1a15', 2)
+
+
+DECORATION_DRAWERS = {
+    'stalactite': draw_stalactite,
+    'skull': draw_skull,
+    'demon_statue': draw_demon_statue,
+    'stone_pillar': draw_stone_pillar,
+    'gravestone': draw_gravestone,
+    'dead_tree': draw_dead_tree,
+}
+
+# ============== CHUNK OUTPUT ==============
+
+def render_platform_layer(level):
+    """Draw the static platforms onto one level-sized RGBA image, in world space."""
+    ctx = Canvas(level['width'], level['height'])
+    ground, floating = PLATFORM_STYLES.get(level.get('theme'), DEFAULT_STYLE)
+    for platform in level.get('platforms', []):
+        style = ground if platform.get('isGround') else floating
+        style(ctx, int(platform['x']), int(platform['y']), int(platform['width']), int(platform['height']))
+    return ctx.image
+
+
+def render_decoration_layer(level, decorations):
+    """Draw the baked decorations onto one level-sized RGBA image.
+
+    x is world space and y is screen space, as in Level.drawDecorations.
+    """
+    ctx = Canvas(level['width'], level['height'])
+    for deco in decorations:
+        drawer = DECORATION_DRAWERS.get(deco['type'])
+        if drawer:
+            drawer(ctx, deco['x'], deco['y'], deco['size'])
+    return ctx.image
+
+
+def write_chunks(layer, level_id, layer_name, output_dir, chunk_width):
+    """Slice a layer into chunk PNGs; returns their pack-relative files, None where empty."""
+    files = []
+    for i, left in enumerate(range(0, layer.width, chunk_width)):
+        chunk = layer.crop((left, 0, min(left + chunk_width, layer.width), layer.height))
+        if chunk.getbbox() is None:
+            files.append(None)
+            continue
+        buffer = io.BytesIO()
+        save_png(chunk, buffer)
+        digest = hashlib.sha1(buffer.getvalue()).hexdigest()[:10]
+        name = f"chunks/{level_id}_{layer_name}{i}_{digest}.png"
+        with open(os.path.join(output_dir, name), 'wb') as f:
+            f.write(buffer.getvalue())
+        files.append(name)
+    return files
+
+
+def render_chunks(level_id, level, decorations, output_dir, chunk_width=CHUNK_WIDTH):
+    """Slice the platform and decoration layers into chunk PNGs and return the pack's chunk table.
+
+    Files are relative to the pack directory and named after a hash of their
+    contents, so browser caches stay valid until the art actually changes.
+    Fully transparent chunks are stored as null so the runtime skips them.
+    """
+    chunk_dir = os.path.join(output_dir, 'chunks')
+    os.makedirs(chunk_dir, exist_ok=True)
+    stale_name = re.compile(re.escape(level_id) + r'_(deco)?\d+(_[0-9a-f]+)?\.png')
+    for stale in os.listdir(chunk_dir):
+        if stale_name.fullmatch(stale):
+            os.remove(os.path.join(chunk_dir, stale))
+
+    return {
+        'width': chunk_width,
+        'height': level['height'],
+        'files': write_chunks(render_platform_layer(level), level_id, '', output_dir, chunk_width),
+        'decorationFiles': write_chunks(render_decoration_layer(level, decorations), level_id, 'deco',
+                                        output_dir, chunk_width),
+        'bakedDecorations': BAKED_DECORATIONS,
+    }
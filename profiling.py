@@ -0,0 +1,174 @@
+"""
+Generator Profiling
+Shared --timings / --profile support for the asset generators. With
+--timings a generator reports wall and CPU time per stage (parse,
+rasterize, scale, encode, write, ...) and per entity (an enemy, a boss, a
+player variant); with --profile it also runs under cProfile, dumps the
+stats to a pstats file and prints the hottest functions.
+
+Generators mark their work with `timings.stage(name)` and
+`timings.entity(name)`; both cost nothing until timings are switched on.
+Stage CPU time is per thread, so the writer threads of frame_pipeline.py are
+counted correctly.
+
+Usage (any generator):
+    python generate_enemy_animations.py --timings
+    python generate_boss_animations.py dragon --profile build/profiles/dragon.pstats
+    python -m pstats build/profiles/dragon.pstats
+"""
+
+import cProfile
+import contextlib
+import io
+import os
+import pstats
+import threading
+import time
+
+from asset_manifest import save_png
+
+PROFILE_TOP = 20    # functions listed after a --profile run
+
+
+class Timings:
+    def __init__(self):
+        self.enabled = False
+        self.stages = {}        # name: [calls, wall, cpu]
+        self.entities = {}      # name: [files written, wall, cpu]
+        self.local = threading.local()  # open_stages, open_entities, current_entity
+        self.lock = threading.Lock()
+        self.started = None
+
+    def start(self):
+        self.enabled = True
+        self.started = (time.perf_counter(), time.process_time())
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Time a block; a stage nested in another counts only towards itself."""
+        if not self.enabled:
+            yield
+            return
+        open_stages = self.local.__dict__.setdefault('open_stages', [])
+        frame = [time.perf_counter(), time.thread_time(), 0.0, 0.0]  # start, time in nested stages
+        open_stages.append(frame)
+        try:
+            yield
+        finally:
+            open_stages.pop()
+            wall = time.perf_counter() - frame[0]
+            cpu = time.thread_time() - frame[1]
+            with self.lock:
+                totals = self.stages.setdefault(name, [0, 0.0, 0.0])
+                totals[0] += 1
+                totals[1] += wall - frame[2]
+                totals[2] += cpu - frame[3]
+            if open_stages:
+                open_stages[-1][2] += wall
+                open_stages[-1][3] += cpu
+
+    @property
+    def current_entity(self):
+        return getattr(self.local, 'current_entity', None)
+
+    @contextlib.contextmanager
+    def entity(self, name):
+        if not self.enabled or name is None:
+            yield
+            return
+        outer = self.current_entity
+        self.local.current_entity = name
+        open_entities = self.local.__dict__.setdefault('open_entities', [])
+        frame = [time.perf_counter(), time.thread_time(), 0.0, 0.0]  # start, time excluded
+        open_entities.append(frame)
+        try:
+            yield
+        finally:
+            open_entities.pop()
+            with self.lock:
+                totals = self.entities.setdefault(name, [0, 0.0, 0.0])
+                totals[1] += time.perf_counter() - frame[0] - frame[2]
+                totals[2] += time.thread_time() - frame[1] - frame[3]
+            self.local.current_entity = outer
+
+    @contextlib.contextmanager
+    def excluded(self):
+        """A block (such as waiting on a queue) left out of the open entities' time."""
+        if not self.enabled:
+            yield
+            return
+        wall, cpu = time.perf_counter(), time.thread_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.thread_time() - cpu
+            for frame in self.local.__dict__.get('open_entities', []):
+                frame[2] += wall
+                frame[3] += cpu
+
+    def count_file(self, entity=None):
+        """Count a written file towards entity, or the thread's current one."""
+        entity = entity if entity is not None else self.current_entity
+        if self.enabled and entity is not None:
+            with self.lock:
+                self.entities.setdefault(entity, [0, 0.0, 0.0])[0] += 1
+
+    def report(self):
+        wall = time.perf_counter() - self.started[0]
+        cpu = time.process_time() - self.started[1]
+        print(f"\n{'stage':<16}{'calls':>8}{'wall ms':>11}{'cpu ms':>11}{'share':>8}")
+        for name, (calls, stage_wall, stage_cpu) in sorted(self.stages.items(), key=lambda item: -item[1][1]):
+            print(f"{name:<16}{calls:>8}{stage_wall * 1e3:>11.1f}{stage_cpu * 1e3:>11.1f}{stage_wall / wall:>8.0%}")
+        other = wall - sum(totals[1] for totals in self.stages.values())
+        if other >= 0:
+            print(f"{'(other)':<16}{'':>8}{other * 1e3:>11.1f}{'':>11}{other / wall:>8.0%}")
+        else:
+            print("(stages overlapped on writer threads, so their shares add up to more than 100%)")
+        print(f"{'total':<16}{'':>8}{wall * 1e3:>11.1f}{cpu * 1e3:>11.1f}")
+
+        if self.entities:
+            print(f"\n{'entity':<20}{'files':>7}{'wall ms':>11}{'cpu ms':>11}")
+            for name, (files, entity_wall, entity_cpu) in sorted(self.entities.items(), key=lambda item: -item[1][1]):
+                print(f"{name:<20}{files:>7}{entity_wall * 1e3:>11.1f}{entity_cpu * 1e3:>11.1f}")
+
+
+timings = Timings()
+
+
+def write_png(image, path, entity=None):
+    """save_png, timed as separate encode and write stages; the file counts towards entity."""
+    with timings.stage('encode'):
+        buffer = io.BytesIO()
+        save_png(image, buffer)
+    with timings.stage('write'):
+        with open(path, 'wb') as f:
+            f.write(buffer.getbuffer())
+    timings.count_file(entity)
+
+
+def add_arguments(parser):
+    parser.add_argument('--timings', action='store_true',
+                        help="print wall/CPU time per stage and per entity")
+    parser.add_argument('--profile', metavar='PATH',
+                        help="run under cProfile and dump pstats to PATH (implies --timings)")
+
+
+def run(args, func, *func_args):
+    """Call func, with the timings and profiler the command line asked for."""
+    if not (args.timings or args.profile):
+        return func(*func_args)
+
+    timings.start()
+    if not args.profile:
+        result = func(*func_args)
+        timings.report()
+        return result
+
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *func_args)
+    timings.report()
+    os.makedirs(os.path.dirname(args.profile) or '.', exist_ok=True)
+    profiler.dump_stats(args.profile)
+    print(f"\nProfile saved to: {args.profile}")
+    pstats.Stats(profiler).sort_stats('cumulative').print_stats(PROFILE_TOP)
+    return result
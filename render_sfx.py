@@ -0,0 +1,206 @@
+"""
+Sound Effect Renderer
+Pre-synthesizes every SoundManager effect from js/sound.js into a small WAV
+file with NumPy, reproducing the oscillator waveforms, frequency sweeps,
+noise bursts and exponential gain envelopes, and registers them in the
+asset manifest so the game can play one decoded buffer per event.
+
+Usage:
+    python render_sfx.py                  # write build/sfx/*.wav
+    python render_sfx.py --rate 44100     # custom sample rate
+"""
+
+import argparse
+import math
+import os
+import wave
+
+import numpy as np
+
+from asset_manifest import BUILD_DIR, register_assets
+
+OUTPUT_DIR = os.path.join(BUILD_DIR, 'sfx')
+SAMPLE_RATE = 22050
+SFX_VOLUME = 0.5        # SoundManager.sfxVolume default the buffers are rendered at
+ENVELOPE_FLOOR = 0.01   # exponentialRampToValueAtTime target used by every effect
+NOISE_CUTOFF = 1000     # lowpass filter frequency in playNoise()
+NOISE_SEED = 1
+IMPULSE_FLOOR = 1e-12  # lowpass impulse response below this is cut off
+
+# Mirrors the switch in SoundManager.play(); times are the setTimeout delays in seconds.
+#   ('tone', start, frequency, duration, wave, volume)
+#   ('sweep', start, start_freq, end_freq, duration, wave, volume)
+#   ('noise', start, duration, volume)
+SOUND_EFFECTS = {
+    'shoot': [('tone', 0, 880, 0.1, 'square', 0.3)],
+    'hit': [('tone', 0, 220, 0.15, 'sawtooth', 0.4)],
+    'hurt': [
+        ('tone', 0, 150, 0.2, 'square', 0.5),
+        ('tone', 0, 100, 0.3, 'square', 0.3),
+    ],
+    'death': [
+        ('tone', 0, 200, 0.1, 'square', 0.4),
+        ('tone', 0.1, 150, 0.1, 'square', 0.3),
+        ('tone', 0.2, 100, 0.2, 'square', 0.3),
+    ],
+    'jump': [('sweep', 0, 300, 600, 0.15, 'square', 0.2)],
+    'pickup': [
+        ('tone', 0, 523, 0.1, 'sine', 0.3),
+        ('tone', 0.08, 659, 0.1, 'sine', 0.3),
+        ('tone', 0.16, 784, 0.15, 'sine', 0.3),
+    ],
+    'powerup': [
+        ('tone', 0, 440, 0.1, 'sine', 0.4),
+        ('tone', 0.1, 554, 0.1, 'sine', 0.4),
+        ('tone', 0.2, 659, 0.1, 'sine', 0.4),
+        ('tone', 0.3, 880, 0.2, 'sine', 0.4),
+    ],
+    'enemyDeath': [
+        ('noise', 0, 0.15, 0.4),
+        ('tone', 0, 200, 0.1, 'square', 0.3),
+    ],
+    'bossDeath': [
+        ('noise', 0, 0.3, 0.5),
+        ('tone', 0, 150, 0.3, 'square', 0.5),
+        ('tone', 0, 100, 0.4, 'sawtooth', 0.4),
+    ],
+    'levelComplete': [('tone', i * 0.15, freq, 0.2, 'sine', 0.4) for i, freq in enumerate([523, 659, 784, 1047])],
+    'gameOver': [
+        ('tone', 0, 294, 0.3, 'square', 0.4),
+        ('tone', 0.3, 262, 0.3, 'square', 0.4),
+        ('tone', 0.6, 220, 0.5, 'square', 0.4),
+    ],
+    'melee': [('sweep', 0, 400, 200, 0.1, 'sawtooth', 0.3)],
+    'select': [('tone', 0, 660, 0.08, 'square', 0.2)],
+    'pause': [('tone', 0, 440, 0.1, 'square', 0.3)],
+}
+
+# ============== SYNTHESIS ==============
+
+def oscillator(phase, wave_type):
+    """Web Audio oscillator shapes for a phase array measured in cycles."""
+    frac = phase % 1.0
+    if wave_type == 'sine':
+        return np.sin(2 * np.pi * phase)
+    if wave_type == 'square':
+        return np.where(frac < 0.5, 1.0, -1.0)
+    if wave_type == 'sawtooth':
+        return 2.0 * frac - 1.0
+    if wave_type == 'triangle':
+        return 1.0 - 4.0 * np.abs(frac - 0.5)
+    raise ValueError(f"Unknown wave type: {wave_type}")
+
+
+def envelope(t, duration, volume):
+    """Gain curve of setValueAtTime(volume * sfxVolume) + exponentialRampToValueAtTime(0.01, duration).
+
+    Baked at the default sfxVolume (which also keeps stacked events from
+    clipping); the runtime scales by sfxVolume / SFX_VOLUME.
+    """
+    start = volume * SFX_VOLUME
+    return start * (ENVELOPE_FLOOR / start) ** (t / duration)
+
+
+def render_tone(frequency, duration, wave_type, volume, rate):
+    t = np.arange(int(duration * rate)) / rate
+    return oscillator(frequency * t, wave_type) * envelope(t, duration, volume)
+
+
+def render_sweep(start_freq, end_freq, duration, wave_type, volume, rate):
+    """Exponential frequency ramp; phase is the closed-form integral of f(t)."""
+    t = np.arange(int(duration * rate)) / rate
+    ratio = end_freq / start_freq
+    phase = start_freq * duration / math.log(ratio) * (ratio ** (t / duration) - 1)
+    return oscillator(phase, wave_type) * envelope(t, duration, volume)
+
+
+def lowpass(samples, cutoff, rate, q=10 ** (1 / 20)):
+    """Biquad lowpass matching a Web Audio BiquadFilterNode (Q of 1 dB)."""
+    w0 = 2 * math.pi * cutoff / rate
+    alpha = math.sin(w0) / (2 * q)
+    cos_w0 = math.cos(w0)
+    a0 = 1 + alpha
+    b0 = b2 = (1 - cos_w0) / 2 / a0
+    b1 = (1 - cos_w0) / a0
+    a1 = -2 * cos_w0 / a0
+    a2 = (1 - alpha) / a0
+
+    # The filter is stable, so its impulse response dies out after a few
+    # hundred samples; run the recursion that long on a unit impulse and
+    # apply the result as one FIR convolution
+    response = []
+    x1 = x2 = y1 = y2 = 0.0
+    x0 = 1.0
+    while len(response) < len(samples):
+        y0 = b0 * x0 + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+        response.append(y0)
+        x2, x1, x0, y2, y1 = x1, x0, 0.0, y1, y0
+        if len(response) > 2 and abs(y1) + abs(y2) < IMPULSE_FLOOR:
+            break
+    return np.convolve(samples, response)[:len(samples)]
+
+
+def render_noise(duration, volume, rate, rng):
+    t = np.arange(int(duration * rate)) / rate
+    noise = rng.uniform(-1.0, 1.0, len(t))
+    return lowpass(noise, NOISE_CUTOFF, rate) * envelope(t, duration, volume)
+
+
+def render_effect(events, rate=SAMPLE_RATE, seed=NOISE_SEED):
+    """Mix an effect's events into one float buffer in [-1, 1]."""
+    rng = np.random.default_rng(seed)
+    parts = []
+    for event in events:
+        kind, start = event[0], event[1]
+        if kind == 'tone':
+            samples = render_tone(*event[2:], rate)
+        elif kind == 'sweep':
+            samples = render_sweep(*event[2:], rate)
+        elif kind == 'noise':
+            samples = render_noise(*event[2:], rate, rng)
+        else:
+            raise ValueError(f"Unknown event kind: {kind}")
+        parts.append((int(start * rate), samples))
+
+    buffer = np.zeros(max(offset + len(samples) for offset, samples in parts))
+    for offset, samples in parts:
+        buffer[offset:offset + len(samples)] += samples
+    return np.clip(buffer, -1.0, 1.0)
+
+
+def write_wav(path, samples, rate):
+    """Write mono 16-bit PCM."""
+    pcm = (samples * 32767).astype('<i2')
+    with wave.open(path, 'wb') as f:
+        f.setnchannels(1)
+        f.setsampwidth(2)
+        f.setframerate(rate)
+        f.writeframes(pcm.tobytes())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render SoundManager effects to WAV files")
+    parser.add_argument('-o', '--output', default=OUTPUT_DIR, help="output directory")
+    parser.add_argument('--rate', type=int, default=SAMPLE_RATE, help="sample rate in Hz")
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.output, exist_ok=True)
+    print(f"Rendering sound effects at {args.rate} Hz...")
+
+    entries = {}
+    for name, events in SOUND_EFFECTS.items():
+        samples = render_effect(events, args.rate)
+        path = os.path.join(args.output, f"{name}.wav")
+        write_wav(path, samples, args.rate)
+        entries[name] = {
+            'file': os.path.relpath(path, BUILD_DIR).replace(os.sep, '/'),
+            'duration': round(len(samples) / args.rate, 3),
+        }
+        print(f"  {name}: {entries[name]['duration']}s, {os.path.getsize(path)} bytes")
+
+    register_assets('sfx', {'sampleRate': args.rate, 'volume': SFX_VOLUME, 'effects': entries})
+    print(f"\nSound effects saved to: {args.output}/")
+
+
+if __name__ == '__main__':
+    main()
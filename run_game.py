@@ -2,19 +2,557 @@
 """
 Simple HTTP server to run Retrocorn game.
 Run this script and open http://localhost:8000 in your browser.
+
+Static files up to 256 KB are kept in an in-memory LRU cache (checked
+against the file's mtime on every request); larger ones are sent straight
+from disk with sendfile. Single byte ranges (Range: bytes=...) are honoured.
+
+With --watch it also runs watch.py's rebuild loop and pushes the results to
+open pages as Server-Sent Events (GET /api/events): rebuilt images and
+stylesheets are swapped in place, script or page changes reload the page.
+
+--network (or --latency / --bandwidth / --max-connections) emulates a slow
+connection: every response waits the added latency, every connection is
+paced to the bandwidth, and only so many connections are served at once, so
+cold-load times of different asset layouts can be compared locally.
+
+Every request is counted per path (status, bytes, latency histogram) and
+the counters are served at GET /metrics in the Prometheus text format.
+--access-log PATH also appends one JSON line per request, buffered and
+written in batches.
+
+Besides the static files it serves two small APIs for the game:
+    POST /api/telemetry   batched frame-time samples, appended to
+                          build/telemetry/frames.jsonl (see analyze_telemetry.py)
+    GET  /api/scores      the shared leaderboard (data/leaderboard.db)
+    POST /api/scores      submit {"name": ..., "score": ...}
 """
 
+import argparse
+import bisect
+import email.utils
 import http.server
+import json
+import os
+import queue
+import re
+import signal
 import socketserver
+import sys
+import threading
+import time
 import webbrowser
-import os
+from collections import OrderedDict
+
+from leaderboard import Leaderboard
 
 PORT = 8000
+TELEMETRY_PATH = os.path.join('build', 'telemetry', 'frames.jsonl')
+MAX_POST_BYTES = 1 << 20
+CACHE_BUDGET = 64 << 20     # bytes of file contents held in memory
+CACHE_MAX_FILE = 256 << 10  # larger files are streamed with sendfile
+RANGE_RE = re.compile(r'bytes=(\d*)-(\d*)')
+# Upper bounds (seconds) of the /metrics latency histogram buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# name: (latency ms, bandwidth KB/s, concurrent connections), after the
+# browser devtools throttling presets and a browser's per-host limit
+NETWORK_PRESETS = {
+    'slow-3g': (2000, 50, 6),
+    'fast-3g': (563, 180, 6),
+    'fast-4g': (60, 1012, 6),
+}
 
 # Change to the script's directory
 os.chdir(os.path.dirname(os.path.abspath(__file__)))
 
-Handler = http.server.SimpleHTTPRequestHandler
+
+class JsonLinesLog:
+    """Buffered appends of JSON-lines records.
+
+    Records are kept in memory and written in one append once enough have
+    piled up or the flush interval has passed, so a steady stream of small
+    batches doesn't turn into a write per request. Used for the telemetry
+    samples and the access log.
+    """
+
+    def __init__(self, path, flush_records=2000, flush_interval=5.0):
+        self.path = path
+        self.flush_records = flush_records
+        self.flush_interval = flush_interval
+        self.buffer = []
+        self.last_flush = time.monotonic()
+        self.lock = threading.Lock()
+
+    def append(self, records):
+        lines = [json.dumps(r, separators=(',', ':')) + '\n' for r in records]
+        with self.lock:
+            self.buffer.extend(lines)
+            if len(self.buffer) >= self.flush_records or time.monotonic() - self.last_flush >= self.flush_interval:
+                self._flush()
+
+    def flush(self):
+        with self.lock:
+            self._flush()
+
+    def _flush(self):
+        self.last_flush = time.monotonic()
+        if not self.buffer:
+            return
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        with open(self.path, 'a', encoding='utf-8') as f:
+            f.write(''.join(self.buffer))
+        self.buffer = []
+
+
+class FileCache:
+    """LRU cache of file contents with a total byte budget.
+
+    Entries are keyed by path and remember the mtime and size they were read
+    at, so an edited file is re-read on its next request.
+    """
+
+    def __init__(self, budget=CACHE_BUDGET):
+        self.budget = budget
+        self.size = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, path, stat):
+        key = (stat.st_mtime_ns, stat.st_size)
+        with self.lock:
+            entry = self.entries.get(path)
+            if entry and entry[0] == key:
+                self.entries.move_to_end(path)
+                return entry[1]
+
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        with self.lock:
+            old = self.entries.pop(path, None)
+            if old:
+                self.size -= len(old[1])
+            self.entries[path] = (key, data)
+            self.size += len(data)
+            while self.size > self.budget:
+                _, (_, evicted) = self.entries.popitem(last=False)
+                self.size -= len(evicted)
+        return data
+
+
+class EventHub:
+    """Fan-out of Server-Sent Events to every connected page."""
+
+    def __init__(self):
+        self.clients = set()
+        self.lock = threading.Lock()
+
+    def subscribe(self):
+        client = queue.Queue()
+        with self.lock:
+            self.clients.add(client)
+        return client
+
+    def unsubscribe(self, client):
+        with self.lock:
+            self.clients.discard(client)
+
+    def publish(self, event, data):
+        message = f"event: {event}\ndata: {json.dumps(data)}\n\n".encode('utf-8')
+        with self.lock:
+            for client in self.clients:
+                client.put(message)
+
+
+def publish_changes(files):
+    """Watcher callback: turn changed files into a live-reload event."""
+    if any(path.endswith(('.js', '.html')) for path in files):
+        events.publish('reload', {'files': files})
+        return
+    swappable = [path for path in files if path.endswith(('.png', '.css'))]
+    if swappable:
+        events.publish('assets', {'files': swappable})
+
+
+class ThrottledWriter:
+    """Wraps a connection's output file and paces writes to a byte rate."""
+
+    def __init__(self, raw, rate):
+        self.raw = raw
+        self.rate = rate
+        self.chunk = max(1024, int(rate / 20))
+        self.started = None
+        self.sent = 0
+
+    def write(self, data):
+        if self.started is None:
+            self.started = time.monotonic()
+        view = memoryview(data)
+        for offset in range(0, len(view), self.chunk):
+            part = view[offset:offset + self.chunk]
+            self.raw.write(part)
+            self.sent += len(part)
+            delay = self.started + self.sent / self.rate - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        return len(view)
+
+    def flush(self):
+        self.raw.flush()
+
+    def close(self):
+        self.raw.close()
+
+    @property
+    def closed(self):
+        return self.raw.closed
+
+
+class RequestMetrics:
+    """Per-path request counts, response bytes and latency histograms.
+
+    Rendered for GET /metrics in the Prometheus text exposition format.
+    Requests for missing files are counted under one "(not found)" path so
+    stray URLs can't grow the tables without bound.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.requests = {}      # (path, method, status): count
+        self.bytes = {}         # path: response bytes
+        self.latency = {}       # path: [count per bucket..., +Inf count, sum]
+        self.lock = threading.Lock()
+
+    def record(self, path, method, status, size, seconds):
+        if status in (404, 501):
+            path = '(not found)'
+        with self.lock:
+            key = (path, method, status)
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.bytes[path] = self.bytes.get(path, 0) + size
+            histogram = self.latency.setdefault(path, [0] * (len(self.buckets) + 2))
+            histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+            histogram[-1] += seconds
+
+    def render(self):
+        with self.lock:
+            requests = sorted(self.requests.items())
+            sizes = sorted(self.bytes.items())
+            latency = sorted((path, list(histogram)) for path, histogram in self.latency.items())
+
+        lines = [
+            '# HELP retrocorn_http_requests_total Requests served, by path, method and status.',
+            '# TYPE retrocorn_http_requests_total counter',
+        ]
+        for (path, method, status), count in requests:
+            lines.append(f'retrocorn_http_requests_total{{path="{label(path)}",method="{label(method)}",'
+                         f'status="{status}"}} {count}')
+        lines += [
+            '# HELP retrocorn_http_response_bytes_total Response body bytes sent, by path.',
+            '# TYPE retrocorn_http_response_bytes_total counter',
+        ]
+        for path, size in sizes:
+            lines.append(f'retrocorn_http_response_bytes_total{{path="{label(path)}"}} {size}')
+        lines += [
+            '# HELP retrocorn_http_request_duration_seconds Time from request line to last byte, by path.',
+            '# TYPE retrocorn_http_request_duration_seconds histogram',
+        ]
+        for path, histogram in latency:
+            total = 0
+            for bound, count in zip([*self.buckets, '+Inf'], histogram):
+                total += count
+                lines.append(f'retrocorn_http_request_duration_seconds_bucket{{path="{label(path)}",'
+                             f'le="{bound}"}} {total}')
+            lines.append(f'retrocorn_http_request_duration_seconds_sum{{path="{label(path)}"}} {histogram[-1]:.6f}')
+            lines.append(f'retrocorn_http_request_duration_seconds_count{{path="{label(path)}"}} {total}')
+        return '\n'.join(lines) + '\n'
+
+
+def label(value):
+    """Escape a Prometheus label value."""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def parse_range(header, size):
+    """(start, end) inclusive for a single byte range, or None to send the whole file.
+
+    Raises ValueError when the range starts past the end of the file.
+    """
+    match = RANGE_RE.fullmatch(header.strip())
+    if not match or match.groups() == ('', ''):
+        return None
+    first, last = match.groups()
+    if not first:
+        # Suffix range: the last N bytes
+        if int(last) == 0:
+            raise ValueError(header)
+        return max(0, size - int(last)), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise ValueError(header)
+    return start, end
+
+
+telemetry = JsonLinesLog(TELEMETRY_PATH)
+metrics = RequestMetrics()
+access_log = None   # JsonLinesLog when running with --access-log
+file_cache = FileCache()
+events = None   # EventHub when running with --watch
+leaderboard = Leaderboard()
+
+
+class GameRequestHandler(http.server.SimpleHTTPRequestHandler):
+    # Network emulation, configured from the command line
+    latency = 0.0               # seconds added before every response
+    bandwidth = 0               # bytes per second per connection, 0 = unlimited
+    connection_slots = None     # semaphore capping concurrent connections
+
+    def setup(self):
+        super().setup()
+        if self.bandwidth:
+            self.wfile = ThrottledWriter(self.wfile, self.bandwidth)
+
+    def handle(self):
+        if self.connection_slots is None:
+            super().handle()
+            return
+        self.connection_slots.acquire()
+        self.holds_slot = True
+        try:
+            super().handle()
+        finally:
+            self.release_slot()
+
+    def release_slot(self):
+        """Give this connection's slot back early (for long-lived streams)."""
+        if getattr(self, 'holds_slot', False):
+            self.holds_slot = False
+            self.connection_slots.release()
+
+    def handle_one_request(self):
+        self.started = time.perf_counter()
+        self.status = None
+        self.body_bytes = 0
+        super().handle_one_request()
+        if self.status is not None:
+            self.record_request(time.perf_counter() - self.started)
+
+    def record_request(self, seconds):
+        route = getattr(self, 'path', '').split('?')[0]
+        size = 0 if self.command == 'HEAD' else self.body_bytes
+        metrics.record(route, self.command, self.status, size, seconds)
+        if access_log:
+            access_log.append([{
+                'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                'client': self.client_address[0],
+                'method': self.command,
+                'path': getattr(self, 'path', ''),
+                'status': self.status,
+                'bytes': size,
+                'ms': round(seconds * 1000, 2),
+                'range': self.headers.get('Range') if getattr(self, 'headers', None) else None,
+            }])
+
+    def send_response(self, code, message=None):
+        if self.latency:
+            time.sleep(self.latency)
+        self.status = code
+        super().send_response(code, message)
+
+    def send_header(self, keyword, value):
+        if keyword.lower() == 'content-length':
+            self.body_bytes = int(value)
+        super().send_header(keyword, value)
+
+    def do_GET(self):
+        route = self.path.split('?')[0]
+        if route == '/api/scores':
+            self.send_json(200, {'scores': leaderboard.top()})
+        elif route == '/metrics':
+            self.send_metrics()
+        elif route == '/api/events' and events:
+            self.stream_events()
+        elif not self.send_static():
+            super().do_GET()
+
+    def stream_events(self):
+        # The stream stays open as long as the page does, so it doesn't count
+        # against --max-connections; the page's other requests would stall
+        self.release_slot()
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        client = events.subscribe()
+        try:
+            while True:
+                try:
+                    self.wfile.write(client.get(timeout=15))
+                except queue.Empty:
+                    self.wfile.write(b": keep-alive\n\n")
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            events.unsubscribe(client)
+
+    def do_HEAD(self):
+        if not self.send_static(head_only=True):
+            super().do_HEAD()
+
+    def send_static(self, head_only=False):
+        """Serve a regular file from the cache or with sendfile.
+
+        Returns False for anything SimpleHTTPRequestHandler should handle
+        itself (missing files, directory redirects and listings).
+        """
+        path = self.translate_path(self.path)
+        if os.path.isdir(path):
+            if not self.path.split('?')[0].endswith('/'):
+                return False
+            path = os.path.join(path, 'index.html')
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return False
+        if not os.path.isfile(path):
+            return False
+
+        last_modified = self.date_time_string(stat.st_mtime)
+        byte_range = None
+        if 'Range' in self.headers and self.headers.get('If-Range', last_modified) == last_modified:
+            try:
+                byte_range = parse_range(self.headers['Range'], stat.st_size)
+            except ValueError:
+                self.send_response(416)
+                self.send_header('Content-Range', f"bytes */{stat.st_size}")
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return True
+        elif self.not_modified_since(stat):
+            self.send_response(304)
+            self.end_headers()
+            return True
+
+        start, end = byte_range or (0, stat.st_size - 1)
+        self.send_response(206 if byte_range else 200)
+        self.send_header('Content-Type', self.guess_type(path))
+        self.send_header('Content-Length', str(end - start + 1))
+        self.send_header('Last-Modified', last_modified)
+        self.send_header('Accept-Ranges', 'bytes')
+        if byte_range:
+            self.send_header('Content-Range', f"bytes {start}-{end}/{stat.st_size}")
+        self.end_headers()
+        if head_only or end < start:
+            return True
+
+        if stat.st_size <= CACHE_MAX_FILE:
+            self.wfile.write(file_cache.get(path, stat)[start:end + 1])
+        elif self.bandwidth:
+            # Throttled: go through wfile so the pacing applies
+            with open(path, 'rb') as f:
+                f.seek(start)
+                remaining = end - start + 1
+                while remaining > 0:
+                    data = f.read(min(remaining, 64 << 10))
+                    if not data:
+                        break
+                    self.wfile.write(data)
+                    remaining -= len(data)
+        else:
+            # socket.sendfile uses os.sendfile where the OS has it
+            with open(path, 'rb') as f:
+                self.connection.sendfile(f, start, end - start + 1)
+        return True
+
+    def not_modified_since(self, stat):
+        header = self.headers.get('If-Modified-Since')
+        if not header or 'If-None-Match' in self.headers:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(header)
+        except (TypeError, ValueError, IndexError, OverflowError):
+            return False
+        return since is not None and int(stat.st_mtime) <= since.timestamp()
+
+    def do_POST(self):
+        route = self.path.split('?')[0]
+        if route not in ('/api/telemetry', '/api/scores'):
+            self.send_error(404)
+            return
+
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_POST_BYTES:
+            self.send_error(413)
+            return
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            self.send_error(400, "Body must be JSON")
+            return
+
+        if route == '/api/telemetry':
+            self.post_telemetry(body)
+        else:
+            self.post_score(body)
+
+    def post_telemetry(self, batch):
+        samples = batch.get('samples') if isinstance(batch, dict) else None
+        if not isinstance(samples, list):
+            self.send_error(400, "Expected {\"session\": ..., \"samples\": [...]}")
+            return
+
+        session = batch.get('session')
+        telemetry.append(
+            dict(sample, session=session) for sample in samples if isinstance(sample, dict)
+        )
+        self.send_response(204)
+        self.end_headers()
+
+    def post_score(self, entry):
+        score = entry.get('score') if isinstance(entry, dict) else None
+        if not isinstance(score, int) or isinstance(score, bool) or score < 0:
+            self.send_error(400, "Expected {\"name\": ..., \"score\": <non-negative integer>}")
+            return
+
+        # Queued for the next batch insert; the next GET sees it
+        leaderboard.add(entry.get('name', 'Player'), score)
+        self.send_response(202)
+        self.end_headers()
+
+    def send_metrics(self):
+        body = metrics.render().encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, status, data):
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Cache-Control', 'no-store')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # Telemetry arrives every few seconds; keep it out of the console
+        if not getattr(self, 'path', '').startswith(('/api/telemetry', '/api/events', '/metrics')):
+            super().log_message(format, *args)
+
+
+class GameServer(socketserver.ThreadingTCPServer):
+    # One thread per request: event streams stay open for as long as a page does
+    daemon_threads = True
+
+
+Handler = GameRequestHandler
 
 # Add MIME types for game assets
 Handler.extensions_map.update({
@@ -25,15 +563,64 @@ Handler.extensions_map.update({
     '.html': 'text/html',
 })
 
+parser = argparse.ArgumentParser(description="Serve the game on http://localhost:8000")
+parser.add_argument('--watch', action='store_true',
+                    help="rebuild assets on change and live-reload open pages")
+parser.add_argument('--access-log', metavar='PATH',
+                    help="append a JSON line per request to this file (buffered)")
+parser.add_argument('--network', choices=sorted(NETWORK_PRESETS),
+                    help="emulate a connection preset (the options below override it)")
+parser.add_argument('--latency', type=float, help="milliseconds added before every response")
+parser.add_argument('--bandwidth', type=float, help="per-connection bandwidth in KB/s")
+parser.add_argument('--max-connections', type=int, help="connections served at once")
+args = parser.parse_args()
+
+latency, bandwidth, max_connections = NETWORK_PRESETS.get(args.network, (0, 0, 0))
+latency = args.latency if args.latency is not None else latency
+bandwidth = args.bandwidth if args.bandwidth is not None else bandwidth
+max_connections = args.max_connections if args.max_connections is not None else max_connections
+if latency < 0 or bandwidth < 0 or max_connections < 0:
+    parser.error("network settings must not be negative")
+GameRequestHandler.latency = latency / 1000
+GameRequestHandler.bandwidth = int(bandwidth * 1024)
+if max_connections:
+    GameRequestHandler.connection_slots = threading.BoundedSemaphore(max_connections)
+
 print(f"Starting Retrocorn server at http://localhost:{PORT}")
 print("Press Ctrl+C to stop the server")
 print()
 
+if latency or bandwidth or max_connections:
+    print(f"Emulating network: {latency:g} ms latency, "
+          f"{f'{bandwidth:g} KB/s' if bandwidth else 'unlimited bandwidth'}, "
+          f"{max_connections or 'unlimited'} connections at once")
+    print()
+
+if args.access_log:
+    access_log = JsonLinesLog(args.access_log, flush_records=200)
+    print(f"Logging requests to {args.access_log}")
+    print()
+
+if args.watch:
+    from watch import Watcher
+    events = EventHub()
+    threading.Thread(target=Watcher(publish_changes).run, daemon=True).start()
+    print("Watching for changes; open pages reload automatically")
+    print()
+
 # Open browser
 webbrowser.open(f'http://localhost:{PORT}')
 
-with socketserver.TCPServer(("", PORT), Handler) as httpd:
+# Stop cleanly on `kill` too, so buffered telemetry is flushed
+signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+with GameServer(("", PORT), Handler) as httpd:
     try:
         httpd.serve_forever()
     except KeyboardInterrupt:
         print("\nServer stopped.")
+    finally:
+        telemetry.flush()
+        if access_log:
+            access_log.flush()
+        leaderboard.close()
@@ -0,0 +1,198 @@
+"""
+Watch Mode
+Polls the generator and build scripts, sprite sources, js/ and css/ for
+changes and reruns only the steps a change affects. For the animation
+generators the check goes down to single entities: when only
+create_goblin_animations() was edited, only the goblin frames are redrawn.
+Every round of changes is reported to a callback, which run_game.py --watch
+uses to push live-reload events to the browser.
+
+Usage:
+    python watch.py              # rebuild on change
+    python run_game.py --watch   # same, plus live reload in the page
+"""
+
+import ast
+import fnmatch
+import glob
+import hashlib
+import os
+import subprocess
+import sys
+import time
+
+POLL_INTERVAL = 0.5
+
+# Sources whose edits can trigger a rebuild or a reload
+WATCH_PATTERNS = [
+    '*.py', 'index.html', 'js/*.js', 'css/*.css',
+    'assets/sprites/**/*.png', 'assets/player/**/*.png', 'assets/effects/*.png',
+    'build/sprites/bosses/**/*.png', 'Unicorn Assets/unicorn_strips/*.png',
+]
+# Files the build steps write; compared before and after each rebuild
+OUTPUT_PATTERNS = ['build/**/*', 'assets/player/**/*.png', 'assets/enemies/**/*.png', 'assets/bosses/**/*.png']
+
+# Generators with a module-level [(entity, create function)] list and a
+# command line that accepts entity names
+ENTITY_GENERATORS = {
+    'generate_enemy_animations.py': 'ENEMIES',
+    'generate_boss_animations.py': 'BOSSES',
+}
+# Modules every generator writes its frames through
+GENERATOR_SOURCES = ['profiling.py', 'frame_pipeline.py']
+
+# tool: other sources it reads (the tool script itself always counts)
+BUILD_RULES = {
+    'generate_sprites.py': GENERATOR_SOURCES,
+    'extract_unicorn.py': ['Unicorn Assets/unicorn_strips/*.png'] + GENERATOR_SOURCES,
+    # The older player generators write the same frames as extract_unicorn.py,
+    # so they only rerun when edited themselves
+    'generate_unicorn.py': [],
+    'generate_unicorn_v2.py': [],
+    'compile_levels.py': ['js/level-data.js', 'js/level.js', 'js/enemies.js', 'level_chunks.py', 'canvas2d.py'],
+    'render_sfx.py': [],
+    'bake_boss_sprites.py': ['canvas2d.py'],
+    'bake_projectiles.py': ['canvas2d.py'],
+    'bake_particles.py': ['js/particles.js', 'js/projectile.js', 'canvas2d.py'],
+    'bake_font.py': [],
+    'collision_masks.py': ['js/sprite.js', 'assets/sprites/**/*.png', 'assets/player/**/*.png',
+                           'build/sprites/bosses/**/*.png'],
+    'encode_animations.py': ['collision_masks.py', 'js/sprite.js', 'assets/sprites/**/*.png',
+                             'build/sprites/bosses/**/*.png'],
+}
+
+
+def scan(patterns):
+    """{path: mtime_ns} for every file matching the glob patterns."""
+    files = {}
+    for pattern in patterns:
+        for path in glob.glob(pattern, recursive=True):
+            try:
+                if os.path.isfile(path):
+                    files[path.replace(os.sep, '/')] = os.stat(path).st_mtime_ns
+            except OSError:
+                pass  # deleted between glob and stat
+    return files
+
+
+def changed_files(before, after):
+    return sorted(path for path in before.keys() | after.keys() if before.get(path) != after.get(path))
+
+# ============== ENTITY DIFFS ==============
+
+def function_hashes(path):
+    """{function name: hash of its AST} for the top-level functions of a script.
+
+    Hashing the AST rather than the text means comment and formatting edits
+    don't count as changes.
+    """
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    return {
+        node.name: hashlib.sha1(ast.dump(node).encode('utf-8')).hexdigest()
+        for node in tree.body if isinstance(node, ast.FunctionDef)
+    }
+
+
+def entity_table(path, variable):
+    """{create function name: entity name} from the generator's entity list."""
+    with open(path, encoding='utf-8') as f:
+        tree = ast.parse(f.read(), path)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(getattr(t, 'id', None) == variable for t in node.targets):
+            return {
+                item.elts[1].id: item.elts[0].value
+                for item in node.value.elts
+                if isinstance(item, ast.Tuple) and isinstance(item.elts[1], ast.Name)
+            }
+    return {}
+
+
+class Watcher:
+    def __init__(self, on_change=None, interval=POLL_INTERVAL):
+        self.on_change = on_change
+        self.interval = interval
+        self.sources = scan(WATCH_PATTERNS)
+        self.hashes = {}
+        for script in ENTITY_GENERATORS:
+            try:
+                self.hashes[script] = function_hashes(script)
+            except (OSError, SyntaxError):
+                self.hashes[script] = {}
+
+    def entity_command(self, script):
+        """Command regenerating the entities whose functions changed, or None."""
+        try:
+            hashes = function_hashes(script)
+            creators = entity_table(script, ENTITY_GENERATORS[script])
+        except SyntaxError as e:
+            print(f"  {script}: syntax error on line {e.lineno}, waiting for the next save")
+            return None
+        old = self.hashes.get(script, {})
+        self.hashes[script] = hashes
+        edited = {name for name in hashes.keys() | old.keys() if hashes.get(name) != old.get(name)}
+        if not edited:
+            return None
+        if edited <= creators.keys():
+            return [script] + sorted(creators[name] for name in edited)
+        return [script]  # a shared helper changed: regenerate everything
+
+    def plan(self, changed):
+        """Build commands (argument lists, script first) for a set of changed sources."""
+        commands = []
+        shared_changed = any(path in GENERATOR_SOURCES for path in changed)
+        for script in ENTITY_GENERATORS:
+            if shared_changed:
+                # Every entity is written through the changed module
+                if script in changed:
+                    self.entity_command(script)     # keep the function hashes current
+                commands.append([script])
+            elif script in changed:
+                command = self.entity_command(script)
+                if command:
+                    commands.append(command)
+        for tool, sources in BUILD_RULES.items():
+            if any(fnmatch.fnmatch(path, pattern) for path in changed for pattern in [tool] + sources):
+                commands.append([tool])
+        return commands
+
+    def poll(self):
+        """Check once; rebuild and report if anything changed. Returns the reported files."""
+        current = scan(WATCH_PATTERNS)
+        changed = changed_files(self.sources, current)
+        self.sources = current
+        if not changed:
+            return []
+
+        print(f"Changed: {', '.join(changed)}")
+        outputs_before = scan(OUTPUT_PATTERNS)
+        for command in self.plan(set(changed)):
+            started = time.perf_counter()
+            result = subprocess.run([sys.executable] + command, capture_output=True, text=True)
+            elapsed = time.perf_counter() - started
+            if result.returncode == 0:
+                print(f"  rebuilt: {' '.join(command)} ({elapsed:.1f}s)")
+            else:
+                print(f"  FAILED: {' '.join(command)}\n{result.stdout}{result.stderr}")
+
+        files = changed + changed_files(outputs_before, scan(OUTPUT_PATTERNS))
+        if self.on_change:
+            self.on_change(files)
+        return files
+
+    def run(self):
+        while True:
+            self.poll()
+            time.sleep(self.interval)
+
+
+def main():
+    print("Watching for changes (Ctrl+C to stop)...")
+    try:
+        Watcher().run()
+    except KeyboardInterrupt:
+        print("\nStopped watching.")
+
+
+if __name__ == '__main__':
+    main()